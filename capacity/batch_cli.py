@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Headless command line entry point for capacity runs on large footing tables.  Footing rows are read from a
+CSV or Parquet file in chunks, evaluated with bs_ultbearing_batch (optionally across worker processes) and
+appended to the output file chunk by chunk, so memory use depends on the chunk size only.
+
+Input columns use the names of bearing_batch.INPUT_COLUMNS; columns in INPUT_DEFAULTS may be omitted and any
+other columns (e.g. a footing ID) are copied to the output unchanged.
+
+Usage:
+    python batch_cli.py footings.csv results.csv --chunk-size 50000 --workers 4
+
+Parquet files need pyarrow.
+
+"""
+
+import argparse
+import collections
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from bearing_batch import bs_ultbearing_batch
+
+logger = logging.getLogger(__name__)
+
+RESULT_COLUMNS = ('capacity', 'capacity_d', 'capacity_ud', 'eff_width', 'eff_length')
+
+
+def _file_format(path, given=None):
+    if given:
+        return given
+    return "parquet" if os.path.splitext(path)[1].lower() in (".parquet", ".pq") else "csv"
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Reading or writing Parquet files requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def read_chunks(path, chunk_size, file_format=None):
+    """
+    Yield the rows of a CSV or Parquet file as panda dataframes of at most chunk_size rows.
+
+    Parameters:
+        path - input file path
+        chunk_size - number of rows per chunk
+        file_format - "csv" or "parquet", taken from the file extension when None
+    """
+    if _file_format(path, file_format) == "parquet":
+        pyarrow = _import_pyarrow()
+        for batch in pyarrow.parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+class ChunkWriter:
+    """
+    Append panda dataframes to a CSV or Parquet file.
+
+    Parameters:
+        path - output file path, overwritten if it exists
+        file_format - "csv" or "parquet", taken from the file extension when None
+    """
+
+    def __init__(self, path, file_format=None):
+        self.path = path
+        self.file_format = _file_format(path, file_format)
+        self.parquet_writer = None
+        self.rows = 0
+
+    def write(self, frame):
+        if self.file_format == "parquet":
+            pyarrow = _import_pyarrow()
+            table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+            if self.parquet_writer is None:
+                self.parquet_writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            self.parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.rows == 0 else "a", header=self.rows == 0, index=False)
+        self.rows += len(frame)
+
+    def close(self):
+        if self.parquet_writer is not None:
+            self.parquet_writer.close()
+
+
+def evaluate_chunk(frame, rounding=True):
+    """
+    Evaluate one chunk of footing rows and return it with the result columns appended.
+
+    Parameters:
+        frame - panda dataframe with one row per footing
+        rounding - passed to bs_ultbearing_batch
+    """
+    result = bs_ultbearing_batch(frame, rounding=rounding)
+    output = frame.copy()
+    for name in RESULT_COLUMNS:
+        output[name] = getattr(result, name)
+    return output
+
+
+def run(input_path, output_path, chunk_size=100000, workers=1, input_format=None, output_format=None,
+        rounding=True):
+    """
+    Stream footing rows from input_path to output_path through bs_ultbearing_batch.  With several workers
+    at most two chunks per worker are in flight and chunks are written in input order.
+
+    Parameters:
+        input_path, output_path - CSV or Parquet file paths
+        chunk_size - number of rows per chunk
+        workers - number of worker processes, 1 to evaluate in this process
+        input_format, output_format - "csv" or "parquet", taken from the file extension when None
+        rounding - passed to bs_ultbearing_batch
+
+    Returns:
+        summary - dict with the number of rows and chunks, elapsed seconds and rows per second
+    """
+    started = time.perf_counter()
+    writer = ChunkWriter(output_path, output_format)
+    chunks = read_chunks(input_path, chunk_size, input_format)
+    n_chunks = 0
+
+    def written(frame):
+        nonlocal n_chunks
+        writer.write(frame)
+        n_chunks += 1
+        logger.info("Chunk %d written, %d rows so far", n_chunks, writer.rows)
+
+    try:
+        if workers == 1:
+            for frame in chunks:
+                written(evaluate_chunk(frame, rounding))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                in_flight = collections.deque()
+                for frame in chunks:
+                    in_flight.append(executor.submit(evaluate_chunk, frame, rounding))
+                    if len(in_flight) >= 2 * workers:
+                        written(in_flight.popleft().result())
+                while in_flight:
+                    written(in_flight.popleft().result())
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    return {'rows': writer.rows, 'chunks': n_chunks, 'seconds': elapsed,
+            'rows_per_second': writer.rows / elapsed if elapsed > 0 else float('inf')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the ultimate bearing capacity of every footing row "
+                                                 "of a CSV or Parquet file.")
+    parser.add_argument("input", help="input CSV or Parquet file, one row per footing")
+    parser.add_argument("output", help="output CSV or Parquet file")
+    parser.add_argument("--chunk-size", type=int, default=100000, help="rows per chunk (default 100000)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default 1)")
+    parser.add_argument("--input-format", choices=["csv", "parquet"], help="override the input file extension")
+    parser.add_argument("--output-format", choices=["csv", "parquet"], help="override the output file extension")
+    parser.add_argument("--no-rounding", action="store_true",
+                        help="keep full precision instead of the staged rounding of bs_ultbearing")
+    parser.add_argument("--quiet", action="store_true", help="do not report progress per chunk")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+
+    summary = run(args.input, args.output, args.chunk_size, args.workers, args.input_format,
+                  args.output_format, not args.no_rounding)
+    print(f"{summary['rows']} footings in {summary['chunks']} chunks, {summary['seconds']:.2f} s "
+          f"({summary['rows_per_second']:.0f} footings/s) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Generate the calculation reports of many footings at once.  Every report (front page and content page) is
+rendered into in-memory buffers in a worker process, and the pages are merged in a single pass either into one
+bound pdf or into one pdf per footing.  No temporary files are written, so concurrent runs cannot overwrite
+each other.
+
+Footings are given as a data frame (or list of dicts) with the input columns of bearing_batch.INPUT_COLUMNS and
+the optional title columns project_name, project_no and structure_id.
+
+"""
+
+import io
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from PyPDF2 import PdfWriter
+
+from bearing_batch import INPUT_COLUMNS, INPUT_DEFAULTS
+from bearing_formula import bs_ultbearing_core, bearing_report
+from savepdf import add_first_pages, compile_content_page, prepare_frontpage, write_pdf
+
+TITLE_COLUMNS = ('project_name', 'project_no', 'structure_id')
+
+# Characters kept in the file names of the reports, the others become _
+_UNSAFE_CHARACTERS = re.compile(r'[^A-Za-z0-9_.-]')
+
+# Row labels of the input tables, as in the GUI
+DIMENSION_LABELS = ['Width, W (m)', 'Length, L (m)', 'Thickness, df (m)']
+SOIL_LABELS = ['Cohesion, c or su (kPa)', 'Friction Angle (deg)', 'Bulk Unit Weight (kN/m3)', 'Shear Modulus (kPa)']
+GEOMETRY_LABELS = ['Depth, Df (m)', 'Ground Slope (deg)', 'Tilt Angle (deg)', 'Water Depth, Dw (m)']
+LOAD_LABELS = ['Vertical Load, N (kN)', 'Horizontal load Hx (kN)', 'Horizontal Load Hy (kN)',
+               'Moment Mx (kNm)', 'Moment My (kNm)']
+
+
+def render_report(footing):
+    """
+    Calculate one footing and render its report pages into memory.
+
+    Parameters:
+        footing - dict of inputs keyed by the names in INPUT_COLUMNS and TITLE_COLUMNS
+
+    Returns:
+        frontpage, content_page - pdf files as bytes
+    """
+    f = dict(INPUT_DEFAULTS)
+    f.update(footing)
+    title_list = [f.get(name, "") for name in TITLE_COLUMNS]
+
+    result = bs_ultbearing_core(**{name: f[name] for name in INPUT_COLUMNS})
+    display1, display2, display3, display4, factor_table = \
+        bearing_report(result, f['cohesion'], f['friction'], f['width'], f['length'])
+    message = f"{display1}<br/><br/>{display2}<br/>{display3}<br/>{display4}"
+
+    content_page = io.BytesIO()
+    compile_content_page(pd.Series([f['width'], f['length'], f['thickness']], index=DIMENSION_LABELS),
+                         pd.Series([f['cohesion'], f['friction'], f['gamma'], f['shear_modulus']], index=SOIL_LABELS),
+                         pd.Series([f['depth'], f['slope'], f['tilt'], f['water_depth']], index=GEOMETRY_LABELS),
+                         pd.Series([f['vertical_load'], f['horizontal_load_W'], f['horizontal_load_L'],
+                                    f['moment_W'], f['moment_L']], index=LOAD_LABELS),
+                         factor_table, title_list, message, output=content_page)
+
+    frontpage = io.BytesIO()
+    prepare_frontpage(title_list, output_file=frontpage)
+    return frontpage.getvalue(), content_page.getvalue()
+
+
+def report_filename(structure_id):
+    """
+    Return the file name of the report of a footing, with every character other than letters, digits, _, - and .
+    replaced by _ so that the name stays within the output folder (no / or .. path parts).
+    """
+    name = _UNSAFE_CHARACTERS.sub("_", str(structure_id))
+    return f"bearing_report_{name}.pdf"
+
+
+def create_reports(footings, output, merged=True, workers=None, chunksize=4):
+    """
+    Render the reports of many footings in parallel and write them in one pass.
+
+    Parameters:
+        footings - panda dataframe or list of dicts, one footing per row
+        output - merged=True: pdf file path or writable binary stream of the bound report
+                 merged=False: folder receiving bearing_report_<structure_id>.pdf per footing (see
+                 report_filename)
+        merged - True for one bound pdf, False for one pdf per footing
+        workers - number of worker processes, None for os.cpu_count() and 1 to render in this process
+        chunksize - number of footings sent to a worker at a time
+
+    Returns:
+        paths - list of the files written (empty when output is a stream)
+
+    Raises:
+        ValueError - merged=False and two footings would be written to the same file
+    """
+    if isinstance(footings, pd.DataFrame):
+        footings = footings.to_dict('records')
+    footings = [dict(footing) for footing in footings]
+    for i, footing in enumerate(footings):
+        footing.setdefault('structure_id', str(i + 1))
+    if not merged:
+        # checked before any rendering, so that no report overwrites another one; names are compared
+        # without case for case-insensitive file systems
+        filenames = [report_filename(footing['structure_id']) for footing in footings]
+        seen, duplicates = set(), []
+        for filename in filenames:
+            if filename.lower() in seen:
+                duplicates.append(filename)
+            seen.add(filename.lower())
+        if duplicates:
+            raise ValueError(f"Footings with the same report file name (structure_id): {sorted(set(duplicates))}")
+
+    if workers == 1:
+        rendered = map(render_report, footings)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        rendered = executor.map(render_report, footings, chunksize=chunksize)
+
+    paths = []
+    try:
+        if merged:
+            writer = PdfWriter()
+            for frontpage, content_page in rendered:
+                add_first_pages(writer, frontpage, content_page)
+            write_pdf(writer, output)
+            if isinstance(output, str):
+                paths.append(output)
+        else:
+            os.makedirs(output, exist_ok=True)
+            for filename, (frontpage, content_page) in zip(filenames, rendered):
+                writer = PdfWriter()
+                add_first_pages(writer, frontpage, content_page)
+                path = os.path.join(output, filename)
+                write_pdf(writer, path)
+                paths.append(path)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return paths
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Vectorized counterparts of the functions in bearing_formula.  Every input is a 1-D array with one entry per
+footing (or footing / load case combination) and every factor function returns an n x 6 np array whose columns
+follow the same order as the scalar path: Nc_d, Ngamma_d, Nq_d, Nc_ud, Ngamma_ud, Nq_ud.
+
+The intermediate rounding of the scalar functions is reproduced so that the batch results match bs_ultbearing.
+Every function takes a rounding option; rounding=False keeps full precision at every stage.
+
+With rounding=False the inputs may also be dual.Dual arrays, which carry their derivatives through every
+factor (see bearing_gradient).
+
+"""
+
+import collections
+import functools
+import operator
+
+import numpy as np
+
+from bearing_formula import FACTOR_ROWS, FACTOR_COLUMNS
+from dual import Dual
+
+# Column names accepted by bs_ultbearing_batch, in the order of the five series of bs_ultbearing.
+INPUT_COLUMNS = ('width', 'length', 'thickness',
+                 'cohesion', 'friction', 'gamma', 'shear_modulus',
+                 'depth', 'slope', 'tilt', 'water_depth',
+                 'vertical_load', 'horizontal_load_W', 'horizontal_load_L', 'moment_W', 'moment_L',
+                 'surcharge', 'drainage', 'roughness')
+
+# Inputs which may be omitted, with the value used when they are.
+INPUT_DEFAULTS = {'thickness': 0.0, 'shear_modulus': 12000.0, 'slope': 0.0, 'tilt': 0.0,
+                  'horizontal_load_W': 0.0, 'horizontal_load_L': 0.0, 'moment_W': 0.0, 'moment_L': 0.0,
+                  'surcharge': 0.0, 'drainage': "Drained analysis", 'roughness': "Rough"}
+
+BatchResult = collections.namedtuple('BatchResult',
+                                     ['capacity', 'capacity_d', 'capacity_ud', 'eff_width', 'eff_length',
+                                      'factors', 'drained'])
+BatchResult.__doc__ = """
+    Numeric results of bs_ultbearing_batch.
+
+    Fields:
+        capacity - n np array of the ultimate bearing capacity for the selected drainage condition in kPa
+        capacity_d - n np array of the drained ultimate bearing capacity in kPa
+        capacity_ud - n np array of the undrained ultimate bearing capacity in kPa
+        eff_width, eff_length - n np arrays of the effective dimensions in m
+        factors - n x 7 x 6 np array, rows as FACTOR_ROWS and columns as FACTOR_COLUMNS (values only for Dual inputs)
+        drained - n boolean np array, True where the drained analysis is selected
+    """
+
+
+def _as_float(values):
+    if isinstance(values, Dual):
+        return np.atleast_1d(values)
+    return np.atleast_1d(np.asarray(values, dtype=float))
+
+
+def _values(values):
+    # the values of a Dual, without their derivatives
+    return values.value if isinstance(values, Dual) else values
+
+
+def _round(values, decimals, rounding):
+    return np.round(values, decimals) if rounding else values
+
+
+def _round_builtin(values, decimals, rounding):
+    # inclination_f rounds with the built-in round, which rounds the exact binary value and can differ from
+    # np.round when the scaled value lands on a tie (e.g. 0.025).  Those few values are redone with round.
+    if not rounding:
+        return values
+    scaled = values * 10.0 ** decimals
+    rounded = np.round(values, decimals)
+    tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if tie.any():
+        rounded = np.array(rounded, dtype=float)
+        rounded[tie] = [round(float(value), decimals) for value in values[tie]]
+    return rounded
+
+
+def _nonzero_friction(friction, offset):
+    # when friction = 0, drained parameters are not relevant.
+    # a small offset is introduced to avoid division by zero error
+    return np.where(friction == 0, friction + offset, friction)
+
+
+# Define bearing capacity factors and compute Nc, Ngamma and Nq
+def bearing_f_batch(friction, base_roughness="Rough", slope=0, rounding=True):
+    """
+    Compute Nc, Ngamma and Nq for an array of friction angles.
+
+    Parameters:
+        friction - np array of friction angles in degree
+        base_roughness - string or np array of strings, either Rough or Smooth
+        slope - float value or np array in degree
+        rounding - True to round the factors to 2 decimals as bearing_f does
+
+    Returns:
+        bearing_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    friction = _nonzero_friction(_as_float(friction), 0.00001)
+    fric_ra = np.radians(friction)
+    slope_ra = np.broadcast_to(np.radians(_as_float(slope)), friction.shape)
+    rough = np.broadcast_to(np.asarray(base_roughness) == "Rough", friction.shape)
+
+    Nq = np.exp(np.pi * np.tan(fric_ra)) * np.tan(np.radians(45 + friction / 2)) ** 2
+    Nc_d = (Nq - 1) / np.tan(fric_ra)
+    Nc_ud = np.full(friction.shape, 5.14)
+
+    Ngamma_d = np.where(rough, 0.1054 * np.exp(9.6 * fric_ra), 0.0663 * np.exp(9.3 * fric_ra))
+
+    # For the sloping ground case where phi = 0, a non-zero value of the term N_gamma must be used.
+    Ngamma_ud = np.where(slope_ra == 0, 0.0, -2 * np.sin(slope_ra))
+
+    bearing_factors = np.stack([Nc_d, Ngamma_d, Nq, Nc_ud, Ngamma_ud, Nq], axis=1)
+    return _round(bearing_factors, 2, rounding)
+
+
+# Define rigidity factors
+def rigidity_f_batch(cohesion, friction, width, length, depth, gamma, surcharge, shear_modulus=12000,
+                     bearing_factors=None, rounding=True):
+    """
+    Compute rigidity factors for arrays of footings.
+
+    Parameters:
+        cohesion - np array in kPa
+        friction - np array in degree
+        width, length, depth - np arrays in m
+        gamma - np array in kN/m3
+        surcharge - np array in kPa
+        shear_modulus - np array in kPa (default value is set to 12,000 kPa)
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        rigidity_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d = bearing_factors[:, 0]
+    fric_ra = np.radians(_as_float(friction))
+    width, length = _as_float(width), _as_float(length)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        q_equi = surcharge + (depth + width / 2) * gamma
+        I_r = shear_modulus / (cohesion + q_equi * np.tan(fric_ra))
+        I_rc = 0.5 * np.exp((0.33 - 0.45 * width / length) / np.tan(np.pi / 2 - fric_ra / 2))
+        rigid = I_r < I_rc
+
+        rigid_f_q = np.exp((-4.4 + 0.6 * width / length) * np.tan(fric_ra) +
+                           3.07 * np.sin(fric_ra) * np.log10(2 * I_r) / (1 + np.sin(fric_ra)))
+        rigid_f_c_d = rigid_f_q - (1 - rigid_f_q) / Nc_d / np.tan(fric_ra)
+        rigid_f_c_ud = 0.32 + 0.12 * width / length + 0.6 * np.log10(I_r)
+
+    rigid_f_q = np.where(rigid, rigid_f_q, 1.0)
+    rigid_f_c_d = np.where(rigid, rigid_f_c_d, 1.0)
+    rigid_f_c_ud = np.where(rigid, rigid_f_c_ud, 1.0)
+
+    rigidity_factors = np.stack([rigid_f_c_d, rigid_f_q, rigid_f_q, rigid_f_c_ud, rigid_f_q, rigid_f_q], axis=1)
+    return _round(rigidity_factors, 3, rounding)
+
+
+# Define shape factors
+def shape_f_batch(friction, width, length, bearing_factors=None, rounding=True):
+    """
+    Compute shape factors for arrays of footings.
+
+    Parameters:
+        friction - np array in degree
+        width - np array in m
+        length - np array in m
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        shape_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d, Nq = bearing_factors[:, 0], bearing_factors[:, 2]
+    fric_ra = np.radians(_as_float(friction))
+    ratio = _as_float(width) / _as_float(length)
+
+    shape_f_c = 1 + ratio * (Nq / Nc_d)
+    shape_f_gamma = 1 - 0.4 * ratio
+    shape_f_q = 1 + ratio * np.tan(fric_ra)
+
+    shape_factors = np.stack([shape_f_c, shape_f_gamma, shape_f_q, shape_f_c, shape_f_gamma, shape_f_q], axis=1)
+    return _round(shape_factors, 2, rounding)
+
+
+# Define effective dimensions
+def effective_dimensions_batch(vertical_load, moment_W, moment_L, width, length, rounding=True):
+    """
+    Compute the effective width and length from the load eccentricities.
+
+    Parameters:
+        vertical_load - np array in kN
+        moment_W, moment_L - np arrays in kNm
+        width, length - np arrays in m
+        rounding - True to round the eccentricities and dimensions to 2 decimals as inclination_f does
+
+    Returns:
+        eff_width, eff_length - n np arrays in m
+    """
+    # 0.001 is introduced to avoid division by zero error
+    vertical_load = _as_float(vertical_load)
+    vertical_load = np.where(vertical_load == 0, vertical_load + 0.001, vertical_load)
+
+    ecc_w = _round_builtin(_as_float(moment_W / vertical_load), 2, rounding)
+    ecc_l = _round_builtin(_as_float(moment_L / vertical_load), 2, rounding)
+    eff_width = _round_builtin(_as_float(width - 2 * ecc_w), 2, rounding)
+    eff_length = _round_builtin(_as_float(length - 2 * ecc_l), 2, rounding)
+    return eff_width, eff_length
+
+
+# Define inclination factors
+def inclination_f_batch(vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L,
+                        cohesion, friction, width, length, bearing_factors=None, rounding=True):
+    """
+    Compute inclination factors for arrays of footings.
+
+    Parameters:
+        vertical_load - np array in kN
+        horizontal_load_W - np array in kN which is the load in width direction
+        horizontal_load_L - np array in kN which is the load in length direction
+        moment_W - np array in kNm which is the moment about the axis in length direction
+        moment_L - np array in kNm which is the moment about the axis in width direction
+        cohesion - np array in kPa
+        friction - np array in degree
+        width - np array in m
+        length - np array in m
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        inclination_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+        eff_dimensions - tuple of the effective width and effective length np arrays
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d, Nc_ud = bearing_factors[:, 0], bearing_factors[:, 3]
+
+    friction = _nonzero_friction(_as_float(friction), 0.001)
+    cohesion = _as_float(cohesion)
+    width, length = _as_float(width), _as_float(length)
+    horizontal_load_W, horizontal_load_L = _as_float(horizontal_load_W), _as_float(horizontal_load_L)
+    vertical_load = _as_float(vertical_load)
+    vertical_load = np.where(vertical_load == 0, vertical_load + 0.001, vertical_load)
+
+    fric_ra = np.radians(friction)
+    H_load = np.sqrt(horizontal_load_L ** 2 + horizontal_load_W ** 2)
+
+    eff_width, eff_length = effective_dimensions_batch(vertical_load, moment_W, moment_L, width, length, rounding)
+    eff_area = eff_width * eff_length
+
+    # define nB and nL, note that width and length should be used instead of effective width and effective length
+    with np.errstate(divide='ignore', invalid='ignore'):
+        theta = np.where(horizontal_load_L == 0, np.pi / 2, np.arctan(horizontal_load_W / horizontal_load_L))
+
+        n_W = (2 + width / length) / (1 + width / length)
+        n_L = (2 + length / width) / (1 + length / width)
+        n_theta = n_L * np.cos(theta) ** 2 + n_W * np.sin(theta) ** 2
+
+        # define inclination factors
+        base = 1 - H_load / (vertical_load + eff_area * cohesion / np.tan(fric_ra))
+        incl_f_q = base ** n_theta
+        incl_f_gamma = base ** (n_theta + 1)
+        incl_f_c_d = incl_f_q - (1 - incl_f_q) / Nc_d / np.tan(fric_ra)
+
+        # when cohesion = 0, undrained analysis is not relevant.  9999 is introduced to avoid division by zero error.
+        incl_f_c_ud = np.where(cohesion == 0, 9999.0, 1 - n_theta * H_load / cohesion / Nc_ud / eff_area)
+
+    inclination_factors = np.stack([incl_f_c_d, incl_f_gamma, incl_f_q, incl_f_c_ud, incl_f_gamma, incl_f_q],
+                                   axis=1)
+    return _round(inclination_factors, 3, rounding), (eff_width, eff_length)
+
+
+# Define foundation tilt factors
+def foundation_tilt_f_batch(friction, tilt=0, bearing_factors=None, rounding=True):
+    """
+    Compute foundation tilt factors for arrays of footings.
+
+    Parameters:
+        friction - np array in degree
+        tilt - np array in degree which is the tilting angle between the base slab and the horizontal
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        foundation_tilt_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d = bearing_factors[:, 0]
+
+    fric_ra = np.radians(_nonzero_friction(_as_float(friction), 0.001))
+    tilt_ra = np.broadcast_to(np.radians(_as_float(tilt)), fric_ra.shape)
+
+    tilt_f_q = (1 - tilt_ra * np.tan(fric_ra)) ** 2
+    tilt_f_c_d = tilt_f_q - (1 - tilt_f_q) / Nc_d / np.tan(fric_ra)
+    tilt_f_c_ud = 1 - (2 * tilt_ra / 5.14)
+
+    foundation_tilt_factors = np.stack([tilt_f_c_d, tilt_f_q, tilt_f_q, tilt_f_c_ud, tilt_f_q, tilt_f_q], axis=1)
+    return _round(foundation_tilt_factors, 2, rounding)
+
+
+# Define surface inclination factors
+def surface_slope_f_batch(friction, slope=0, bearing_factors=None, rounding=True):
+    """
+    Compute sloping ground factors for arrays of footings.
+
+    Parameters:
+        friction - np array in degree
+        slope - np array in degree which is the sloping angle of the ground surface
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        surface_slope_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d = bearing_factors[:, 0]
+
+    fric_ra = np.radians(_nonzero_friction(_as_float(friction), 0.001))
+    slope_ra = np.broadcast_to(np.radians(_as_float(slope)), fric_ra.shape)
+
+    slope_f_q_d = (1 - np.tan(slope_ra)) ** 2
+    slope_f_c_d = slope_f_q_d - (1 - slope_f_q_d) / Nc_d / np.tan(fric_ra)
+    slope_f_c_ud = 1 - (2 * slope_ra / 5.14)
+    ones = np.ones(fric_ra.shape)
+
+    surface_slope_factors = np.stack([slope_f_c_d, slope_f_q_d, slope_f_q_d, slope_f_c_ud, ones, ones], axis=1)
+    return _round(surface_slope_factors, 2, rounding)
+
+
+# Define depth factors
+def depth_f_batch(friction, width, depth, bearing_factors=None, rounding=True):
+    """
+    Compute depth factors for arrays of footings.
+
+    Parameters:
+        friction - np array in degree
+        width - np array in m
+        depth - np array in m
+        bearing_factors - optional n x 6 output of bearing_f_batch to avoid computing it again
+        rounding - True to round the factors as the scalar function does
+
+    Returns:
+        depth_factors - n x 6 np array containing 3 drained parameters and 3 undrained parameters
+    """
+    if bearing_factors is None:
+        bearing_factors = bearing_f_batch(friction, rounding=rounding)
+    Nc_d = bearing_factors[:, 0]
+
+    fric_ra = np.radians(_nonzero_friction(_as_float(friction), 0.001))
+    depth_ratio = np.arctan(_as_float(depth) / _as_float(width))
+
+    depth_f_q = 1 + 2 * np.tan(fric_ra) * (1 - np.sin(fric_ra)) ** 2 * depth_ratio
+    depth_f_c_d = depth_f_q - (1 - depth_f_q) / Nc_d / np.tan(fric_ra)
+    depth_f_c_ud = 1 + 0.33 * depth_ratio
+    ones = np.ones(fric_ra.shape)
+
+    depth_factors = np.stack([depth_f_c_d, ones, depth_f_q, depth_f_c_ud, ones, depth_f_q], axis=1)
+    return _round(depth_factors, 2, rounding)
+
+
+# Define effective unit weight
+def eff_gamma_batch(friction, width, gamma, water_depth):
+    """
+    Compute the effective unit weight within the failure wedge for a water table at water_depth.
+
+    Parameters:
+        friction - np array in degree
+        width - np array in m
+        gamma - np array in kN/m3
+        water_depth - np array in m below the founding level
+
+    Returns:
+        eff_gamma - n np array in kN/m3
+    """
+    fric_ra = np.radians(_as_float(friction))
+    gamma, water_depth = _as_float(gamma), _as_float(water_depth)
+    wedge_depth = 0.5 * _as_float(width) * np.tan(np.pi / 4 + fric_ra / 2)
+
+    submerged = (2 * wedge_depth - water_depth) * water_depth * gamma / wedge_depth ** 2 + \
+                (gamma - 9.81) * (wedge_depth - water_depth) ** 2 / wedge_depth ** 2
+    return np.where(water_depth >= wedge_depth, gamma, submerged)
+
+
+def _input_columns(frame, columns):
+    # collect the inputs from a data frame (or any mapping of columns) and keyword arrays
+    values = dict(INPUT_DEFAULTS)
+    if frame is not None:
+        values.update({name: frame[name] for name in INPUT_COLUMNS if name in frame})
+    values.update(columns)
+
+    unknown = set(values) - set(INPUT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown input columns: {sorted(unknown)}")
+    missing = [name for name in INPUT_COLUMNS if name not in values]
+    if missing:
+        raise ValueError(f"Missing input columns: {missing}")
+
+    arrays = {name: np.atleast_1d(values[name] if isinstance(values[name], Dual) else np.asarray(values[name]))
+              for name in INPUT_COLUMNS}
+    size = np.broadcast_shapes(*(array.shape for array in arrays.values()))
+    return {name: (np.broadcast_to(array, size) if name in ('drainage', 'roughness')
+                   else np.broadcast_to(array.astype(float), size))
+            for name, array in arrays.items()}
+
+
+# Define general bearing capacity equation for arrays of footings
+def bs_ultbearing_batch(frame=None, rounding=True, **columns):
+    """
+    Compute ultimate bearing capacity for many footings at once.  Inputs are given either as a data frame
+    with one row per footing, as keyword arrays, or both (keywords override the data frame columns).
+    Column names are listed in INPUT_COLUMNS; those in INPUT_DEFAULTS may be omitted and scalars are
+    broadcast against the arrays.  Footings for which bs_ultbearing raises a division by zero error
+    (e.g. zero cohesion together with zero friction) return nan or inf instead.
+
+    Parameters:
+        frame - optional panda dataframe (or dict of arrays) with one row per footing
+        rounding - True to round at the same stages as bs_ultbearing, False to keep full precision
+        columns - np arrays or scalar values keyed by the names in INPUT_COLUMNS
+
+    Returns:
+        BatchResult - named tuple of np arrays with the capacities, effective dimensions and n x 7 x 6 factors
+    """
+    inputs = _input_columns(frame, columns)
+    width, length = inputs['width'], inputs['length']
+    cohesion, friction, gamma = inputs['cohesion'], inputs['friction'], inputs['gamma']
+    depth, slope, tilt = inputs['depth'], inputs['slope'], inputs['tilt']
+    vertical_load = inputs['vertical_load']
+
+    eff_gamma = eff_gamma_batch(friction, width, gamma, inputs['water_depth'])
+    q = inputs['surcharge'] + depth * gamma
+
+    bearing_factors = bearing_f_batch(friction, inputs['roughness'], slope, rounding)
+    rigidity_factors = rigidity_f_batch(cohesion, friction, width, length, depth, gamma, inputs['surcharge'],
+                                        inputs['shear_modulus'], bearing_factors, rounding)
+    shape_factors = shape_f_batch(friction, width, length, bearing_factors, rounding)
+    inclination_factors, (eff_width, eff_length) = inclination_f_batch(
+        vertical_load, inputs['horizontal_load_W'], inputs['horizontal_load_L'], inputs['moment_W'],
+        inputs['moment_L'], cohesion, friction, width, length, bearing_factors, rounding)
+    foundation_factors = foundation_tilt_f_batch(friction, tilt, bearing_factors, rounding)
+    surface_factors = surface_slope_f_batch(friction, slope, bearing_factors, rounding)
+    depth_factors = depth_f_batch(friction, width, depth, bearing_factors, rounding)
+
+    rows = (bearing_factors, rigidity_factors, shape_factors, inclination_factors, foundation_factors,
+            surface_factors, depth_factors)
+    factors = np.stack([_values(row) for row in rows], axis=1)
+
+    # Product of the factors of every term, in row order as factors.prod(axis=1), and summation of all terms
+    products = functools.reduce(operator.mul, rows)
+    ult_cap_d = cohesion * products[:, 0] + 0.5 * eff_gamma * eff_width * products[:, 1] + q * products[:, 2]
+    ult_cap_ud = cohesion * products[:, 3] + 0.5 * eff_gamma * eff_width * products[:, 4] + q * products[:, 5]
+
+    drained = inputs['drainage'] == "Drained analysis"
+    capacity = _round(np.where(drained, ult_cap_d, ult_cap_ud), 2, rounding)
+
+    return BatchResult(capacity, ult_cap_d, ult_cap_ud, eff_width, eff_length, factors, drained)
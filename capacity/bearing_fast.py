@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Scalar fast path of the general bearing capacity equation.  The same quantities as bs_ultbearing_core are
+computed with plain floats and the math module only: no intermediate np arrays, np.round calls or panda
+objects are created, and the factor matrix is written into a single (optionally caller supplied) buffer.
+
+The scalar functions in bearing_formula round every factor row (2 or 3 decimals) and the eccentricities.
+Here this is an explicit option: rounding=True reproduces those stages so that the result equals
+bs_ultbearing_core, rounding=False keeps full precision and leaves rounding to the output formatting.
+
+"""
+
+import math
+import numpy as np
+from bearing_formula import BearingResult, INCLINATION_ERROR
+
+
+def _round(value, decimals, rounding):
+    # same result as np.round, i.e. scale, round half to even and scale back
+    if not rounding:
+        return value
+    scale = 10.0 ** decimals
+    return round(value * scale) / scale
+
+
+# Define general bearing capacity equation with plain floats
+def bs_ultbearing_fast(width, length, cohesion, friction, gamma, depth, water_depth, vertical_load,
+                       horizontal_load_W=0, horizontal_load_L=0, moment_W=0, moment_L=0, shear_modulus=12000,
+                       slope=0, tilt=0, surcharge=0, drainage="Drained analysis", roughness="Rough", thickness=0,
+                       rounding=True, out=None):
+    """
+        Compute ultimate bearing capacity with plain float arithmetic.  The parameters are the same as
+        bs_ultbearing_core.  Degenerate inputs for which bs_ultbearing_core returns inf or nan factors
+        (e.g. zero friction with a low rigidity index) raise ZeroDivisionError here.  A horizontal load above
+        V + A' c / tan(phi) raises ValueError, as in bs_ultbearing_core.
+
+        Parameters:
+            width ... thickness - as bs_ultbearing_core
+            rounding - True to round the factors at the same stages as bs_ultbearing_core,
+                       False to keep full precision
+            out - optional 7 x 6 float np array which receives the factor matrix
+
+        Returns:
+            BearingResult - named tuple of the capacities, effective dimensions and 7 x 6 factor matrix
+        """
+    tan, sin = math.tan, math.sin
+
+    # Bearing factors (rounded to 2 decimals)
+    # when friction = 0, drained parameters are not relevant.
+    # 0.00001 is introduced to avoid division by zero error
+    fric_b = friction + 0.00001 if friction == 0 else friction
+    fric_b_ra = math.radians(fric_b)
+    Nq = math.exp(math.pi * tan(fric_b_ra)) * tan(math.radians(45 + fric_b / 2)) ** 2
+    Nc_d = _round((Nq - 1) / tan(fric_b_ra), 2, rounding)
+    Nq = _round(Nq, 2, rounding)
+    Nc_ud = 5.14
+    if roughness == "Rough":
+        Ngamma_d = 0.1054 * math.exp(9.6 * fric_b_ra)
+    else:
+        Ngamma_d = 0.0663 * math.exp(9.3 * fric_b_ra)
+    Ngamma_d = _round(Ngamma_d, 2, rounding)
+    slope_ra = math.radians(slope)
+    Ngamma_ud = _round(-2 * sin(slope_ra), 2, rounding) if slope_ra != 0 else 0.0
+    bearing_row = (Nc_d, Ngamma_d, Nq, Nc_ud, Ngamma_ud, Nq)
+
+    # The remaining factor functions use friction + 0.001 when friction = 0, except the rigidity factors
+    fric_ra = math.radians(friction)
+    fric_nz_ra = math.radians(friction + 0.001) if friction == 0 else fric_ra
+    tan_nz = tan(fric_nz_ra)
+    ratio = width / length
+
+    # Rigidity factors (rounded to 3 decimals)
+    q_equi = surcharge + (depth + width / 2) * gamma
+    I_r = shear_modulus / (cohesion + q_equi * tan(fric_ra))
+    I_rc = 0.5 * math.exp((0.33 - 0.45 * width / length) / tan(math.pi / 2 - fric_ra / 2))
+    if I_r < I_rc:
+        rigid_f_q = math.exp((-4.4 + 0.6 * width / length) * tan(fric_ra) +
+                             3.07 * sin(fric_ra) * math.log10(2 * I_r) / (1 + sin(fric_ra)))
+        rigid_f_c_d = _round(rigid_f_q - (1 - rigid_f_q) / Nc_d / tan(fric_ra), 3, rounding)
+        rigid_f_c_ud = _round(0.32 + 0.12 * width / length + 0.6 * math.log10(I_r), 3, rounding)
+        rigid_f_q = _round(rigid_f_q, 3, rounding)
+    else:
+        rigid_f_q = rigid_f_c_d = rigid_f_c_ud = 1.0
+    rigidity_row = (rigid_f_c_d, rigid_f_q, rigid_f_q, rigid_f_c_ud, rigid_f_q, rigid_f_q)
+
+    # Shape factors (rounded to 2 decimals)
+    shape_f_c = _round(1 + ratio * (Nq / Nc_d), 2, rounding)
+    shape_f_gamma = _round(1 - 0.4 * ratio, 2, rounding)
+    shape_f_q = _round(1 + ratio * tan(fric_ra), 2, rounding)
+    shape_row = (shape_f_c, shape_f_gamma, shape_f_q, shape_f_c, shape_f_gamma, shape_f_q)
+
+    # Inclination factors (rounded to 3 decimals) and effective dimensions (rounded to 2 decimals)
+    # 0.001 is introduced to avoid division by zero error
+    if vertical_load == 0:
+        vertical_load += 0.001
+    H_load = math.sqrt(horizontal_load_L ** 2 + horizontal_load_W ** 2)
+    if rounding:
+        eff_width = round(width - 2 * round(moment_W / vertical_load, 2), 2)
+        eff_length = round(length - 2 * round(moment_L / vertical_load, 2), 2)
+    else:
+        eff_width = width - 2 * moment_W / vertical_load
+        eff_length = length - 2 * moment_L / vertical_load
+    eff_area = eff_width * eff_length
+
+    theta = math.pi / 2 if horizontal_load_L == 0 else math.atan(horizontal_load_W / horizontal_load_L)
+    n_W = (2 + ratio) / (1 + ratio)
+    n_L = (2 + length / width) / (1 + length / width)
+    n_theta = n_L * math.cos(theta) ** 2 + n_W * sin(theta) ** 2
+
+    incl_base = 1 - H_load / (vertical_load + eff_area * cohesion / tan_nz)
+    if incl_base < 0:
+        raise ValueError(INCLINATION_ERROR)
+    incl_f_q = incl_base ** n_theta
+    incl_f_gamma = _round(incl_base ** (n_theta + 1), 3, rounding)
+    incl_f_c_d = _round(incl_f_q - (1 - incl_f_q) / Nc_d / tan_nz, 3, rounding)
+    incl_f_q = _round(incl_f_q, 3, rounding)
+    # when cohesion = 0, undrained analysis is not relevant.  9999 is introduced to avoid division by zero error.
+    if cohesion == 0:
+        incl_f_c_ud = 9999.0
+    else:
+        incl_f_c_ud = _round(1 - n_theta * H_load / cohesion / Nc_ud / eff_area, 3, rounding)
+    inclination_row = (incl_f_c_d, incl_f_gamma, incl_f_q, incl_f_c_ud, incl_f_gamma, incl_f_q)
+
+    # Foundation tilt factors (rounded to 2 decimals)
+    tilt_ra = math.radians(tilt)
+    tilt_f_q = (1 - tilt_ra * tan_nz) ** 2
+    tilt_f_c_d = _round(tilt_f_q - (1 - tilt_f_q) / Nc_d / tan_nz, 2, rounding)
+    tilt_f_c_ud = _round(1 - (2 * tilt_ra / 5.14), 2, rounding)
+    tilt_f_q = _round(tilt_f_q, 2, rounding)
+    tilt_row = (tilt_f_c_d, tilt_f_q, tilt_f_q, tilt_f_c_ud, tilt_f_q, tilt_f_q)
+
+    # Surface slope factors (rounded to 2 decimals)
+    slope_f_q = (1 - tan(slope_ra)) ** 2
+    slope_f_c_d = _round(slope_f_q - (1 - slope_f_q) / Nc_d / tan_nz, 2, rounding)
+    slope_f_c_ud = _round(1 - (2 * slope_ra / 5.14), 2, rounding)
+    slope_f_q = _round(slope_f_q, 2, rounding)
+    slope_row = (slope_f_c_d, slope_f_q, slope_f_q, slope_f_c_ud, 1.0, 1.0)
+
+    # Depth factors (rounded to 2 decimals)
+    depth_ratio = math.atan(depth / width)
+    depth_f_q = 1 + 2 * tan_nz * (1 - sin(fric_nz_ra)) ** 2 * depth_ratio
+    depth_f_c_d = _round(depth_f_q - (1 - depth_f_q) / Nc_d / tan_nz, 2, rounding)
+    depth_f_c_ud = _round(1 + 0.33 * depth_ratio, 2, rounding)
+    depth_f_q = _round(depth_f_q, 2, rounding)
+    depth_row = (depth_f_c_d, 1.0, depth_f_q, depth_f_c_ud, 1.0, depth_f_q)
+
+    # Effective unit weight within the failure wedge
+    wedge_depth = 0.5 * width * tan(math.pi / 4 + fric_ra / 2)
+    if water_depth >= wedge_depth:
+        eff_gamma = gamma
+    else:
+        eff_gamma = (2 * wedge_depth - water_depth) * water_depth * gamma / wedge_depth ** 2 + \
+                    (gamma - 9.81) * (wedge_depth - water_depth) ** 2 / wedge_depth ** 2
+    q = surcharge + depth * gamma
+
+    # Product of the factors of every term, in the same order as the factor rows
+    c_d = gamma_d = q_d = c_ud = gamma_ud = q_ud = 1.0
+    rows = (bearing_row, rigidity_row, shape_row, inclination_row, tilt_row, slope_row, depth_row)
+    for row in rows:
+        c_d *= row[0]
+        gamma_d *= row[1]
+        q_d *= row[2]
+        c_ud *= row[3]
+        gamma_ud *= row[4]
+        q_ud *= row[5]
+
+    ult_cap_d = cohesion * c_d + 0.5 * eff_gamma * eff_width * gamma_d + q * q_d
+    ult_cap_ud = cohesion * c_ud + 0.5 * eff_gamma * eff_width * gamma_ud + q * q_ud
+
+    factors = np.empty((7, 6)) if out is None else out
+    factors[:] = rows
+
+    drained = drainage == "Drained analysis"
+    ult_cap = ult_cap_d if drained else ult_cap_ud
+
+    return BearingResult(_round(ult_cap, 2, rounding), ult_cap_d, ult_cap_ud, eff_width, eff_length, factors, drained)
@@ -14,19 +14,40 @@ depth, sloping ground and tilting base.
 The returned parameters are primarily in form of np list or panda data frame that facilitate further
 computing efficiently.
 
+Only NumPy is imported with this module; pandas is loaded when a data frame is first formatted
+by bearing_report, so that worker processes doing calculations start quickly.
+
+The factor functions and the assembly steps are profiling stages: profiling.enable() times them and counts
+their calls, at no cost while profiling is disabled.
+
 """
 
 # sloping ground effect has not been completed yet
 # rigidity factors have not been included yet
 
+import collections
+import functools
 import math
 import numpy as np
-import pandas as pd
+
+import profiling
+
+# Number of (friction, roughness, slope) combinations kept by the bearing factor cache.
+BEARING_CACHE_SIZE = 1024
+
+# Raised by both scalar paths when the horizontal load is too large for the inclination factors to be defined
+INCLINATION_ERROR = "The horizontal load exceeds V + A' c / tan(phi), the inclination factors are undefined"
+
+# Version of the formulas, part of the key of stored results (see result_cache).  Change it whenever a change
+# to this module or to bearing_batch alters any result, so that results stored before are not reused.
+FORMULA_VERSION = "2026.10.1"
 
 # Define bearing capacity factors and compute Nc, Ngamma and Nq
+@profiling.stage
 def bearing_f(friction, base_roughness = "Rough", slope=0):
     """
     Compute Nc, Ngamma and Nq based on 2 inputs: friction angle phi and base roughness.
+    Results are memoized in a bounded LRU cache, see bearing_f_cache_info.
 
     Parameters:
         friction - float value in degree.
@@ -35,6 +56,11 @@ def bearing_f(friction, base_roughness = "Rough", slope=0):
     Returns:
         bearing_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
     """
+    return np.array(_bearing_f_cached(float(friction), base_roughness, float(slope)))
+
+
+@functools.lru_cache(maxsize=BEARING_CACHE_SIZE)
+def _bearing_f_cached(friction, base_roughness, slope):
     # when friction = 0, drained parameters are not relevant.
     # 0.00001 is introduced to avoid division by zero error
     if friction == 0:
@@ -59,10 +85,26 @@ def bearing_f(friction, base_roughness = "Rough", slope=0):
 
     factor_arrays = [Nc_d, Ngamma_d, Nq, Nc_ud, Ngamma_ud, Nq]
     bearing_factors = np.round(factor_arrays,2)
-    return bearing_factors
+    # a tuple is cached so that callers cannot modify the stored factors
+    return tuple(bearing_factors.tolist())
+
+
+def bearing_f_cache_info():
+    """
+    Return the hit / miss statistics of the bearing factor cache as a functools CacheInfo named tuple
+    (hits, misses, maxsize, currsize).
+    """
+    return _bearing_f_cached.cache_info()
+
+
+def bearing_f_cache_clear():
+    """Empty the bearing factor cache and reset its statistics."""
+    _bearing_f_cached.cache_clear()
 
 # Define rigidity factors
-def rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear_modulus=12000):
+@profiling.stage
+def rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear_modulus=12000,
+               bearing_factors=None):
     """
         Compute rigidity factors based on various inputs:
 
@@ -72,11 +114,14 @@ def rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear
             gamma - float value in kN/m3
             surcharge - float value in kPa
             shear_modulus - float value in kPa (default value is set to 12,000 kPa)
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             rigidity_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
         """
-    Nc_d = bearing_f(friction)[0]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d = bearing_factors[0]
     fric_ra = math.radians(friction)
 
     q_equi = surcharge + (depth+width/2) * gamma
@@ -98,7 +143,8 @@ def rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear
 
 
 # Define shape factors
-def shape_f(friction, width, length):
+@profiling.stage
+def shape_f(friction, width, length, bearing_factors=None):
     """
         Compute shape factors based on 3 inputs: friction angle phi, width and length.
 
@@ -106,12 +152,15 @@ def shape_f(friction, width, length):
             friction - float value in degree
             width - float value in m
             length - float value in m
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             shape_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
         """
 
-    Nc_d, Nc_ud, Nq = bearing_f(friction)[0],bearing_f(friction)[3],bearing_f(friction)[2]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d, Nc_ud, Nq = bearing_factors[0], bearing_factors[3], bearing_factors[2]
 
     # transform degrees into radians
     fric_ra = math.radians(friction)
@@ -126,8 +175,9 @@ def shape_f(friction, width, length):
     return shape_factors
 
 # Define inclination factors
+@profiling.stage
 def inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
-                  moment_W, moment_L, cohesion, friction, width, length):
+                  moment_W, moment_L, cohesion, friction, width, length, bearing_factors=None):
     """
         Compute inclination factors based on 9 inputs.
 
@@ -141,12 +191,19 @@ def inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
             friction - float value in degree
             width - float value in m
             length - float value in m
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             inclination_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
+
+        Raises:
+            ValueError - when the horizontal load exceeds V + A' c / tan(phi), which leaves the inclination
+                         factors undefined (a negative base raised to a fractional power)
         """
 
-    Nc_d, Nc_ud = bearing_f(friction)[0],bearing_f(friction)[3]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d, Nc_ud = bearing_factors[0], bearing_factors[3]
 
     # when friction = 0, drained parameters are not relevant.
     # 0.001 is introduced to avoid division by zero error
@@ -179,8 +236,11 @@ def inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
     n_theta = n_L * math.cos(theta)**2 + n_W * math.sin(theta)**2
 
     # define inclination factors
-    incl_f_q = (1 - H_load / (vertical_load + eff_area * cohesion / math.tan(fric_ra))) ** n_theta
-    incl_f_gamma = (1 - H_load / (vertical_load + eff_area * cohesion / math.tan(fric_ra))) ** (n_theta + 1)
+    incl_base = 1 - H_load / (vertical_load + eff_area * cohesion / math.tan(fric_ra))
+    if incl_base < 0:
+        raise ValueError(INCLINATION_ERROR)
+    incl_f_q = incl_base ** n_theta
+    incl_f_gamma = incl_base ** (n_theta + 1)
 
     incl_f_c_d = incl_f_q - (1 - incl_f_q) / Nc_d / math.tan(fric_ra)
 
@@ -198,19 +258,23 @@ def inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
     return inclination_factors, eff_dimensions
 
 # Define foundation tilt factors
-def foundation_tilt_f(friction, tilt=0):
+@profiling.stage
+def foundation_tilt_f(friction, tilt=0, bearing_factors=None):
     """
         Compute foundation tilt factors based on 2 inputs: friction angle phi, tilt angle.
 
         Parameters:
             friction - float value in degree
             tilt - float value in degree which is the tilting angle between the base slab and the horizontal.
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             foundation_tilt_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
         """
 
-    Nc_d = bearing_f(friction)[0]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d = bearing_factors[0]
 
     # when friction = 0, drained parameters are not relevant.
     # 0.001 is introduced to avoid division by zero error
@@ -233,19 +297,23 @@ def foundation_tilt_f(friction, tilt=0):
     return foundation_tilt_factors
 
 # Define surface inclination factors
-def surface_slope_f(friction, slope=0):
+@profiling.stage
+def surface_slope_f(friction, slope=0, bearing_factors=None):
     """
         Compute sloping ground factors based on 2 inputs: friction angle phi, slope angle.
 
         Parameters:
             friction - float value in degree
             slope - float value in degree which is the sloping angle of the ground surface
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             surface_slope_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
         """
 
-    Nc_d = bearing_f(friction)[0]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d = bearing_factors[0]
 
     # when friction = 0, drained parameters are not relevant.
     # 0.001 is introduced to avoid division by zero error
@@ -271,7 +339,8 @@ def surface_slope_f(friction, slope=0):
     return surface_slope_factors
 
 # Define depth factors
-def depth_f(friction, width, depth):
+@profiling.stage
+def depth_f(friction, width, depth, bearing_factors=None):
 
     """
         Compute depth factors based on 3 inputs: friction angle phi, width and length.
@@ -280,12 +349,15 @@ def depth_f(friction, width, depth):
             friction - float value in degree
             width - float value in m
             length - float value in m
+            bearing_factors - optional output of bearing_f to avoid computing it again
 
         Returns:
             depth_factors -  1 x 6 np array containing 3 drained parameters and 3 undrained parameters
         """
 
-    Nc_d = bearing_f(friction)[0]
+    if bearing_factors is None:
+        bearing_factors = bearing_f(friction)
+    Nc_d = bearing_factors[0]
 
     # when friction = 0, drained parameters are not relevant.
     # 0.001 is introduced to avoid division by zero error
@@ -308,31 +380,106 @@ def depth_f(friction, width, depth):
 
 
 
+FACTOR_ROWS = ('Bearing factors', 'Rigidity factors', 'Shape factors', 'Inclination factors', 'Foundation tilt factors',
+               'Surface slope factors', 'Depth factors')
+FACTOR_COLUMNS = ('Nc_d', 'Ngamma_d', 'Nq_d', 'Nc_ud', 'Ngamma_ud', 'Nq_ud')
+
+# Numeric result of the general bearing capacity equation
+BearingResult = collections.namedtuple('BearingResult',
+                                       ['capacity', 'capacity_d', 'capacity_ud', 'eff_width', 'eff_length',
+                                        'factors', 'drained'])
+BearingResult.__doc__ = """
+    Numeric result of bs_ultbearing_core.
+
+    Fields:
+        capacity - float value in kPa for the selected drainage condition, rounded to 2 decimals
+        capacity_d - float value in kPa of the drained ultimate bearing capacity
+        capacity_ud - float value in kPa of the undrained ultimate bearing capacity
+        eff_width, eff_length - float values in m
+        factors - 7 x 6 np array, rows as FACTOR_ROWS and columns as FACTOR_COLUMNS
+        drained - True when the drained analysis is selected
+    """
+
+
 # Define general bearing capacity equation
-def bs_ultbearing(dimensions_series, soil_series, geometry_series, load_series, supplementary_series):
+@profiling.stage
+def bs_ultbearing_core(width, length, cohesion, friction, gamma, depth, water_depth, vertical_load,
+                       horizontal_load_W=0, horizontal_load_L=0, moment_W=0, moment_L=0, shear_modulus=12000,
+                       slope=0, tilt=0, surcharge=0, drainage="Drained analysis", roughness="Rough", thickness=0):
     """
-        Compute ultimate bearing capacity based on 4 panda series.  Each series contains data of the
-        foundation conditions.  Dataframes are created for quicker computation.
+        Compute ultimate bearing capacity from float inputs and return numbers only.  No panda objects
+        or strings are created, which makes this function suitable for calling in loops.
 
         Parameters:
-            dimensions_series - panda dataframe containing the properties of footing dimensions
-            soil_series - panda dataframe containing the properties of founding soil
-            geometry_series - panda dataframe containing the properties of ground geometry
-            load_series - panda dataframe containing the properties of external loads
+            width, length, depth - float value in m
+            cohesion - float value in kPa
+            friction - float value in degree
+            gamma - float value in kN/m3
+            water_depth - float value in m
+            vertical_load, horizontal_load_W, horizontal_load_L - float value in kN
+            moment_W, moment_L - float value in kNm
+            shear_modulus - float value in kPa (default value is set to 12,000 kPa)
+            slope, tilt - float value in degree
+            surcharge - float value in kPa
+            drainage - string either "Drained analysis" or an undrained analysis
+            roughness - string either Rough or Smooth
+            thickness - float value in m, not used in the calculation
 
         Returns:
-            ultimate bearing capacity - float value in kPa
-            effective width - float value in kN
-            effective length - float value in kN
-            matrix of foundation factors -  6 x 6 panda dataframe containing all required factors
+            BearingResult - named tuple of the capacities, effective dimensions and 7 x 6 factor matrix
         """
-    # get values for various variables from four pd series
-    width, length, thickness = dimensions_series
-    cohesion, friction, gamma, shear_modulus = soil_series
-    depth, slope, tilt, water_depth = geometry_series
-    vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L = load_series
-    surcharge, drainage, roughness = supplementary_series
+    eff_gamma = effective_gamma(friction, width, gamma, water_depth)
+
+    base_roughness = roughness
+    q = surcharge + depth * gamma
+
+    # Nc, Nq and the undrained Nc do not depend on roughness or slope, so one set of bearing factors
+    # is passed to all factor functions
+    bearing_factors = bearing_f(friction, base_roughness, slope)
+    rigidity_factors = rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear_modulus,
+                                  bearing_factors)
+    shape_factors = shape_f(friction, width, length, bearing_factors)
+    inclination_factors, eff_dimensions = inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
+                                        moment_W, moment_L, cohesion, friction, width, length, bearing_factors)
+    foundation_factors = foundation_tilt_f(friction, tilt, bearing_factors)
+    surface_factors = surface_slope_f(friction, slope, bearing_factors)
+    depth_factors = depth_f(friction, width, depth, bearing_factors)
+
+    factors = stack_factors(bearing_factors, rigidity_factors, shape_factors, inclination_factors,
+                            foundation_factors, surface_factors, depth_factors)
+
+    return combine_factors(factors, eff_dimensions, cohesion, eff_gamma, q, drainage)
+
+
+# Define the 7 x 6 factor matrix from the rows of the factor functions
+@profiling.stage
+def stack_factors(bearing_factors, rigidity_factors, shape_factors, inclination_factors, foundation_factors,
+                  surface_factors, depth_factors):
+    """
+        Parameters:
+            bearing_factors - 6 np array returned by bearing_f
+            rigidity_factors ... depth_factors - 1 x 6 np arrays returned by the other factor functions
+
+        Returns:
+            factors - 7 x 6 np array, rows as FACTOR_ROWS and columns as FACTOR_COLUMNS
+        """
+    return np.vstack((bearing_factors[np.newaxis, :], rigidity_factors, shape_factors, inclination_factors,
+                      foundation_factors, surface_factors, depth_factors))
+
+
+# Define the unit weight below the footing, reduced for a water table within the failure wedge
+@profiling.stage
+def effective_gamma(friction, width, gamma, water_depth):
+    """
+        Parameters:
+            friction - float value in degree
+            width - float value in m
+            gamma - float value in kN/m3, bulk unit weight
+            water_depth - float value in m
 
+        Returns:
+            eff_gamma - float value in kN/m3
+        """
     # transform degrees into radians
     fric_ra = math.radians(friction)
 
@@ -343,37 +490,27 @@ def bs_ultbearing(dimensions_series, soil_series, geometry_series, load_series,
     else:
         eff_gamma = (2 * wedge_depth - water_depth) * water_depth * gamma / wedge_depth ** 2 + \
                     (gamma - 9.81) * (wedge_depth - water_depth)**2 / wedge_depth **2
+    return eff_gamma
 
 
-    base_roughness = roughness
-    q = surcharge + depth * gamma
-
-    bearing_factors = bearing_f(friction, base_roughness, slope)[np.newaxis, :]
-    rigidity_factors = rigidity_f(cohesion, friction, width, length, depth, gamma, surcharge, shear_modulus)
-    shape_factors = shape_f(friction, width, length)
-    inclination_factors, eff_dimensions = inclination_f(vertical_load, horizontal_load_W, horizontal_load_L,
-                                        moment_W, moment_L, cohesion, friction, width, length)
-    foundation_factors = foundation_tilt_f(friction, tilt)
-    surface_factors = surface_slope_f(friction, slope)
-    depth_factors = depth_f(friction, width, depth)
-
-    combined_array = np.vstack((bearing_factors, rigidity_factors, shape_factors, inclination_factors, foundation_factors,
-                                surface_factors, depth_factors))
-
-    df = pd.DataFrame(combined_array,
-                      index=['Bearing factors', 'Rigidity factors', 'Shape factors', 'Inclination factors', 'Foundation tilt factors',
-                             'Surface slope factors', 'Depth factors'],
-                      columns=['Nc_d', 'Ngamma_d', 'Nq_d', 'Nc_ud', 'Ngamma_ud', 'Nq_ud'])
-
-    # Product of drained factors
-    c_term_d_product = df['Nc_d'].prod()
-    gamma_term_d_product = df['Ngamma_d'].prod()
-    q_term_d_product = df['Nq_d'].prod()
+# Define the summation of the cohesion, self weight and overburden terms from the factor matrix
+@profiling.stage
+def combine_factors(factors, eff_dimensions, cohesion, eff_gamma, q, drainage):
+    """
+        Parameters:
+            factors - 7 x 6 np array, rows as FACTOR_ROWS and columns as FACTOR_COLUMNS
+            eff_dimensions - effective width and length in m, as returned by inclination_f
+            cohesion - float value in kPa
+            eff_gamma - float value in kN/m3, see effective_gamma
+            q - float value in kPa, surcharge plus overburden at founding level
+            drainage - string either "Drained analysis" or an undrained analysis
 
-    # Product of undrained factors
-    c_term_ud_product = df['Nc_ud'].prod()
-    gamma_term_ud_product = df['Ngamma_ud'].prod()
-    q_term_ud_product = df['Nq_ud'].prod()
+        Returns:
+            BearingResult
+        """
+    # Product of drained and undrained factors
+    c_term_d_product, gamma_term_d_product, q_term_d_product, \
+        c_term_ud_product, gamma_term_ud_product, q_term_ud_product = factors.prod(axis=0)
 
     # Summation of all terms
     ult_cap_d = cohesion * c_term_d_product + 0.5 * eff_gamma * eff_dimensions[0] * gamma_term_d_product + \
@@ -382,17 +519,59 @@ def bs_ultbearing(dimensions_series, soil_series, geometry_series, load_series,
     ult_cap_ud = cohesion * c_term_ud_product + 0.5 * eff_gamma * eff_dimensions[0] * gamma_term_ud_product + \
                  q * q_term_ud_product
 
+    drained = drainage == "Drained analysis"
+    ult_cap = np.round(ult_cap_d if drained else ult_cap_ud, 2)
+
+    return BearingResult(float(ult_cap), float(ult_cap_d), float(ult_cap_ud), eff_dimensions[0], eff_dimensions[1],
+                         factors, drained)
+
+
+# Present the factor matrix of the selected drainage condition as a data frame
+@profiling.stage
+def factor_frame(result):
+    """
+        Parameters:
+            result - BearingResult returned by bs_ultbearing_core
+
+        Returns:
+            matrix of foundation factors -  7 x 3 panda dataframe of the factors for the selected condition
+        """
+    import pandas as pd
+
+    df = pd.DataFrame(result.factors, index=list(FACTOR_ROWS), columns=list(FACTOR_COLUMNS))
+
     # drop irrelevant columns based on drained or undrained condition
-    if drainage == "Drained analysis":
-        ult_cap = np.round(ult_cap_d, 2)
-        df_output = df.drop(df.columns[3:6], axis=1)
+    if result.drained:
+        return df.drop(df.columns[3:6], axis=1)
+    return df.drop(df.columns[0:3], axis=1)
+
+
+# Present the numeric result as text and a data frame
+@profiling.stage
+def bearing_report(result, cohesion, friction, width, length):
+    """
+        Format a BearingResult for display.
+
+        Parameters:
+            result - BearingResult returned by bs_ultbearing_core
+            cohesion - float value in kPa
+            friction - float value in degree
+            width, length - float value in m
+
+        Returns:
+            warnings - string of warning messages
+            capacity, eff_width, eff_length - strings describing the results
+            matrix of foundation factors -  7 x 3 panda dataframe of the factors for the selected condition
+        """
+    df_output = factor_frame(result)
+
+    # warnings based on drained or undrained condition
+    if result.drained:
         error_check = lambda friction: "Warning: Drained analysis is not suitable for soil with friction angle = 0 \n" \
             if friction == 0 else ""
         warning1 = error_check(friction)
 
     else:
-        ult_cap = np.round(ult_cap_ud, 2)
-        df_output = df.drop(df.columns[0:3], axis=1)
         error_check = lambda friction: "Warning: Undrained analysis is not suitable for soil with cohesion = 0 \n" \
             if cohesion == 0 else ""
         warning1 = error_check(cohesion)
@@ -406,9 +585,42 @@ def bs_ultbearing(dimensions_series, soil_series, geometry_series, load_series,
         warnings = "No warning message."
 
 
-    capacity = f"The ultimate bearing capacity is {ult_cap} kPa"
-    eff_width = f"The effective width is {eff_dimensions[0]} m"
-    eff_length = f"The effective length is {eff_dimensions[1]} m"
+    capacity = f"The ultimate bearing capacity is {result.capacity} kPa"
+    eff_width = f"The effective width is {result.eff_width} m"
+    eff_length = f"The effective length is {result.eff_length} m"
 
     return warnings, capacity, eff_width, eff_length, df_output
 
+
+@profiling.stage
+def bs_ultbearing(dimensions_series, soil_series, geometry_series, load_series, supplementary_series):
+    """
+        Compute ultimate bearing capacity based on 5 panda series.  Each series contains data of the
+        foundation conditions.  The calculation is done by bs_ultbearing_core and formatted by bearing_report.
+
+        Parameters:
+            dimensions_series - panda dataframe containing the properties of footing dimensions
+            soil_series - panda dataframe containing the properties of founding soil
+            geometry_series - panda dataframe containing the properties of ground geometry
+            load_series - panda dataframe containing the properties of external loads
+            supplementary_series - panda dataframe containing surcharge, drainage condition and base roughness
+
+        Returns:
+            warnings - string of warning messages
+            ultimate bearing capacity - string with the float value in kPa
+            effective width - string with the float value in m
+            effective length - string with the float value in m
+            matrix of foundation factors -  7 x 3 panda dataframe containing all required factors
+        """
+    # get values for various variables from five pd series
+    width, length, thickness = dimensions_series
+    cohesion, friction, gamma, shear_modulus = soil_series
+    depth, slope, tilt, water_depth = geometry_series
+    vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L = load_series
+    surcharge, drainage, roughness = supplementary_series
+
+    result = bs_ultbearing_core(width, length, cohesion, friction, gamma, depth, water_depth, vertical_load,
+                                horizontal_load_W, horizontal_load_L, moment_W, moment_L, shear_modulus,
+                                slope, tilt, surcharge, drainage, roughness, thickness)
+
+    return bearing_report(result, cohesion, friction, width, length)
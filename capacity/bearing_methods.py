@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare the ultimate bearing capacity of other design methods with that of bearing_formula.  Every method is a
+backend registered in BACKENDS which supplies the vectorized factors of the general bearing capacity equation,
+as an n x 7 x 6 array with rows as FACTOR_ROWS and columns as FACTOR_COLUMNS; a row the method does not have is
+1.  The terms common to all methods (tan phi, Nq, Nc, the effective dimensions, the effective unit weight, the
+overburden pressure and the load inclination) are computed once per run in SharedTerms, and every method's
+capacity is summed the same way as bs_ultbearing_batch does.
+
+    results = evaluate_methods(frame, methods=('bs8004', 'vesic', 'hansen', 'meyerhof', 'ec7'))
+    comparison_table(results)      # capacity of every footing by method, side by side
+    factor_table(results, 0)       # factors of footing 0 by method
+
+Backends:
+    bs8004    bearing_formula, as bs_ultbearing (results identical to bs_ultbearing_batch)
+    vesic     Vesic (1973, 1975): Ngamma = 2 (Nq + 1) tan phi, rigidity factors as bearing_formula
+    hansen    Hansen (1970): Ngamma = 1.5 (Nq - 1) tan phi, inclination exponents of 5
+    meyerhof  Meyerhof (1963): Ngamma = (Nq - 1) tan(1.4 phi), factors in terms of Kp, inclination (1 - theta / 90)^2
+    ec7       EN 1997-1 Annex D: Ngamma = 2 (Nq - 1) tan phi, no depth or ground slope factors
+
+The factors follow Bowles, Foundation Analysis and Design (5th ed.), Table 4-5, in the multiplicative form of
+bs_ultbearing; the undrained columns use Nc = 5.14 (pi + 2 for ec7) with the undrained shape, depth, tilt and
+slope terms of each method, and the undrained Ngamma and Nq of bearing_formula.  Only bs8004 distinguishes a
+smooth base; the other methods take the base as rough.  The undrained inclination factor of hansen and ec7
+only exists while the horizontal load is at most A' c_u, so their undrained capacity is nan beyond it.  A
+method registered with register_backend is evaluated like the built-in ones:
+
+    @register_backend
+    class MyMethod(FormulaBackend):
+        name = 'my_method'
+        def factors(self, terms, rounding=True):
+            ...
+
+"""
+
+import collections
+import functools
+import operator
+
+import numpy as np
+
+from bearing_batch import (BatchResult, _input_columns, _nonzero_friction, _round, bearing_f_batch,
+                           depth_f_batch, eff_gamma_batch, effective_dimensions_batch, foundation_tilt_f_batch,
+                           inclination_f_batch, rigidity_f_batch, shape_f_batch, surface_slope_f_batch)
+from bearing_formula import FACTOR_COLUMNS, FACTOR_ROWS
+
+# Decimals of every factor row when rounding, as the scalar factor functions of bearing_formula
+ROW_DECIMALS = (2, 3, 2, 3, 2, 2, 2)
+
+# Exponents of the Hansen (1970) inclination factors iq and igamma
+HANSEN_EXPONENTS = (5, 5)
+
+# Registered backends: name -> FormulaBackend instance
+BACKENDS = {}
+
+SharedTerms = collections.namedtuple('SharedTerms', [
+    'inputs', 'n', 'phi', 'tan_phi', 'sin_phi', 'Nq', 'Nc', 'eff_width', 'eff_length', 'eff_area', 'eff_gamma',
+    'q', 'depth_ratio', 'load', 'horizontal_load', 'load_direction', 'load_inclination', 'slope', 'tilt',
+    'drained'])
+SharedTerms.__doc__ = """
+    Terms of the general bearing capacity equation shared by every method, computed once by shared_terms.
+
+    Fields:
+        inputs - dict of n np arrays keyed by INPUT_COLUMNS, with the defaults applied
+        n - number of footings
+        phi, tan_phi, sin_phi - n np arrays of the friction angle in radian (0 replaced by 0.00001 degree)
+        Nq, Nc - n np arrays of the unrounded drained bearing capacity factors common to all methods
+        eff_width, eff_length, eff_area - n np arrays of the effective dimensions in m and area in m2
+        eff_gamma - n np array of the effective unit weight within the failure wedge in kN/m3
+        q - n np array of the overburden pressure at the founding level in kPa
+        depth_ratio - n np array, D / B where D / B <= 1, arctan(D / B) otherwise
+        load, horizontal_load - n np arrays of the vertical load and the resultant horizontal load in kN
+        load_direction - n np array of the angle of the horizontal load to the length direction in radian
+        load_inclination - n np array of the angle of the resultant load to the vertical in radian
+        slope, tilt - n np arrays of the ground slope and the base tilt in radian
+        drained - n boolean np array, True where the drained analysis is selected
+    """
+
+
+class FormulaBackend:
+    """
+    Base class of the backends: a method supplies the factors of the general bearing capacity equation.
+
+    Attributes:
+        name - key in BACKENDS
+        description - one line description of the method
+    """
+    name = None
+    description = ""
+
+    def factors(self, terms, rounding=True):
+        """
+        Compute the factors of every footing.
+
+        Parameters:
+            terms - SharedTerms
+            rounding - True to round the factors as displayed by bs_ultbearing
+
+        Returns:
+            factors - n x 7 x 6 np array, rows as FACTOR_ROWS and columns as FACTOR_COLUMNS
+        """
+        raise NotImplementedError
+
+
+def register_backend(backend):
+    """Register a FormulaBackend subclass under its name; usable as a class decorator."""
+    BACKENDS[backend.name] = backend()
+    return backend
+
+
+def _row(n, c_d=1.0, gamma_d=1.0, q_d=1.0, c_ud=1.0, gamma_ud=1.0, q_ud=1.0):
+    # n x 6 factor row from drained and undrained c, gamma and q terms (scalars or n arrays)
+    return np.stack([np.broadcast_to(np.asarray(value, dtype=float), (n,))
+                     for value in (c_d, gamma_d, q_d, c_ud, gamma_ud, q_ud)], axis=1)
+
+
+def _stack_rows(rows, rounding):
+    # n x 7 x 6 factors from the seven rows, rounded row by row
+    return np.stack([_round(row, decimals, rounding) for row, decimals in zip(rows, ROW_DECIMALS)], axis=1)
+
+
+def _cohesion_term(factor_q, terms):
+    # drained c factor from the q factor, as used by Vesic and EN 1997-1: f_c = f_q - (1 - f_q) / (Nc tan phi)
+    return factor_q - (1 - factor_q) / (terms.Nc * terms.tan_phi)
+
+
+def _undrained_bearing(terms, Nc_ud=5.14):
+    # undrained Nc, Ngamma and Nq as bearing_formula: Ngamma = -2 sin(slope) on sloping ground
+    return Nc_ud, np.where(terms.slope == 0, 0.0, -2 * np.sin(terms.slope)), terms.Nq
+
+
+def _horizontal_ratio(terms):
+    # H / (V + A' c cot phi), the load ratio of the drained inclination factors
+    return terms.horizontal_load / (terms.load + terms.eff_area * terms.inputs['cohesion'] / terms.tan_phi)
+
+
+def _undrained_inclination(terms, values):
+    # when cohesion = 0, undrained analysis is not relevant and the factor is taken as 1
+    return np.where(terms.inputs['cohesion'] == 0, 1.0, values)
+
+
+def _load_exponent(terms, width, length):
+    # m = m_L cos^2(theta) + m_B sin^2(theta) of Vesic and EN 1997-1
+    m_W = (2 + width / length) / (1 + width / length)
+    m_L = (2 + length / width) / (1 + length / width)
+    return m_L * np.cos(terms.load_direction) ** 2 + m_W * np.sin(terms.load_direction) ** 2
+
+
+def shared_terms(inputs, rounding=True):
+    """
+    Compute the terms shared by every method.
+
+    Parameters:
+        inputs - dict of n np arrays keyed by INPUT_COLUMNS (see bearing_batch._input_columns)
+        rounding - True to round the effective dimensions as inclination_f does
+
+    Returns:
+        SharedTerms
+    """
+    friction = _nonzero_friction(inputs['friction'], 0.00001)
+    phi = np.radians(friction)
+    tan_phi, sin_phi = np.tan(phi), np.sin(phi)
+    Nq = np.exp(np.pi * tan_phi) * np.tan(np.pi / 4 + phi / 2) ** 2
+    Nc = (Nq - 1) / tan_phi
+
+    width, depth = inputs['width'], inputs['depth']
+    vertical_load = inputs['vertical_load']
+    eff_width, eff_length = effective_dimensions_batch(vertical_load, inputs['moment_W'], inputs['moment_L'],
+                                                       width, inputs['length'], rounding)
+    load = np.where(vertical_load == 0, vertical_load + 0.001, vertical_load)
+    load_W, load_L = inputs['horizontal_load_W'], inputs['horizontal_load_L']
+    horizontal_load = np.sqrt(load_L ** 2 + load_W ** 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        load_direction = np.where(load_L == 0, np.pi / 2, np.arctan(load_W / load_L))
+    depth_ratio = np.where(depth <= width, depth / width, np.arctan(depth / width))
+
+    return SharedTerms(inputs, len(width), phi, tan_phi, sin_phi, Nq, Nc, eff_width, eff_length,
+                       eff_width * eff_length, eff_gamma_batch(inputs['friction'], width, inputs['gamma'],
+                                                               inputs['water_depth']),
+                       inputs['surcharge'] + depth * inputs['gamma'], depth_ratio, load, horizontal_load,
+                       load_direction, np.arctan2(horizontal_load, load), np.radians(inputs['slope']),
+                       np.radians(inputs['tilt']), inputs['drainage'] == "Drained analysis")
+
+
+@register_backend
+class BS8004(FormulaBackend):
+    name = 'bs8004'
+    description = "bearing_formula, as bs_ultbearing"
+
+    def factors(self, terms, rounding=True):
+        inputs = terms.inputs
+        friction, width, length = inputs['friction'], inputs['width'], inputs['length']
+        cohesion, depth = inputs['cohesion'], inputs['depth']
+        bearing = bearing_f_batch(friction, inputs['roughness'], inputs['slope'], rounding)
+        inclination, _ = inclination_f_batch(inputs['vertical_load'], inputs['horizontal_load_W'],
+                                             inputs['horizontal_load_L'], inputs['moment_W'], inputs['moment_L'],
+                                             cohesion, friction, width, length, bearing, rounding)
+        return np.stack([
+            bearing,
+            rigidity_f_batch(cohesion, friction, width, length, depth, inputs['gamma'], inputs['surcharge'],
+                             inputs['shear_modulus'], bearing, rounding),
+            shape_f_batch(friction, width, length, bearing, rounding),
+            inclination,
+            foundation_tilt_f_batch(friction, inputs['tilt'], bearing, rounding),
+            surface_slope_f_batch(friction, inputs['slope'], bearing, rounding),
+            depth_f_batch(friction, width, depth, bearing, rounding)], axis=1)
+
+
+@register_backend
+class Vesic(FormulaBackend):
+    name = 'vesic'
+    description = "Vesic (1973, 1975)"
+
+    def factors(self, terms, rounding=True):
+        n, tan_phi, inputs = terms.n, terms.tan_phi, terms.inputs
+        ratio = terms.eff_width / terms.eff_length
+        bearing = _row(n, terms.Nc, 2 * (terms.Nq + 1) * tan_phi, terms.Nq, *_undrained_bearing(terms))
+        rigidity = rigidity_f_batch(inputs['cohesion'], inputs['friction'], inputs['width'], inputs['length'],
+                                    inputs['depth'], inputs['gamma'], inputs['surcharge'], inputs['shear_modulus'],
+                                    bearing, rounding=False)
+        shape_q = 1 + ratio * tan_phi
+        shape = _row(n, 1 + ratio * terms.Nq / terms.Nc, 1 - 0.4 * ratio, shape_q, 1 + 0.2 * ratio,
+                     1 - 0.4 * ratio, shape_q)
+
+        m = _load_exponent(terms, inputs['width'], inputs['length'])
+        incl_q = (1 - _horizontal_ratio(terms)) ** m
+        incl_gamma = (1 - _horizontal_ratio(terms)) ** (m + 1)
+        incl_c_ud = _undrained_inclination(
+            terms, 1 - m * terms.horizontal_load / (inputs['cohesion'] * 5.14 * terms.eff_area))
+        inclination = _row(n, _cohesion_term(incl_q, terms), incl_gamma, incl_q, incl_c_ud, incl_gamma, incl_q)
+
+        tilt_q = (1 - terms.tilt * tan_phi) ** 2
+        tilt = _row(n, _cohesion_term(tilt_q, terms), tilt_q, tilt_q, 1 - 2 * terms.tilt / 5.14, tilt_q, tilt_q)
+        slope_q = (1 - np.tan(terms.slope)) ** 2
+        slope = _row(n, _cohesion_term(slope_q, terms), slope_q, slope_q, 1 - 2 * terms.slope / 5.14)
+        depth_q = 1 + 2 * tan_phi * (1 - terms.sin_phi) ** 2 * terms.depth_ratio
+        depth = _row(n, _cohesion_term(depth_q, terms), 1.0, depth_q, 1 + 0.4 * terms.depth_ratio, 1.0, depth_q)
+        return _stack_rows((bearing, rigidity, shape, inclination, tilt, slope, depth), rounding)
+
+
+@register_backend
+class Hansen(FormulaBackend):
+    name = 'hansen'
+    description = "Hansen (1970)"
+
+    def factors(self, terms, rounding=True):
+        n, tan_phi, inputs = terms.n, terms.tan_phi, terms.inputs
+        ratio = terms.eff_width / terms.eff_length
+        bearing = _row(n, terms.Nc, 1.5 * (terms.Nq - 1) * tan_phi, terms.Nq, *_undrained_bearing(terms))
+        shape_q = 1 + ratio * terms.sin_phi
+        shape_gamma = np.maximum(1 - 0.4 * ratio, 0.6)
+        shape = _row(n, 1 + ratio * terms.Nq / terms.Nc, shape_gamma, shape_q, 1 + 0.2 * ratio, shape_gamma,
+                     shape_q)
+
+        exponent_q, exponent_gamma = HANSEN_EXPONENTS
+        incl_q = (1 - 0.5 * _horizontal_ratio(terms)) ** exponent_q
+        incl_gamma = (1 - 0.7 * _horizontal_ratio(terms)) ** exponent_gamma
+        incl_c_ud = _undrained_inclination(
+            terms, 0.5 + 0.5 * np.sqrt(1 - terms.horizontal_load / (terms.eff_area * inputs['cohesion'])))
+        inclination = _row(n, incl_q - (1 - incl_q) / (terms.Nq - 1), incl_gamma, incl_q, incl_c_ud, incl_gamma,
+                           incl_q)
+
+        tilt_c = 1 - np.degrees(terms.tilt) / 147
+        tilt = _row(n, tilt_c, np.exp(-2.7 * terms.tilt * tan_phi), np.exp(-2 * terms.tilt * tan_phi), tilt_c,
+                    np.exp(-2.7 * terms.tilt * tan_phi), np.exp(-2 * terms.tilt * tan_phi))
+        slope_c = 1 - np.degrees(terms.slope) / 147
+        slope_q = (1 - 0.5 * np.tan(terms.slope)) ** 5
+        slope = _row(n, slope_c, slope_q, slope_q, slope_c)
+        depth_q = 1 + 2 * tan_phi * (1 - terms.sin_phi) ** 2 * terms.depth_ratio
+        depth = _row(n, 1 + 0.4 * terms.depth_ratio, 1.0, depth_q, 1 + 0.4 * terms.depth_ratio, 1.0, depth_q)
+        return _stack_rows((bearing, _row(n), shape, inclination, tilt, slope, depth), rounding)
+
+
+@register_backend
+class Meyerhof(FormulaBackend):
+    name = 'meyerhof'
+    description = "Meyerhof (1963)"
+
+    def factors(self, terms, rounding=True):
+        n, inputs = terms.n, terms.inputs
+        ratio = terms.eff_width / terms.eff_length
+        D_B = inputs['depth'] / inputs['width']
+        Kp = np.tan(np.pi / 4 + terms.phi / 2) ** 2
+        # the q and gamma shape and depth terms apply for friction angles above 10 degree only
+        frictional = inputs['friction'] > 10
+        bearing = _row(n, terms.Nc, (terms.Nq - 1) * np.tan(1.4 * terms.phi), terms.Nq, *_undrained_bearing(terms))
+        shape_q = np.where(frictional, 1 + 0.1 * Kp * ratio, 1.0)
+        shape = _row(n, 1 + 0.2 * Kp * ratio, shape_q, shape_q, 1 + 0.2 * ratio, shape_q, shape_q)
+
+        incl_q = (1 - terms.load_inclination / (np.pi / 2)) ** 2
+        incl_gamma = np.where(terms.load_inclination < terms.phi, (1 - terms.load_inclination / terms.phi) ** 2, 0.0)
+        inclination = _row(n, incl_q, incl_gamma, incl_q, incl_q, incl_gamma, incl_q)
+
+        depth_q = np.where(frictional, 1 + 0.1 * np.sqrt(Kp) * D_B, 1.0)
+        depth = _row(n, 1 + 0.2 * np.sqrt(Kp) * D_B, depth_q, depth_q, 1 + 0.2 * D_B, depth_q, depth_q)
+        return _stack_rows((bearing, _row(n), shape, inclination, _row(n), _row(n), depth), rounding)
+
+
+@register_backend
+class EC7(FormulaBackend):
+    name = 'ec7'
+    description = "EN 1997-1:2004 Annex D"
+
+    def factors(self, terms, rounding=True):
+        n, tan_phi, inputs = terms.n, terms.tan_phi, terms.inputs
+        ratio = terms.eff_width / terms.eff_length
+        bearing = _row(n, terms.Nc, 2 * (terms.Nq - 1) * tan_phi, terms.Nq,
+                       *_undrained_bearing(terms, np.pi + 2))
+        shape_q = 1 + ratio * terms.sin_phi
+        shape = _row(n, (shape_q * terms.Nq - 1) / (terms.Nq - 1), 1 - 0.3 * ratio, shape_q, 1 + 0.2 * ratio,
+                     1 - 0.3 * ratio, shape_q)
+
+        # m from the effective dimensions
+        m = _load_exponent(terms, terms.eff_width, terms.eff_length)
+        incl_q = (1 - _horizontal_ratio(terms)) ** m
+        incl_gamma = (1 - _horizontal_ratio(terms)) ** (m + 1)
+        incl_c_ud = _undrained_inclination(
+            terms, 0.5 * (1 + np.sqrt(1 - terms.horizontal_load / (terms.eff_area * inputs['cohesion']))))
+        inclination = _row(n, _cohesion_term(incl_q, terms), incl_gamma, incl_q, incl_c_ud, incl_gamma, incl_q)
+
+        tilt_q = (1 - terms.tilt * tan_phi) ** 2
+        tilt = _row(n, _cohesion_term(tilt_q, terms), tilt_q, tilt_q, 1 - 2 * terms.tilt / (np.pi + 2), tilt_q,
+                    tilt_q)
+        return _stack_rows((bearing, _row(n), shape, inclination, tilt, _row(n), _row(n)), rounding)
+
+
+def method_capacity(terms, factors, rounding=True):
+    """
+    Sum the general bearing capacity equation of one method, as bs_ultbearing_batch does.
+
+    Parameters:
+        terms - SharedTerms
+        factors - n x 7 x 6 np array returned by a backend
+        rounding - True to round the capacity to 2 decimals
+
+    Returns:
+        BatchResult
+    """
+    # Product of the factors of every term, in row order as factors.prod(axis=1), and summation of all terms
+    products = functools.reduce(operator.mul, [factors[:, i] for i in range(len(FACTOR_ROWS))])
+    cohesion, gamma_term = terms.inputs['cohesion'], 0.5 * terms.eff_gamma * terms.eff_width
+    ult_cap_d = cohesion * products[:, 0] + gamma_term * products[:, 1] + terms.q * products[:, 2]
+    ult_cap_ud = cohesion * products[:, 3] + gamma_term * products[:, 4] + terms.q * products[:, 5]
+    capacity = _round(np.where(terms.drained, ult_cap_d, ult_cap_ud), 2, rounding)
+    return BatchResult(capacity, ult_cap_d, ult_cap_ud, terms.eff_width, terms.eff_length, factors, terms.drained)
+
+
+def evaluate_methods(frame=None, methods=None, rounding=True, **columns):
+    """
+    Compute the ultimate bearing capacity of many footings with several methods in one pass.
+
+    Parameters:
+        frame - optional panda dataframe (or dict of arrays) with one row per footing, as for bs_ultbearing_batch
+        methods - names in BACKENDS, all registered methods when None
+        rounding - True to round the effective dimensions, factors and capacities as bs_ultbearing
+        columns - np arrays or scalar values keyed by the names in INPUT_COLUMNS
+
+    Returns:
+        results - dict of BatchResult keyed by method name, in the order of methods
+    """
+    methods = tuple(BACKENDS) if methods is None else tuple(methods)
+    unknown = [name for name in methods if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown methods {unknown}, use some of {sorted(BACKENDS)}")
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        terms = shared_terms(_input_columns(frame, columns), rounding)
+        return {name: method_capacity(terms, BACKENDS[name].factors(terms, rounding), rounding)
+                for name in methods}
+
+
+def comparison_table(results, index=None):
+    """
+    Return the capacities of every method side by side.
+
+    Parameters:
+        results - dict returned by evaluate_methods
+        index - optional index of the footings, e.g. the index of the input data frame
+
+    Returns:
+        table - panda dataframe with one row per footing, one capacity column per method in kPa and the ratio
+                of the highest to the lowest capacity
+    """
+    import pandas as pd
+
+    table = pd.DataFrame({name: result.capacity for name, result in results.items()}, index=index)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        table['max / min'] = table.max(axis=1) / table.min(axis=1)
+    return table
+
+
+def factor_table(results, footing=0):
+    """
+    Return the factors of one footing side by side.
+
+    Parameters:
+        results - dict returned by evaluate_methods
+        footing - position of the footing
+
+    Returns:
+        table - panda dataframe with rows as FACTOR_ROWS and columns (method, FACTOR_COLUMNS)
+    """
+    import pandas as pd
+
+    return pd.concat({name: pd.DataFrame(result.factors[footing], index=FACTOR_ROWS, columns=FACTOR_COLUMNS)
+                      for name, result in results.items()}, axis=1)
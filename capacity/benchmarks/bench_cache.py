@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Time bs_ultbearing_core_cached on footings of the synthetic population of bench_suite: a cold run that fills the
+cache, a warm run with every footing found, and a re-run after a share of the footings changed.  The times per
+footing are compared with a plain bs_ultbearing_core loop and with bs_ultbearing_batch, and the cached results
+are checked against bs_ultbearing_core.
+
+Run from the capacity folder:
+    python benchmarks/bench_cache.py [--size 20000] [--changed 0.01]
+
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_batch import bs_ultbearing_batch
+from bearing_formula import bs_ultbearing_core
+from bench_suite import footing, population
+from result_cache import ResultCache, bs_ultbearing_core_cached
+
+
+def timed(func):
+    """Return the result of func and its time in s."""
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cold, warm and partly changed runs of the result cache.")
+    parser.add_argument("--size", type=int, default=20000, help="footings")
+    parser.add_argument("--changed", type=float, default=0.01, help="share of footings changed for the re-run")
+    args = parser.parse_args(argv)
+
+    pop = population(args.size, seed=1)
+    footings = [footing(pop, i) for i in range(args.size)]
+    rows = np.flatnonzero(np.random.default_rng(2).random(args.size) < args.changed)
+    changed = list(footings)
+    for i in rows:
+        changed[i] = dict(footings[i], vertical_load=footings[i]['vertical_load'] + 10.0)
+
+    _, batch_s = timed(lambda: bs_ultbearing_batch(pop))
+    reference, scalar_s = timed(lambda: [bs_ultbearing_core(**f) for f in footings])
+
+    with tempfile.TemporaryDirectory() as folder:
+        with ResultCache(os.path.join(folder, "cache.sqlite")) as cache:
+            _, cold_s = timed(lambda: [bs_ultbearing_core_cached(cache, **f) for f in footings])
+            warm, warm_s = timed(lambda: [bs_ultbearing_core_cached(cache, **f) for f in footings])
+            _, rerun_s = timed(lambda: [bs_ultbearing_core_cached(cache, **f) for f in changed])
+            stats = cache.stats()
+
+    for cached, result in zip(warm, reference):
+        assert cached[:5] == result[:5] and cached.drained == result.drained
+        assert np.array_equal(cached.factors, result.factors, equal_nan=True)
+
+    print(f"{'run':<40}{'s':>9}{'us/footing':>12}")
+    for name, seconds in [("bs_ultbearing_core loop", scalar_s), ("bs_ultbearing_batch", batch_s),
+                          ("cached, cold", cold_s), ("cached, warm", warm_s),
+                          (f"cached, {args.changed:.0%} changed", rerun_s)]:
+        print(f"{name:<40}{seconds:>9.3f}{seconds / args.size * 1e6:>12.1f}")
+    print(f"{stats['entries']} entries, {stats['file_bytes'] / 1e6:.1f} MB, hit rate {stats['hit_rate']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Build the failure envelope of the representative footing of bench_scalar with adaptive refinement and on a
+uniform grid with the same number of lines per axis, and check both against the direct (unrounded) evaluation
+of load cases scattered around the surface: share of load cases classified wrongly, share wrongly taken as
+inside, and share classified wrongly although their utilisation differs from 1 by more than 0.02.  The
+adaptive envelope is also checked against the rounded calculation, and query times per load case are compared
+with FootingLoadCases and with bs_ultbearing_core; the queries are no faster than FootingLoadCases, so the
+envelope serves plots and margins rather than screening.
+
+Run from the capacity folder:
+    python benchmarks/bench_envelope.py [--cases 100000] [--fos 3.0]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_formula import bs_ultbearing_core
+from envelope import failure_envelope
+from load_cases import LOAD_COLUMNS, FootingLoadCases
+from bench_scalar import FOOTING
+
+
+def test_loads(envelope, n, seed=0):
+    """Load cases with N within (0, N_max] and radii up to twice the failure radius, signs of H random."""
+    rng = np.random.default_rng(seed)
+    directions = np.abs(rng.standard_normal((n, 4)))
+    directions /= np.linalg.norm(directions, axis=1)[:, None]
+    t = rng.uniform(0.0, 1.0, n)
+    h = directions * envelope.scales
+    radius = envelope.failure_radius(t, envelope._coordinates(np.column_stack([t * envelope.n_max, h]))[2])
+    loads = np.column_stack([t * envelope.n_max, h * (rng.uniform(0.0, 2.0, n) * radius)[:, None]])
+    loads[:, 1:3] *= rng.choice([-1.0, 1.0], (n, 2))
+    return loads
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Adaptive failure envelope against a uniform grid.")
+    parser.add_argument("--cases", type=int, default=100000, help="load cases checked")
+    parser.add_argument("--fos", type=float, default=3.0, help="required factor of safety")
+    args = parser.parse_args(argv)
+
+    footing = {name: value for name, value in FOOTING.items() if name not in LOAD_COLUMNS}
+    cases = FootingLoadCases(footing, rounding=False)
+
+    envelopes = {}
+    started = time.perf_counter()
+    envelopes["adaptive"] = failure_envelope(footing, fos=args.fos, rounding=False)
+    envelopes["adaptive"].build_s = time.perf_counter() - started
+    # the same number of grid lines per axis, evenly spaced
+    started = time.perf_counter()
+    envelopes["uniform"] = failure_envelope(footing, fos=args.fos, rounding=False, max_rounds=0,
+                                            grid=[len(axis) for axis in envelopes["adaptive"].axes])
+    envelopes["uniform"].build_s = time.perf_counter() - started
+
+    loads = test_loads(envelopes["adaptive"], args.cases)
+    started = time.perf_counter()
+    result = cases.evaluate(loads, args.fos)
+    direct_us = (time.perf_counter() - started) / args.cases * 1e6
+    safe = (result.capacity > 0) & (result.utilisation <= 1)
+    print(f"{args.cases} load cases, {safe.mean():.1%} inside, N_max {envelopes['adaptive'].n_max:.0f} kN")
+
+    print(f"{'envelope':<10}{'grid':>18}{'nodes':>8}{'evaluations':>13}{'build s':>9}{'query us':>10}"
+          f"{'wrong':>8}{'unsafe':>8}{'|u-1|>0.02':>12}")
+    for name, envelope in envelopes.items():
+        started = time.perf_counter()
+        inside = envelope.contains(loads)
+        query_us = (time.perf_counter() - started) / args.cases * 1e6
+        wrong = inside != safe
+        worst = np.abs(result.utilisation[wrong] - 1)
+        grid = " x ".join(str(len(axis)) for axis in envelope.axes)
+        print(f"{name:<10}{grid:>18}{envelope.stats.nodes:>8}{envelope.stats.evaluations:>13}"
+              f"{envelope.build_s:>9.2f}{query_us:>10.2f}{wrong.mean():>8.2%}{(inside & ~safe).mean():>8.2%}"
+              f"{(wrong.sum() and (worst > 0.02).sum() / args.cases):>12.3%}")
+
+    # the envelope against the rounded calculation of bs_ultbearing
+    rounded = FootingLoadCases(footing).evaluate(loads, args.fos)
+    safe = (rounded.capacity > 0) & (rounded.utilisation <= 1)
+    inside = envelopes["adaptive"].contains(loads)
+    wrong = inside != safe
+    print(f"adaptive against the rounded calculation: {wrong.mean():.2%} wrong, {(inside & ~safe).mean():.2%} "
+          f"unsafe, {(wrong & (np.abs(rounded.utilisation - 1) > 0.02)).mean():.3%} with |u-1| > 0.02")
+
+    core = {name: value for name, value in FOOTING.items()}
+    core_us = min(timeit.repeat(lambda: bs_ultbearing_core(**core), number=200, repeat=3)) / 200 * 1e6
+    print(f"direct evaluation: FootingLoadCases {direct_us:.2f} us, bs_ultbearing_core {core_us:.1f} us per load case")
+
+
+if __name__ == "__main__":
+    main()
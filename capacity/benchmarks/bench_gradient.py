@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare bs_ultbearing_gradient with central finite differences over bs_ultbearing_batch for the synthetic
+population of bench_suite: time for the full gradient, agreement with finite differences of the unrounded
+calculation, and the share of derivatives that finite differences of the rounded calculation (as
+bs_ultbearing returns it) get wrong by more than 1 % because the rounding flattens the small steps.
+
+Run from the capacity folder:
+    python benchmarks/bench_gradient.py [--sizes 10000 100000] [--step 1e-4]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_batch import bs_ultbearing_batch
+from bearing_gradient import GRADIENT_COLUMNS, bs_ultbearing_gradient
+from bench_suite import population
+
+
+def finite_differences(pop, rounding, step):
+    """Return the central finite difference gradient as a dict of arrays, with a relative step."""
+    gradient = {}
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for name in GRADIENT_COLUMNS:
+            x = pop[name].astype(float)
+            h = step * np.maximum(np.abs(x), 1.0)
+            up = bs_ultbearing_batch(dict(pop, **{name: x + h}), rounding=rounding).capacity
+            down = bs_ultbearing_batch(dict(pop, **{name: x - h}), rounding=rounding).capacity
+            gradient[name] = (up - down) / (2 * h)
+    return gradient
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Dual number gradient against finite differences.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000], help="footings")
+    parser.add_argument("--step", type=float, default=1e-4, help="relative finite difference step")
+    args = parser.parse_args(argv)
+
+    print(f"{'n':>8}{'gradient s':>12}{'fin. diff. s':>14}{'speedup':>9}{'median rel. diff.':>19}"
+          f"{'rounded FD >1% off':>20}")
+    for n in args.sizes:
+        pop = population(n, seed=1)
+
+        started = time.perf_counter()
+        result = bs_ultbearing_gradient(pop)
+        dual_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        exact = finite_differences(pop, False, args.step)
+        fd_s = time.perf_counter() - started
+        rounded = finite_differences(pop, True, args.step)
+
+        # compare where the input is not at a switch between formulas (a zero load, slope or cohesion)
+        differences, wrong = [], []
+        for name in GRADIENT_COLUMNS:
+            valid = np.isfinite(exact[name]) & np.isfinite(result.gradient[name]) & (pop[name] != 0)
+            scale = np.maximum(np.abs(result.gradient[name][valid]), 1e-3 * np.abs(result.capacity[valid]))
+            differences.append(np.abs(exact[name][valid] - result.gradient[name][valid]) / scale)
+            wrong.append(np.abs(rounded[name][valid] - result.gradient[name][valid]) / scale > 0.01)
+        print(f"{n:>8}{dual_s:>12.2f}{fd_s:>14.2f}{fd_s / dual_s:>8.1f}x{np.median(np.concatenate(differences)):>19.1e}"
+              f"{np.mean(np.concatenate(wrong)):>20.1%}")
+
+
+if __name__ == "__main__":
+    main()
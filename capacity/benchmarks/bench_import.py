@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Import-time regression gate for the calculation modules.  Every module is imported in a fresh interpreter
+with python -X importtime; the cumulative import time is reported and the run fails (exit code 1) when a
+module pulls in one of the GUI / reporting / data frame packages or exceeds the time budget.
+
+Run from the capacity folder:
+    python benchmarks/bench_import.py [--max-ms 500] [--repeat 3]
+
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+CAPACITY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# modules used by worker processes and the packages they must not load
+COMPUTE_MODULES = ('bearing_formula', 'bearing_batch', 'bearing_fast', 'load_cases', 'design', 'incremental',
+                   'reliability', 'sampling',
+                   'dual', 'bearing_gradient', 'result_cache', 'service', 'envelope', 'bearing_methods')
+FORBIDDEN = ('pandas', 'tkinter', 'PIL', 'reportlab', 'PyPDF2')
+
+
+def import_profile(module):
+    """
+    Import module in a new interpreter with -X importtime.
+
+    Returns:
+        cumulative - cumulative import time of the module in ms
+        imported - set of the top level package names imported on the way
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=CAPACITY_DIR, capture_output=True, text=True, check=True)
+    cumulative, imported = None, set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = [field.strip() for field in line[len("import time:"):].split("|")]
+        if not fields[0].isdigit():
+            continue
+        name = fields[2]
+        imported.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(fields[1]) / 1000
+    return cumulative, imported
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time regression gate for the calculation modules.")
+    parser.add_argument("--max-ms", type=float, default=500.0, help="cumulative import time budget per module")
+    parser.add_argument("--repeat", type=int, default=3, help="imports per module, the fastest is reported")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'module':<20}{'import ms':>10}")
+    for module in COMPUTE_MODULES:
+        profiles = [import_profile(module) for _ in range(args.repeat)]
+        cumulative = min(profile[0] for profile in profiles)
+        loaded = sorted(set(FORBIDDEN) & profiles[0][1])
+        print(f"{module:<20}{cumulative:>10.1f}")
+        if loaded:
+            failures.append(f"{module} imports {', '.join(loaded)}")
+        if cumulative > args.max_ms:
+            failures.append(f"{module} takes {cumulative:.1f} ms to import (budget {args.max_ms:.0f} ms)")
+
+    for failure in failures:
+        print("FAIL:", failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare changing one input at a time with IncrementalBearing.update against a full bs_ultbearing_core call,
+for the representative footing of bench_scalar.  Every input is toggled between two values, so every update
+does change something; the number of nodes recomputed per update is taken from the evaluator's counters.
+
+Run from the capacity folder:
+    python benchmarks/bench_incremental.py [--number N]
+
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_formula import bs_ultbearing_core
+from incremental import IncrementalBearing, NODES
+from bench_scalar import FOOTING
+
+# Second value of every toggled input
+CHANGES = dict(vertical_load=1600.0, moment_W=150.0, water_depth=0.5, tilt=5.0, depth=1.2, width=2.2,
+               friction=32.0, drainage="Undrained analysis")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="One-input updates of IncrementalBearing against full calls.")
+    parser.add_argument("--number", type=int, default=2000, help="updates per input")
+    args = parser.parse_args(argv)
+
+    print(f"{'changed input':<16}{'full us':>10}{'update us':>11}{'speedup':>9}{'nodes/update':>14}")
+    for name, value in CHANGES.items():
+        values = itertools.cycle([value, FOOTING[name]])
+
+        footing = dict(FOOTING)
+        started = time.perf_counter()
+        for _ in range(args.number):
+            footing[name] = next(values)
+            full = bs_ultbearing_core(**footing)
+        full_us = (time.perf_counter() - started) / args.number * 1e6
+
+        evaluator = IncrementalBearing(**FOOTING)
+        evaluator.counts.clear()
+        started = time.perf_counter()
+        for _ in range(args.number):
+            result = evaluator.update(**{name: next(values)})
+        update_us = (time.perf_counter() - started) / args.number * 1e6
+        nodes = sum(evaluator.counts.values()) / evaluator.updates
+
+        # both loops end on the same value, the results must agree
+        assert result.capacity == full.capacity
+        print(f"{name:<16}{full_us:>10.1f}{update_us:>11.1f}{full_us / update_us:>8.1f}x"
+              f"{nodes:>8.1f} of {len(NODES)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Time evaluate_methods for all registered methods in one shared pass against one pass per method and against
+bs_ultbearing_batch alone, on the synthetic population of bench_suite, check that the bs8004 backend matches
+bs_ultbearing_batch, and print the median capacity of every method relative to bs8004 with the comparison and
+factor tables of the representative footing of bench_scalar.
+
+Run from the capacity folder:
+    python benchmarks/bench_methods.py [--size 100000]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_batch import bs_ultbearing_batch
+from bearing_methods import BACKENDS, comparison_table, evaluate_methods, factor_table
+from bench_scalar import FOOTING
+from bench_suite import population
+
+
+def best_time(func, repeat=3):
+    """Return the result of func and its best time in s."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - started)
+    return result, min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Several bearing capacity methods in one shared pass.")
+    parser.add_argument("--size", type=int, default=100000, help="footings")
+    args = parser.parse_args(argv)
+
+    pop = population(args.size, seed=1)
+    reference, batch_s = best_time(lambda: bs_ultbearing_batch(pop))
+    results, shared_s = best_time(lambda: evaluate_methods(pop))
+    _, separate_s = best_time(lambda: [evaluate_methods(pop, methods=[name]) for name in BACKENDS])
+
+    match = all(np.array_equal(getattr(results['bs8004'], name), getattr(reference, name), equal_nan=True)
+                for name in ('capacity', 'capacity_d', 'capacity_ud', 'factors'))
+    print(f"bs8004 matches bs_ultbearing_batch: {match}")
+    print(f"{args.size} footings, {len(BACKENDS)} methods: shared pass {shared_s:.3f} s, one pass per method "
+          f"{separate_s:.3f} s, bs_ultbearing_batch alone {batch_s:.3f} s")
+
+    table = comparison_table(results)
+    ratios = table[list(BACKENDS)].div(table['bs8004'], axis=0)
+    print("median capacity relative to bs8004 (drained / undrained footings):")
+    for name in BACKENDS:
+        print(f"    {name:<10}{ratios[name][results[name].drained].median():>8.3f}"
+              f"{ratios[name][~results[name].drained].median():>8.3f}")
+
+    with pd.option_context('display.width', 160, 'display.max_columns', 40, 'display.float_format', '{:.3f}'.format):
+        single = evaluate_methods(**FOOTING)
+        print(comparison_table(single))
+        print(factor_table(single).T)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Break the time of bs_ultbearing and of build_report down by stage with the profiling module, for the
+representative footing of bench_scalar, and measure the cost of profiling itself: the time per
+bs_ultbearing call with profiling disabled and enabled.
+
+Run from the capacity folder:
+    python benchmarks/bench_profile.py [--number N]
+
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bearing_formula
+import profiling
+import savepdf
+from bench_scalar import FOOTING, footing_series
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time per stage of bs_ultbearing and build_report.")
+    parser.add_argument("--number", type=int, default=1000, help="bs_ultbearing calls")
+    args = parser.parse_args(argv)
+
+    series = footing_series(FOOTING)
+    # calls go through the module, so that the timed wrappers are used while profiling is enabled
+    call = lambda: bearing_formula.bs_ultbearing(*series)
+    disabled = min(timeit.repeat(call, number=args.number, repeat=3)) / args.number * 1e6
+    with profiling.profile():
+        enabled = min(timeit.repeat(call, number=args.number, repeat=3)) / args.number * 1e6
+    print(f"bs_ultbearing: {disabled:.1f} us per call with profiling disabled, {enabled:.1f} us enabled")
+
+    with pd.option_context('display.width', 120, 'display.float_format', '{:.4f}'.format):
+        print(profiling.stats_frame())
+
+        warnings, capacity, eff_width, eff_length, factors = call()
+        with profiling.profile():
+            savepdf.build_report(*series[:4], factors, ["Project", "P001", "F1"], capacity)
+        print(profiling.stats_frame())
+
+
+if __name__ == "__main__":
+    main()
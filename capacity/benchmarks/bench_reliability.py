@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Time the Monte Carlo reliability analysis of the representative footing of bench_scalar with random soil,
+water and load inputs: samples per second of run_reliability for a few chunk sizes against the scalar
+bs_ultbearing_core loop it replaces, and the estimated failure probability with its standard error.
+
+Run from the capacity folder:
+    python benchmarks/bench_reliability.py [--samples 1000000] [--chunks 10000 100000] [--workers 1]
+
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_formula import bs_ultbearing_core
+from reliability import Normal, LogNormal, TruncatedNormal, run_reliability, inputs_from_normals
+from bench_scalar import FOOTING
+
+# Random inputs of the representative footing, cohesion and friction negatively correlated
+VARIABLES = dict(cohesion=LogNormal(5.0, 2.0), friction=TruncatedNormal(30.0, 3.0, 20.0, 40.0),
+                 gamma=Normal(19.0, 1.0), water_depth=TruncatedNormal(1.5, 0.5, 0.0, 5.0),
+                 vertical_load=LogNormal(1500.0, 300.0), horizontal_load_W=LogNormal(100.0, 30.0))
+FIXED = {name: value for name, value in FOOTING.items() if name not in VARIABLES}
+CORRELATION = np.eye(len(VARIABLES))
+CORRELATION[0, 1] = CORRELATION[1, 0] = -0.5
+REQUIRED_FOS = 3.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo reliability analysis against the scalar loop.")
+    parser.add_argument("--samples", type=int, default=1000000, help="Monte Carlo samples")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[10000, 100000], help="chunk sizes")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument("--scalar", type=int, default=2000, help="samples of the scalar loop")
+    args = parser.parse_args(argv)
+
+    # the scalar loop on the same kind of samples, extrapolated to the full sample size
+    inputs = inputs_from_normals(VARIABLES, np.random.default_rng(0).standard_normal((args.scalar, len(VARIABLES))),
+                                 np.linalg.cholesky(CORRELATION))
+    started = time.perf_counter()
+    for i in range(args.scalar):
+        bs_ultbearing_core(**dict(FIXED, **{name: float(values[i]) for name, values in inputs.items()}))
+    scalar_s = (time.perf_counter() - started) / args.scalar * args.samples
+    print(f"scalar bs_ultbearing_core loop: {scalar_s:.1f} s for {args.samples} samples (extrapolated)")
+
+    print(f"{'chunk':>10}{'seconds':>10}{'samples/s':>12}{'speedup':>9}{'pf':>12}{'std error':>11}{'beta':>7}")
+    for chunk in args.chunks:
+        started = time.perf_counter()
+        result = run_reliability(VARIABLES, FIXED, CORRELATION, samples=args.samples, chunk_size=chunk, seed=1,
+                                 workers=args.workers, fos=REQUIRED_FOS)
+        seconds = time.perf_counter() - started
+        print(f"{chunk:>10}{seconds:>10.2f}{args.samples / seconds:>12.0f}{scalar_s / seconds:>8.0f}x"
+              f"{result.pf:>12.4g}{result.pf_std_error:>11.2g}{result.beta:>7.2f}")
+    print("capacity percentiles (kPa): " + ", ".join(f"{p}%: {v:.0f}" for p, v in result.percentiles.items()))
+
+
+if __name__ == "__main__":
+    main()
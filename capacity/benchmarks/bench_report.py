@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare the per-report time of the front page and of a complete report made as before the template cache
+(the template parsed for every report and the dynamic content merged with PdfPage.merge_page, which parses the
+template content) and with the template parsed once per process and stamped by savepdf.stamp_page.  The
+reports are written to memory so that disk speed does not enter the comparison.  Needs reportlab and PyPDF2.
+
+Run from the capacity folder:
+    python benchmarks/bench_report.py [--reports 50]
+
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from PyPDF2 import PdfReader, PdfWriter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_report
+from savepdf import TEMPLATE_FILE, generate_dynamic_content, prepare_frontpage
+from bench_suite import population, footing
+
+
+def baseline_frontpage(list, output_file, template_file=TEMPLATE_FILE):
+    """The front page as made before the template cache: parse the template and merge_page the content."""
+    template_pdf = PdfReader(template_file)
+    dynamic_page = PdfReader(generate_dynamic_content(list)).pages[0]
+    writer = PdfWriter()
+    for page_num in range(len(template_pdf.pages)):
+        template_page = template_pdf.pages[page_num]
+        if page_num == 0:
+            template_page.merge_page(dynamic_page)
+        writer.add_page(template_page)
+    writer.write(output_file)
+
+
+def per_report(func, footings, make_frontpage):
+    """Return the mean time per report in ms with the front pages made by make_frontpage."""
+    saved, batch_report.prepare_frontpage = batch_report.prepare_frontpage, make_frontpage
+    try:
+        started = time.perf_counter()
+        for f in footings:
+            func(f)
+        return (time.perf_counter() - started) / len(footings) * 1000
+    finally:
+        batch_report.prepare_frontpage = saved
+
+
+def frontpage(f):
+    batch_report.prepare_frontpage(["Benchmark", "B-001", f['structure_id']], output_file=io.BytesIO())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-report time with and without the template cache.")
+    parser.add_argument("--reports", type=int, default=50, help="number of reports per measurement")
+    args = parser.parse_args(argv)
+
+    pop = population(args.reports, seed=1)
+    footings = [dict(footing(pop, i), structure_id=f"F{i}") for i in range(args.reports)]
+
+    print(f"{'stage':<16}{'parse + merge_page':>20}{'cached + stamp':>18}{'speedup':>10}")
+    for name, func in (("front page", frontpage), ("full report", batch_report.render_report)):
+        func(footings[0])
+        before = per_report(func, footings, baseline_frontpage)
+        after = per_report(func, footings, prepare_frontpage)
+        print(f"{name:<16}{before:>17.2f} ms{after:>15.2f} ms{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
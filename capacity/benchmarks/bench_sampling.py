@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare the sampling designs of sampling.py on the random footing of bench_reliability: the root mean square
+error of the capacity mean and percentiles over independently randomised replicates, against a large plain
+Monte Carlo reference.  The efficiency is (RMSE of plain Monte Carlo / RMSE of the design)^2 at the same
+sample size, i.e. how many times fewer evaluations the design needs for the same accuracy.  Finally
+run_sampling is run with every design to show the samples needed until the percentiles stabilise.
+
+Run from the capacity folder:
+    python benchmarks/bench_sampling.py [--sizes 1024 4096 16384 65536] [--replicates 10]
+
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reliability import cholesky_factor, evaluate_samples, inputs_from_normals, norm_ppf
+from sampling import SAMPLERS, EDGE, run_sampling
+from bench_reliability import VARIABLES, FIXED, CORRELATION
+
+PERCENTILES = (1, 5, 50, 95, 99)
+
+
+def statistics(sampler, n, cholesky, rounding=False):
+    """Return the mean and the PERCENTILES of the capacity of n points of a sampler."""
+    points = np.clip(sampler.draw(n), EDGE, 1 - EDGE)
+    capacity, _, valid = evaluate_samples(inputs_from_normals(VARIABLES, norm_ppf(points), cholesky), FIXED,
+                                          rounding=rounding)
+    capacity = capacity[valid]
+    return np.concatenate([[capacity.mean()], np.percentile(capacity, PERCENTILES)])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Accuracy of the sampling designs at equal sample size.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1024, 4096, 16384, 65536], help="samples")
+    parser.add_argument("--replicates", type=int, default=10, help="randomised replicates per size")
+    parser.add_argument("--reference", type=int, default=2 ** 22, help="samples of the reference")
+    parser.add_argument("--rtol", type=float, default=5e-3, help="tolerance of run_sampling")
+    args = parser.parse_args(argv)
+
+    cholesky = cholesky_factor(VARIABLES, CORRELATION)
+    reference = np.mean([statistics(SAMPLERS['random'](len(VARIABLES), seed), args.reference // 4, cholesky)
+                         for seed in range(4)], axis=0)
+    labels = ["mean"] + [f"p{p}" for p in PERCENTILES]
+    print(f"reference ({args.reference} plain Monte Carlo samples): "
+          + ", ".join(f"{label} {value:.1f}" for label, value in zip(labels, reference)) + " kPa")
+
+    print(f"{'method':<8}{'n':>8}" + "".join(f"{label + ' err':>11}" for label in labels)
+          + "   efficiency vs random")
+    for n in args.sizes:
+        rmse = {}
+        for method in SAMPLERS:
+            estimates = [statistics(SAMPLERS[method](len(VARIABLES), 1000 + seed), n, cholesky)
+                         for seed in range(args.replicates)]
+            rmse[method] = np.sqrt(np.mean((np.array(estimates) - reference) ** 2, axis=0))
+            efficiency = (rmse['random'] / rmse[method]) ** 2
+            print(f"{method:<8}{n:>8}" + "".join(f"{e / abs(r):>11.2e}" for e, r in zip(rmse[method], reference))
+                  + "   " + " ".join(f"{value:.1f}" for value in efficiency))
+
+    print(f"\nrun_sampling until the percentiles change by less than {args.rtol:g} for 2 rounds "
+          f"({args.replicates} seeds):")
+    print(f"{'method':<8}{'median samples':>16}{'converged':>11}{'median largest error':>22}")
+    for method in SAMPLERS:
+        results = [run_sampling(VARIABLES, FIXED, CORRELATION, method=method, percentiles=PERCENTILES,
+                                rtol=args.rtol, seed=seed, rounding=False) for seed in range(args.replicates)]
+        errors = [np.max(np.abs(result.values - reference[1:]) / reference[1:]) for result in results]
+        print(f"{method:<8}{np.median([result.samples for result in results]):>16.0f}"
+              f"{sum(result.converged for result in results):>8} / {len(results)}{np.median(errors):>22.1e}")
+
+
+if __name__ == "__main__":
+    main()
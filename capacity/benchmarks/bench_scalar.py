@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Compare the per-call latency of the scalar bearing capacity paths for one representative footing:
+bs_ultbearing (panda series in, strings and data frame out), bs_ultbearing_core (floats in, BearingResult out)
+and bs_ultbearing_fast with and without rounding.
+
+Run from the capacity folder:
+    python benchmarks/bench_scalar.py [--number N] [--repeat R]
+
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bearing_formula import bs_ultbearing, bs_ultbearing_core
+from bearing_fast import bs_ultbearing_fast
+
+# Representative footing: 2 m x 3 m pad at 1 m depth on c'-phi' soil with inclined eccentric load
+FOOTING = dict(width=2.0, length=3.0, cohesion=5.0, friction=30.0, gamma=19.0, depth=1.0, water_depth=1.5,
+               vertical_load=1500.0, horizontal_load_W=100.0, horizontal_load_L=50.0, moment_W=120.0,
+               moment_L=60.0, shear_modulus=12000.0, slope=0.0, tilt=0.0, surcharge=10.0,
+               drainage="Drained analysis", roughness="Rough", thickness=0.5)
+
+
+def footing_series(footing):
+    """Return the five panda series expected by bs_ultbearing."""
+    f = footing
+    return (pd.Series([f['width'], f['length'], f['thickness']]),
+            pd.Series([f['cohesion'], f['friction'], f['gamma'], f['shear_modulus']]),
+            pd.Series([f['depth'], f['slope'], f['tilt'], f['water_depth']]),
+            pd.Series([f['vertical_load'], f['horizontal_load_W'], f['horizontal_load_L'],
+                       f['moment_W'], f['moment_L']]),
+            pd.Series([f['surcharge'], f['drainage'], f['roughness']], dtype=object))
+
+
+def time_call(func, number, repeat):
+    """Return the best per-call time in microseconds."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--number", type=int, default=2000, help="calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timing runs, the best is reported")
+    args = parser.parse_args(argv)
+
+    series = footing_series(FOOTING)
+    buffer = np.empty((7, 6))
+
+    # the fast path must agree with the current path before its timing means anything
+    reference = bs_ultbearing_core(**FOOTING)
+    fast = bs_ultbearing_fast(**FOOTING)
+    assert fast.capacity == reference.capacity and np.array_equal(fast.factors, reference.factors)
+
+    cases = [
+        ("bs_ultbearing (series, strings)", lambda: bs_ultbearing(*series)),
+        ("bs_ultbearing_core", lambda: bs_ultbearing_core(**FOOTING)),
+        ("bs_ultbearing_fast", lambda: bs_ultbearing_fast(**FOOTING)),
+        ("bs_ultbearing_fast, out buffer", lambda: bs_ultbearing_fast(**FOOTING, out=buffer)),
+        ("bs_ultbearing_fast, no rounding", lambda: bs_ultbearing_fast(**FOOTING, rounding=False)),
+    ]
+
+    baseline = None
+    print(f"{'path':<36}{'us/call':>10}{'speedup':>10}")
+    for name, func in cases:
+        per_call = time_call(func, args.number, args.repeat)
+        baseline = baseline or per_call
+        print(f"{name:<36}{per_call:>10.2f}{baseline / per_call:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
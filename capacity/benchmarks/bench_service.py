@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Load test of the local calculation service: start service.py in a subprocess, send single footing requests
+from a number of concurrent keep-alive connections for a fixed time, and report the request rate, the latency
+percentiles seen by the client and the mean batch size from /metrics.  For comparison, the time of one
+Python process per request (start, import, one bs_ultbearing_core call) is measured as well, and a sample of
+the service results is checked against bs_ultbearing_batch.
+
+Run from the capacity folder:
+    python benchmarks/bench_service.py [--connections 1 16 64] [--seconds 3] [--workers 1]
+
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+CAPACITY_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, CAPACITY_DIR)
+
+from bearing_batch import bs_ultbearing_batch
+from bench_suite import footing, population
+
+# One process per request, as a tool shelling out to Python would do
+PROCESS_CALL = ("from bearing_formula import bs_ultbearing_core; "
+                "print(bs_ultbearing_core(width=2.0, length=3.0, cohesion=5.0, friction=30.0, gamma=19.0, "
+                "depth=1.0, water_depth=1.5, vertical_load=1500.0).capacity)")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def request(reader, writer, method, path, payload=None):
+    """Send one request on an open connection and return the decoded JSON answer."""
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    await reader.readline()
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return json.loads(await reader.readexactly(length))
+
+
+async def client(port, footings, stop, latencies, results):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    i = 0
+    while time.perf_counter() < stop:
+        index = (id(latencies) + i) % len(footings)
+        started = time.perf_counter()
+        answer = await request(reader, writer, "POST", "/capacity", footings[index])
+        latencies.append(time.perf_counter() - started)
+        results[index] = answer['capacity']
+        i += 1
+    writer.close()
+
+
+async def load(port, footings, connections, seconds):
+    """Run connections clients for seconds and return the latencies and the mean batch size of the run."""
+    latencies, results = [], {}
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    before = await request(reader, writer, "GET", "/metrics")
+    stop = time.perf_counter() + seconds
+    await asyncio.gather(*(client(port, footings[k::connections], stop, latencies, results)
+                           for k in range(connections)))
+    after = await request(reader, writer, "GET", "/metrics")
+    writer.close()
+    mean_batch = (after['footings'] - before['footings']) / max(after['batches'] - before['batches'], 1)
+    return np.array(latencies), mean_batch
+
+
+async def wait_ready(port, timeout=60.0):
+    stop = time.perf_counter() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            await request(reader, writer, "GET", "/health")
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > stop:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def check_results(port, pop, n):
+    """Compare n footings sent as one list with bs_ultbearing_batch."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    answer = await request(reader, writer, "POST", "/capacity", {'footings': [footing(pop, i) for i in range(n)]})
+    writer.close()
+    expected = bs_ultbearing_batch({name: values[:n] for name, values in pop.items()}).capacity
+    returned = np.array([np.nan if r['capacity'] is None else r['capacity'] for r in answer['results']])
+    return np.array_equal(returned, np.where(np.isfinite(expected), expected, np.nan), equal_nan=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test of the local calculation service.")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 16, 64], help="concurrent clients")
+    parser.add_argument("--seconds", type=float, default=3.0, help="duration of each load run")
+    parser.add_argument("--workers", type=int, default=1, help="service worker processes")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    for _ in range(3):
+        subprocess.run([sys.executable, "-c", PROCESS_CALL], cwd=CAPACITY_DIR, check=True, capture_output=True)
+    print(f"one process per request: {(time.perf_counter() - started) / 3 * 1e3:.0f} ms per request")
+
+    pop = population(5000, seed=1)
+    footings = [footing(pop, i) for i in range(5000)]
+    port = free_port()
+    server = subprocess.Popen([sys.executable, "service.py", "--port", str(port), "--workers", str(args.workers)],
+                              cwd=CAPACITY_DIR, stderr=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_ready(port))
+        print(f"results match bs_ultbearing_batch: {asyncio.run(check_results(port, pop, 1000))}")
+        print(f"{'connections':>12}{'requests/s':>12}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'mean batch':>12}")
+        for connections in args.connections:
+            latencies, mean_batch = asyncio.run(load(port, footings, connections, args.seconds))
+            print(f"{connections:>12}{len(latencies) / args.seconds:>12.0f}"
+                  f"{np.percentile(latencies, 50) * 1e3:>9.2f}{np.percentile(latencies, 95) * 1e3:>9.2f}"
+                  f"{np.percentile(latencies, 99) * 1e3:>9.2f}{mean_batch:>12.1f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Benchmark suite for the bearing capacity calculation and the pdf report.  It times bearing_f, every factor
+function, bs_ultbearing end to end (and the core, fast and batch paths) on synthetic footing populations of
+several sizes, plus compile_content_page, prepare_frontpage and combine_pdf when reportlab and PyPDF2 are
+installed.
+
+Before timing, the outputs are checked against golden_values.json so that a speed-up cannot silently change
+capacities.  Results are written to benchmarks/results/ as json and compared with the previous run.
+
+Run from the capacity folder:
+    python benchmarks/bench_suite.py [--sizes 1 1000 100000] [--scalar-max 1000] [--compare FILE]
+    python benchmarks/bench_suite.py --update-golden     (only after an intended change of the formulas)
+
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import glob
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CAPACITY_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, CAPACITY_DIR)
+
+from bearing_formula import (bearing_f, bearing_f_cache_clear, rigidity_f, shape_f, inclination_f,
+                             foundation_tilt_f, surface_slope_f, depth_f, bs_ultbearing, bs_ultbearing_core)
+from bearing_batch import INPUT_COLUMNS, bs_ultbearing_batch
+from bearing_fast import bs_ultbearing_fast
+
+GOLDEN_PATH = os.path.join(BENCH_DIR, "golden_values.json")
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+GOLDEN_SIZE, GOLDEN_SEED = 200, 12345
+
+
+def population(n, seed=0):
+    """
+    Create a synthetic population of n pad footings with the input columns of bs_ultbearing_batch.
+    Values cover the usual design range; zero cohesion together with zero friction is avoided.
+    """
+    rng = np.random.default_rng(seed)
+    width = rng.uniform(0.8, 4.0, n).round(2)
+    return {
+        'width': width,
+        'length': (width * rng.uniform(1.0, 3.0, n)).round(2),
+        'thickness': rng.choice([0.4, 0.6, 0.8], n),
+        'cohesion': rng.choice([0.0, 2.0, 5.0, 10.0, 25.0], n),
+        'friction': rng.uniform(22.0, 40.0, n).round(1),
+        'gamma': rng.uniform(17.0, 21.0, n).round(1),
+        'shear_modulus': rng.choice([12000.0, 6000.0, 400.0], n),
+        'depth': rng.uniform(0.5, 2.5, n).round(2),
+        'slope': rng.choice([0.0, 0.0, 5.0, 10.0], n),
+        'tilt': rng.choice([0.0, 0.0, 3.0], n),
+        'water_depth': rng.uniform(0.0, 6.0, n).round(2),
+        'vertical_load': rng.uniform(300.0, 5000.0, n).round(0),
+        'horizontal_load_W': rng.uniform(0.0, 150.0, n).round(0),
+        'horizontal_load_L': rng.choice([0.0, 0.0, 40.0, 80.0], n),
+        'moment_W': rng.uniform(0.0, 200.0, n).round(0),
+        'moment_L': rng.uniform(0.0, 100.0, n).round(0),
+        'surcharge': rng.choice([0.0, 10.0, 20.0], n),
+        'drainage': rng.choice(["Drained analysis", "Undrained Analysis"], n),
+        'roughness': rng.choice(["Rough", "Smooth"], n),
+    }
+
+
+def footing(pop, i):
+    """Return footing i of a population as a dict of Python scalars."""
+    return {name: pop[name][i].item() for name in INPUT_COLUMNS}
+
+
+def footing_series(f):
+    """Return the five panda series expected by bs_ultbearing."""
+    import pandas as pd
+
+    return (pd.Series([f['width'], f['length'], f['thickness']]),
+            pd.Series([f['cohesion'], f['friction'], f['gamma'], f['shear_modulus']]),
+            pd.Series([f['depth'], f['slope'], f['tilt'], f['water_depth']]),
+            pd.Series([f['vertical_load'], f['horizontal_load_W'], f['horizontal_load_L'],
+                       f['moment_W'], f['moment_L']]),
+            pd.Series([f['surcharge'], f['drainage'], f['roughness']], dtype=object))
+
+
+# Golden values
+
+def golden_values():
+    """Compute the reference outputs of the golden population with bs_ultbearing_core."""
+    pop = population(GOLDEN_SIZE, GOLDEN_SEED)
+    records = []
+    for i in range(GOLDEN_SIZE):
+        result = bs_ultbearing_core(**footing(pop, i))
+        records.append({'capacity': result.capacity, 'capacity_d': result.capacity_d,
+                        'capacity_ud': result.capacity_ud, 'eff_width': result.eff_width,
+                        'eff_length': result.eff_length, 'factors': result.factors.tolist()})
+    return {'size': GOLDEN_SIZE, 'seed': GOLDEN_SEED, 'records': records}
+
+
+def check_golden():
+    """
+    Compare bs_ultbearing, bs_ultbearing_core, bs_ultbearing_fast and bs_ultbearing_batch with the golden values.
+
+    Returns:
+        failures - list of strings describing every mismatch
+    """
+    with open(GOLDEN_PATH) as f:
+        golden = json.load(f)
+    pop = population(golden['size'], golden['seed'])
+    records = golden['records']
+    expected = np.array([record['capacity'] for record in records])
+    expected_factors = np.array([record['factors'] for record in records])
+    failures = []
+
+    batch = bs_ultbearing_batch(**pop)
+    if not np.array_equal(batch.capacity, expected):
+        failures.append("bs_ultbearing_batch capacity differs from the golden values")
+    if not np.allclose(batch.factors, expected_factors, rtol=0, atol=1e-12):
+        failures.append("bs_ultbearing_batch factors differ from the golden values")
+
+    for i, record in enumerate(records):
+        f = footing(pop, i)
+        core = bs_ultbearing_core(**f)
+        fast = bs_ultbearing_fast(**f)
+        text = bs_ultbearing(*footing_series(f))[1]
+        text_capacity = float(re.search(r"is (\S+) kPa", text).group(1))
+        for name, capacity in (("bs_ultbearing", text_capacity), ("bs_ultbearing_core", core.capacity),
+                               ("bs_ultbearing_fast", fast.capacity)):
+            if capacity != record['capacity']:
+                failures.append(f"{name} footing {i}: {capacity} kPa, golden {record['capacity']} kPa")
+        for name, result in (("bs_ultbearing_core", core), ("bs_ultbearing_fast", fast)):
+            if (result.eff_width, result.eff_length) != (record['eff_width'], record['eff_length']) or \
+                    not np.array_equal(result.factors, expected_factors[i]):
+                failures.append(f"{name} footing {i}: effective dimensions or factors differ")
+    return failures
+
+
+# Timings
+
+def best_time(func, repeat):
+    """Return the fastest of repeat runs of func in seconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return min(times)
+
+
+def scalar_benchmarks(pop, n):
+    """Return (name, function) pairs that loop over the first n footings of pop with the scalar functions."""
+    footings = [footing(pop, i) for i in range(n)]
+    series = [footing_series(f) for f in footings]
+
+    def loop(call):
+        return lambda: [call(f) for f in footings]
+
+    def cold_bearing_f():
+        bearing_f_cache_clear()
+        for f in footings:
+            bearing_f(f['friction'], f['roughness'], f['slope'])
+
+    return [
+        ("bearing_f (cold cache)", cold_bearing_f),
+        ("bearing_f", loop(lambda f: bearing_f(f['friction'], f['roughness'], f['slope']))),
+        ("rigidity_f", loop(lambda f: rigidity_f(f['cohesion'], f['friction'], f['width'], f['length'], f['depth'],
+                                                 f['gamma'], f['surcharge'], f['shear_modulus']))),
+        ("shape_f", loop(lambda f: shape_f(f['friction'], f['width'], f['length']))),
+        ("inclination_f", loop(lambda f: inclination_f(f['vertical_load'], f['horizontal_load_W'],
+                                                       f['horizontal_load_L'], f['moment_W'], f['moment_L'],
+                                                       f['cohesion'], f['friction'], f['width'], f['length']))),
+        ("foundation_tilt_f", loop(lambda f: foundation_tilt_f(f['friction'], f['tilt']))),
+        ("surface_slope_f", loop(lambda f: surface_slope_f(f['friction'], f['slope']))),
+        ("depth_f", loop(lambda f: depth_f(f['friction'], f['width'], f['depth']))),
+        ("bs_ultbearing", lambda: [bs_ultbearing(*s) for s in series]),
+        ("bs_ultbearing_core", loop(lambda f: bs_ultbearing_core(**f))),
+        ("bs_ultbearing_fast", loop(lambda f: bs_ultbearing_fast(**f))),
+    ]
+
+
+def report_benchmarks(pop, n):
+    """
+    Return (name, function) pairs generating n pdf reports, or an empty list when reportlab or PyPDF2
+    is not installed.  The functions run in a temporary folder holding a copy of the templates.
+    """
+    try:
+        from savepdf import compile_content_page, prepare_frontpage, combine_pdf
+    except ImportError as e:
+        print(f"Skipping report benchmarks: {e}")
+        return []
+
+    footings = [footing(pop, i) for i in range(n)]
+    series = [footing_series(f) for f in footings]
+    tables, messages = [], []
+    for f, s in zip(footings, series):
+        warnings, capacity, eff_width, eff_length, table = bs_ultbearing(*s)
+        tables.append(table)
+        messages.append(f"{warnings}<br/><br/>{capacity}<br/>{eff_width}<br/>{eff_length}")
+    titles = [["Benchmark", "B-001", f"F{i}"] for i in range(n)]
+
+    def content():
+        for s, table, title, message in zip(series, tables, titles, messages):
+            compile_content_page(s[0], s[1], s[2], s[3], table, title, message)
+
+    def frontpage():
+        for title in titles:
+            prepare_frontpage(title)
+
+    def combine():
+        for title in titles:
+            # combine_pdf removes its inputs, so they are recreated outside the timed call
+            compile_content_page(series[0][0], series[0][1], series[0][2], series[0][3], tables[0], title,
+                                 messages[0])
+            prepare_frontpage(title)
+            started = time.perf_counter()
+            combine_pdf("bearing_report_" + title[2], "reports/temp_frontpage", "reports/content_page")
+            combine.elapsed += time.perf_counter() - started
+
+    return [("compile_content_page", content), ("prepare_frontpage", frontpage), ("combine_pdf", combine)]
+
+
+def run_benchmarks(sizes, scalar_max, report_max, repeat):
+    """Run all benchmarks and return a list of result dicts."""
+    results = []
+
+    def record(name, size, seconds):
+        per_item = seconds / size * 1e6
+        results.append({'name': name, 'size': size, 'seconds': seconds, 'us_per_footing': per_item})
+        print(f"{name:<28}{size:>8}{seconds * 1000:>12.2f}{per_item:>14.2f}")
+
+    print(f"{'benchmark':<28}{'size':>8}{'total ms':>12}{'us/footing':>14}")
+    for size in sizes:
+        pop = population(size)
+        batch_columns = {name: pop[name] for name in INPUT_COLUMNS}
+        record("bs_ultbearing_batch", size, best_time(lambda: bs_ultbearing_batch(**batch_columns), repeat))
+        if size <= scalar_max:
+            for name, func in scalar_benchmarks(pop, size):
+                record(name, size, best_time(func, repeat))
+
+    report_sizes = [size for size in sizes if size <= report_max]
+    if report_sizes:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as folder:
+            shutil.copytree(os.path.join(CAPACITY_DIR, "templates"), os.path.join(folder, "templates"))
+            os.chdir(folder)
+            try:
+                for size in report_sizes:
+                    for name, func in report_benchmarks(population(size), size):
+                        # savepdf prints a line per file, which is kept out of the results table
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            if name == "combine_pdf":
+                                func.elapsed = 0.0
+                                func()
+                                seconds = func.elapsed
+                            else:
+                                seconds = best_time(func, repeat)
+                        record(name, size, seconds)
+            finally:
+                os.chdir(cwd)
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=CAPACITY_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, previous_path):
+    """Print the change of every benchmark against a previous results file."""
+    with open(previous_path) as f:
+        previous = {(r['name'], r['size']): r['seconds'] for r in json.load(f)['results']}
+    print(f"\nCompared with {os.path.basename(previous_path)} (positive = slower):")
+    for r in results:
+        before = previous.get((r['name'], r['size']))
+        if before:
+            print(f"{r['name']:<28}{r['size']:>8}{(r['seconds'] / before - 1) * 100:>+11.1f}%")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark suite for the bearing capacity calculation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1000, 100000], help="population sizes")
+    parser.add_argument("--scalar-max", type=int, default=1000,
+                        help="largest population timed with the scalar (per footing) functions")
+    parser.add_argument("--report-max", type=int, default=10, help="largest population timed for pdf reports")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the fastest is reported")
+    parser.add_argument("--compare", help="results file to compare with (default: the latest in results/)")
+    parser.add_argument("--no-save", action="store_true", help="do not write a results file")
+    parser.add_argument("--update-golden", action="store_true", help="rewrite golden_values.json and exit")
+    args = parser.parse_args(argv)
+
+    if args.update_golden:
+        golden = golden_values()
+        records = golden.pop('records')
+        # one footing per line keeps the file readable in diffs
+        with open(GOLDEN_PATH, "w") as f:
+            f.write(json.dumps(golden)[:-1] + ', "records": [\n')
+            f.write(",\n".join(json.dumps(record) for record in records))
+            f.write("\n]}\n")
+        print(f"Golden values written to {GOLDEN_PATH}")
+        return 0
+
+    failures = check_golden()
+    if failures:
+        print("Golden value check FAILED:")
+        for failure in failures[:20]:
+            print("  " + failure)
+        return 1
+    print(f"Golden value check passed ({GOLDEN_SIZE} footings).\n")
+
+    results = run_benchmarks(args.sizes, args.scalar_max, args.report_max, args.repeat)
+
+    previous_path = args.compare or max(glob.glob(os.path.join(RESULTS_DIR, "*.json")), default=None)
+    if previous_path:
+        compare(results, previous_path)
+
+    if not args.no_save:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        revision = git_revision()
+        path = os.path.join(RESULTS_DIR, f"{stamp}_{revision}.json")
+        with open(path, "w") as f:
+            json.dump({'timestamp': stamp, 'git_revision': revision, 'python': platform.python_version(),
+                       'numpy': np.__version__, 'machine': platform.machine(), 'results': results}, f, indent=1)
+        print(f"\nResults written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
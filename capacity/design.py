@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Size footings for a required factor of safety.  The factor of safety is the ultimate bearing capacity divided by
+the applied pressure N / (B' x L') on the effective area, where B' and L' are the effective dimensions from the
+load eccentricities used by inclination_f.  The width is found with a vectorized bisection over all footings at
+once, so the number of capacity evaluations is fixed by the width bracket and tolerance rather than by the
+number of footings.
+
+"""
+
+import collections
+import math
+import numpy as np
+
+from bearing_batch import bs_ultbearing_batch
+
+DesignResult = collections.namedtuple('DesignResult',
+                                      ['width', 'length', 'capacity', 'pressure', 'fos', 'feasible', 'evaluations'])
+DesignResult.__doc__ = """
+    Results of min_width.
+
+    Fields:
+        width, length - n np arrays of the minimum footing dimensions in m (nan where not feasible)
+        capacity - n np array of the ultimate bearing capacity at that width in kPa
+        pressure - n np array of the applied pressure on the effective area in kPa
+        fos - n np array of the factor of safety achieved
+        feasible - n boolean np array, False where the upper width bound does not reach the required fos
+                   (width, length, capacity, pressure and fos are then nan)
+        evaluations - number of batch capacity evaluations used
+    """
+
+
+def factor_of_safety(result, vertical_load):
+    """
+    Compute the applied pressure on the effective area and the factor of safety of a batch result.
+
+    Parameters:
+        result - BatchResult returned by bs_ultbearing_batch
+        vertical_load - np array in kN
+
+    Returns:
+        pressure - n np array in kPa
+        fos - n np array, zero where the effective area vanishes
+    """
+    eff_area = result.eff_width * result.eff_length
+    valid = (result.eff_width > 0) & (result.eff_length > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pressure = np.where(valid, vertical_load / eff_area, np.inf)
+        fos = np.where(valid, result.capacity / pressure, 0.0)
+    return pressure, np.nan_to_num(fos, nan=0.0)
+
+
+def min_width(frame=None, fos=3.0, ratio=None, width_bounds=(0.1, 20.0), tol=0.001, rounding=True, **columns):
+    """
+    Find the minimum footing width giving at least the required factor of safety, for many footings at once.
+    The inputs are given as for bs_ultbearing_batch without the width.  The length is either a fixed input
+    column or, when ratio is given, ratio x width.
+
+    Parameters:
+        frame - optional panda dataframe (or dict of arrays) with one row per footing
+        fos - required factor of safety, float or np array
+        ratio - optional L / B ratio, float or np array; when None the length column is used
+        width_bounds - (lower, upper) width bracket in m, floats or np arrays; with a fixed length the upper
+                       bound is at most the length
+        tol - width tolerance in m
+        rounding - passed to bs_ultbearing_batch
+        columns - np arrays or scalar values keyed by the names in bearing_batch.INPUT_COLUMNS
+
+    Returns:
+        DesignResult - named tuple of np arrays
+    """
+    columns.pop('width', None)
+    if ratio is not None:
+        columns.pop('length', None)
+    vertical_load = np.asarray(columns['vertical_load'] if 'vertical_load' in columns else frame['vertical_load'],
+                               dtype=float)
+
+    evaluations = 0
+
+    def evaluate(width):
+        nonlocal evaluations
+        evaluations += 1
+        dimensions = {'width': width}
+        if ratio is not None:
+            dimensions['length'] = ratio * width
+        result = bs_ultbearing_batch(frame, rounding=rounding, **columns, **dimensions)
+        pressure, achieved = factor_of_safety(result, vertical_load)
+        return result, pressure, achieved
+
+    lower, upper = (np.asarray(bound, dtype=float) for bound in width_bounds)
+    if ratio is None:
+        # the factor of safety is not monotonic in a width beyond the fixed length, so the bracket ends there
+        fixed_length = np.asarray(columns['length'] if 'length' in columns else frame['length'], dtype=float)
+        upper = np.minimum(upper, fixed_length)
+        lower = np.minimum(lower, upper)
+    result, _, achieved = evaluate(upper)
+    size = result.capacity.shape
+    lower, upper = np.broadcast_to(lower, size), np.broadcast_to(upper, size)
+    fos = np.broadcast_to(np.asarray(fos, dtype=float), size)
+    feasible = achieved >= fos
+
+    # footings which already satisfy the requirement at the lower bound need no search
+    _, _, achieved = evaluate(lower)
+    done_low = achieved >= fos
+    width_lower = lower
+
+    # bisection keeps lower on the failing side and upper on the passing side of the required fos
+    iterations = math.ceil(math.log2(np.max(upper - lower) / tol)) if size[0] else 0
+    for _ in range(max(iterations, 0)):
+        middle = 0.5 * (lower + upper)
+        _, _, achieved = evaluate(middle)
+        passing = achieved >= fos
+        upper = np.where(passing, middle, upper)
+        lower = np.where(passing, lower, middle)
+
+    feasible = feasible | done_low
+    width = np.where(done_low, width_lower, np.where(feasible, upper, np.nan))
+    result, pressure, achieved = evaluate(np.where(feasible, width, upper))
+
+    if ratio is not None:
+        length = ratio * width
+    else:
+        length = np.where(feasible, np.broadcast_to(fixed_length, size), np.nan)
+
+    # footings without a solution report nan rather than the values at the upper bound
+    capacity, pressure, achieved = (np.where(feasible, values, np.nan)
+                                    for values in (result.capacity, pressure, achieved))
+    return DesignResult(width, length, capacity, pressure, achieved, feasible, evaluations)
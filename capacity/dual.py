@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Forward-mode automatic differentiation for np arrays.  A Dual holds an array of values together with their
+derivatives with respect to k independent variables, and implements the NumPy ufunc and function protocols
+for the operations used by the vectorized bearing capacity functions of bearing_batch, so that those
+functions propagate exact derivatives without being written twice:
+
+    width, friction = Dual.variables([np.array([2.0, 3.0]), np.array([30.0, 35.0])])
+    y = width * np.tan(np.radians(friction))
+    y.value, y.gradient(2)  # row 0: dy/dwidth, row 1: dy/dfriction
+
+Comparisons act on the values and np.where selects the derivatives of the branch taken, so the derivative at
+a switch between formulas (e.g. rigid / not rigid) is that of the formula in use.  Where a derivative is
+infinite but the value it multiplies does not vary (e.g. sqrt at 0 with zero horizontal load), the product
+is taken as 0.
+
+Every Dual keeps the derivatives of only those variables it depends on (index), so that e.g. the bearing
+factors, which depend on the friction angle alone, carry one derivative row instead of one per input.
+
+"""
+
+import numpy as np
+
+
+class Dual:
+    """
+    Values with their derivatives with respect to some of k independent variables.
+
+    Parameters:
+        value - np array of shape s
+        tangent - np array of shape (m,) + s, derivatives of value with respect to the variables in index
+        index - sorted tuple of the m variable numbers the value depends on
+
+    Attributes:
+        value, tangent, index - as the parameters
+    """
+
+    def __init__(self, value, tangent, index):
+        self.value = np.asarray(value, dtype=float)
+        self.tangent = np.asarray(tangent, dtype=float)
+        self.index = tuple(index)
+
+    @classmethod
+    def variables(cls, values):
+        """
+        Create independent variables numbered 0 to k - 1: derivative 1 with respect to itself.
+
+        Parameters:
+            values - sequence of k np arrays
+
+        Returns:
+            variables - list of k Duals
+        """
+        return [cls(value, np.ones((1,) + np.shape(value)), (i,)) for i, value in enumerate(values)]
+
+    def gradient(self, k):
+        """Return the k x s np array of derivatives with respect to all k variables (0 for the others)."""
+        gradient = np.zeros((k,) + self.shape)
+        gradient[list(self.index)] = self.tangent
+        return gradient
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, derivatives with respect to variables {self.index})"
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        return Dual(self.value[key], self.tangent[(slice(None),) + key], self.index)
+
+    def astype(self, dtype):
+        """Return self for float, as the values are always float."""
+        if np.dtype(dtype) != np.float64:
+            raise TypeError("A Dual holds float values only")
+        return self
+
+    def prod(self, axis):
+        """Product along axis, with the derivative sum_i t_i prod_(j != i) v_j (safe for zero values)."""
+        axis = axis % self.ndim
+        ones = np.ones_like(np.take(self.value, [0], axis=axis))
+        before = np.cumprod(np.concatenate([ones, self.value], axis=axis), axis=axis)
+        after = np.flip(np.cumprod(np.flip(np.concatenate([self.value, ones], axis=axis), axis), axis=axis), axis)
+        n = self.value.shape[axis]
+        others = np.take(before, range(n), axis=axis) * np.take(after, range(1, n + 1), axis=axis)
+        return Dual(self.value.prod(axis=axis), (self.tangent * others).sum(axis=axis + 1), self.index)
+
+    # Arithmetic operators go through the ufuncs
+    def __add__(self, other):
+        return np.add(self, other)
+
+    def __radd__(self, other):
+        return np.add(other, self)
+
+    def __sub__(self, other):
+        return np.subtract(self, other)
+
+    def __rsub__(self, other):
+        return np.subtract(other, self)
+
+    def __mul__(self, other):
+        return np.multiply(self, other)
+
+    def __rmul__(self, other):
+        return np.multiply(other, self)
+
+    def __truediv__(self, other):
+        return np.true_divide(self, other)
+
+    def __rtruediv__(self, other):
+        return np.true_divide(other, self)
+
+    def __pow__(self, other):
+        return np.power(self, other)
+
+    def __rpow__(self, other):
+        return np.power(other, self)
+
+    def __neg__(self):
+        return np.negative(self)
+
+    def __eq__(self, other):
+        return np.equal(self, other)
+
+    def __ne__(self, other):
+        return np.not_equal(self, other)
+
+    def __lt__(self, other):
+        return np.less(self, other)
+
+    def __le__(self, other):
+        return np.less_equal(self, other)
+
+    def __gt__(self, other):
+        return np.greater(self, other)
+
+    def __ge__(self, other):
+        return np.greater_equal(self, other)
+
+    __hash__ = None
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        if ufunc in _COMPARISONS:
+            return ufunc(*[_value(x) for x in inputs])
+        if ufunc in _UNARY:
+            x = inputs[0]
+            result = ufunc(x.value)
+            return _combine(result, _chain(_tangent(x, result.ndim), _UNARY[ufunc](x.value, result)))
+        if ufunc in _BINARY:
+            return _BINARY[ufunc](*inputs)
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _FUNCTIONS:
+            return NotImplemented
+        return _FUNCTIONS[func](*args, **kwargs)
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _tangent(x, ndim):
+    # (index, derivatives) of x aligned to a result of ndim dimensions, None for a constant
+    if not isinstance(x, Dual):
+        return None
+    return x.index, x.tangent.reshape(x.tangent.shape[:1] + (1,) * (ndim - x.ndim) + x.tangent.shape[1:])
+
+
+def _chain(term, derivative):
+    # derivatives x derivative, 0 where the derivatives are 0 even if the derivative is not finite
+    if term is None:
+        return None
+    index, tangent = term
+    product = tangent * derivative
+    if not np.all(np.isfinite(derivative)):
+        product = np.where(tangent == 0, 0.0, product)
+    return index, product
+
+
+def _expand(term, index, shape):
+    # derivatives of term as rows of the variables in index, 0 for the variables term does not depend on
+    term_index, tangent = term
+    if term_index == index:
+        return np.broadcast_to(tangent, shape)
+    expanded = np.zeros(shape)
+    expanded[[index.index(i) for i in term_index]] = tangent
+    return expanded
+
+
+def _combine(value, *terms):
+    # Dual of value with the sum of the derivative terms that are not None
+    terms = [term for term in terms if term is not None]
+    index = tuple(sorted(set().union(*(term_index for term_index, _ in terms))))
+    shape = (len(index),) + np.shape(value)
+    tangent = _expand(terms[0], index, shape)
+    for term in terms[1:]:
+        if term[0] == index:
+            tangent = tangent + term[1]
+        else:
+            tangent = tangent + _expand(term, index, shape)
+    return Dual(value, tangent, index)
+
+
+def _add(a, b):
+    value = _value(a) + _value(b)
+    return _combine(value, _tangent(a, value.ndim), _tangent(b, value.ndim))
+
+
+def _subtract(a, b):
+    value = _value(a) - _value(b)
+    return _combine(value, _tangent(a, value.ndim), _chain(_tangent(b, value.ndim), -1.0))
+
+
+def _multiply(a, b):
+    value = _value(a) * _value(b)
+    return _combine(value, _chain(_tangent(a, value.ndim), _value(b)), _chain(_tangent(b, value.ndim), _value(a)))
+
+
+def _divide(a, b):
+    value = _value(a) / _value(b)
+    return _combine(value, _chain(_tangent(a, value.ndim), 1 / _value(b)),
+                    _chain(_tangent(b, value.ndim), -value / _value(b)))
+
+
+def _power(a, b):
+    base, exponent = _value(a), _value(b)
+    value = base ** exponent
+    term_a, term_b = _tangent(a, value.ndim), _tangent(b, value.ndim)
+    return _combine(value, term_a and _chain(term_a, exponent * base ** (exponent - 1)),
+                    term_b and _chain(term_b, value * np.log(base)))
+
+
+def _where(condition, a, b):
+    condition = _value(condition)
+    value = np.where(condition, _value(a), _value(b))
+    terms = [_tangent(x, value.ndim) for x in (a, b)]
+    index = tuple(sorted(set().union(*(term[0] for term in terms if term is not None))))
+    shape = (len(index),) + value.shape
+    tangent_a, tangent_b = [0.0 if term is None else _expand(term, index, shape) for term in terms]
+    return Dual(value, np.where(condition, tangent_a, tangent_b), index)
+
+
+def _stack(arrays, axis=0):
+    value = np.stack([_value(x) for x in arrays], axis=axis)
+    axis = axis % value.ndim
+    index = tuple(sorted(set().union(*(x.index for x in arrays if isinstance(x, Dual)))))
+    shape = (len(index),) + value.shape[:axis] + value.shape[axis + 1:]
+    tangents = [_expand(_tangent(x, len(shape) - 1), index, shape) if isinstance(x, Dual) else np.zeros(shape)
+                for x in arrays]
+    return Dual(value, np.stack(tangents, axis=axis + 1), index)
+
+
+def _broadcast_to(x, shape):
+    shape = tuple(shape)
+    return Dual(np.broadcast_to(x.value, shape),
+                np.broadcast_to(_tangent(x, len(shape))[1], x.tangent.shape[:1] + shape), x.index)
+
+
+def _atleast_1d(x):
+    return x if x.ndim else x[np.newaxis]
+
+
+# Derivatives of the unary ufuncs, as functions of the argument and the result
+_UNARY = {
+    np.negative: lambda x, y: -1.0,
+    np.exp: lambda x, y: y,
+    np.log: lambda x, y: 1 / x,
+    np.log10: lambda x, y: 1 / (x * np.log(10)),
+    np.sqrt: lambda x, y: 0.5 / y,
+    np.sin: lambda x, y: np.cos(x),
+    np.cos: lambda x, y: -np.sin(x),
+    np.tan: lambda x, y: 1 + y * y,
+    np.arctan: lambda x, y: 1 / (1 + x * x),
+    np.radians: lambda x, y: np.pi / 180,
+    np.deg2rad: lambda x, y: np.pi / 180,
+    np.absolute: lambda x, y: np.sign(x),
+}
+_BINARY = {np.add: _add, np.subtract: _subtract, np.multiply: _multiply, np.true_divide: _divide,
+           np.power: _power}
+_COMPARISONS = (np.equal, np.not_equal, np.less, np.less_equal, np.greater, np.greater_equal, np.isfinite,
+                np.isnan)
+_FUNCTIONS = {np.where: _where, np.stack: _stack, np.broadcast_to: _broadcast_to, np.atleast_1d: _atleast_1d}
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Failure envelope of one footing in (N, Hx, Hy, Mx, My) load space, to plot the interaction surface and to read
+the margin of a load case to it (its failure radius) for combined loading checks.  Load cases are evaluated
+with load_cases.FootingLoadCases, i.e. with the effective area and inclination factors of inclination_f, and a
+load is on the envelope where its utilisation fos x N / (B' x L') / q_ult is 1.
+
+The envelope is stored as the failure radius r*(N, direction): for a vertical load N and a direction of the
+horizontal loads and moments, loads along that direction fail beyond r*.  Horizontal loads are scaled by
+N_max (the capacity under a central vertical load) and moments by N_max x B or N_max x L, so that all
+components are comparable.  r* is found with a vectorized bisection along every ray, so the evaluations gather
+at utilisation 1 instead of filling a grid, and it is tabulated on a grid of N / N_max and three direction
+angles.  The grid is refined adaptively: a grid line is inserted between two lines wherever the interpolated
+radius differs from the computed one by more than tol (relative), so lines gather where the surface bends.
+
+The staged rounding of bs_ultbearing (eccentricities and effective dimensions to 0.01 m, factors to 2 or 3
+decimals) turns the surface into a staircase which refinement would chase everywhere, so the envelope is built
+from the unrounded calculation by default.  Load cases it classifies differently from the rounded calculation
+have a utilisation within about 0.02 of 1 (see benchmarks/bench_envelope.py).
+
+The envelope is not a faster way to screen load cases: a query through the grid costs about as much as
+evaluating the load case with FootingLoadCases (about 0.3 to 0.5 us each), and the default build (about 16000
+grid nodes, 0.6 million evaluations, 0.2 s) costs as much as evaluating the load cases of several hundred
+thousand.  Screen load cases with FootingLoadCases and use the envelope for plots, margins and the shape of
+the surface.
+
+The calculation takes a negative moment as enlarging the effective width; the envelope takes every load
+component by magnitude instead, which is the conservative side for negative moments.
+
+    envelope = failure_envelope(footing, fos=3.0)
+    envelope.contains(loads)    # n x 5 load array with columns as LOAD_COLUMNS
+    envelope.points()           # point cloud of the surface in load space
+
+"""
+
+import collections
+import itertools
+
+import numpy as np
+
+from load_cases import LOAD_COLUMNS, FootingLoadCases
+
+# Initial number of grid lines of N / N_max and of the three direction angles
+ENVELOPE_GRID = (9, 5, 5, 5)
+
+# Largest scaled failure radius searched; directions which do not fail within it keep this radius
+RADIUS_MAX = 64.0
+
+# Scaled radius below which the tolerances are absolute instead of relative to the radius
+RADIUS_FLOOR = 0.01
+
+EnvelopeStats = collections.namedtuple('EnvelopeStats', ['nodes', 'evaluations', 'rounds', 'unbounded'])
+EnvelopeStats.__doc__ = """
+    Cost of building a FailureEnvelope.
+
+    Fields:
+        nodes - number of grid nodes
+        evaluations - number of load cases evaluated
+        rounds - number of refinement rounds which inserted grid lines
+        unbounded - number of grid nodes which did not fail within RADIUS_MAX
+    """
+
+
+def _directions(a1, a2, a3):
+    # unit vectors of the positive orthant of the 4-D sphere from hyperspherical angles in [0, pi / 2]
+    return np.stack([np.cos(a1), np.sin(a1) * np.cos(a2), np.sin(a1) * np.sin(a2) * np.cos(a3),
+                     np.sin(a1) * np.sin(a2) * np.sin(a3)], axis=-1)
+
+
+def _angles(directions):
+    # inverse of _directions for unit vectors with non-negative components
+    u1, u2, u3, u4 = np.clip(directions, 0.0, 1.0).T
+    a1 = np.arccos(np.clip(u1, 0.0, 1.0))
+    a2 = np.arctan2(np.hypot(u3, u4), u2)
+    a3 = np.arctan2(u4, u3)
+    return a1, a2, a3
+
+
+class FailureEnvelope:
+    """
+    Failure radius of one footing tabulated on a grid, see the module docstring.  Built by failure_envelope.
+
+    Attributes:
+        n_max - capacity under a central vertical load in kN, divided by fos
+        scales - scales of Hx, Hy, Mx and My in kN and kNm
+        axes - grid lines of N / N_max and of the three direction angles in radian
+        radius - failure radius on the grid, shape (len(axes[0]), ..., len(axes[3]))
+        stats - EnvelopeStats
+    """
+
+    def __init__(self, n_max, scales, axes, radius, stats):
+        self.n_max = n_max
+        self.scales = scales
+        self.axes = axes
+        self.radius = radius
+        self.stats = stats
+
+    def _coordinates(self, loads):
+        # scaled vertical load, radius and angles of an n x 5 load array
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        if loads.shape[1] != len(LOAD_COLUMNS):
+            raise ValueError(f"Load array must have {len(LOAD_COLUMNS)} columns: {LOAD_COLUMNS}")
+        t = loads[:, 0] / self.n_max
+        h = np.abs(loads[:, 1:]) / self.scales
+        r = np.linalg.norm(h, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            directions = np.where(r[:, None] > 0, h / r[:, None], [1.0, 0.0, 0.0, 0.0])
+        return t, r, _angles(directions)
+
+    def failure_radius(self, t, angles):
+        """
+        Interpolate the failure radius multilinearly.
+
+        Parameters:
+            t - np array of N / N_max, within [0, 1]
+            angles - tuple of three np arrays of direction angles in radian
+
+        Returns:
+            radius - np array of scaled failure radii
+        """
+        # flat index of the lower corner and the weights of the upper corner along every axis
+        flat = self.radius.ravel()
+        strides = np.array(self.radius.strides) // self.radius.itemsize
+        base, offsets, weights = 0, [], []
+        for axis, values, stride in zip(self.axes, (t,) + tuple(angles), strides):
+            values = np.clip(values, axis[0], axis[-1])
+            i = np.clip(np.searchsorted(axis, values, side='right') - 1, 0, len(axis) - 2)
+            weights.append((values - axis[i]) / (axis[i + 1] - axis[i]))
+            base = base + i * stride
+            offsets.append(stride)
+
+        radius = 0.0
+        for corner in itertools.product((0, 1), repeat=4):
+            weight = 1.0
+            for w, c in zip(weights, corner):
+                weight = weight * (w if c else 1 - w)
+            radius = radius + weight * flat[base + np.dot(corner, offsets)]
+        return radius
+
+    def load_ratio(self, loads):
+        """
+        Return the ratio of the horizontal loads and moments to their failure values at the same vertical load
+        and direction: below 1 inside the envelope, inf where N is not within (0, N_max].
+
+        Every load component is taken by magnitude.  For a negative moment this disagrees with
+        FootingLoadCases, which takes it as enlarging the effective width: the envelope stays on the
+        conservative side and may put outside load cases that FootingLoadCases finds safe.
+
+        Parameters:
+            loads - n x 5 np array with columns as LOAD_COLUMNS
+        """
+        t, r, angles = self._coordinates(loads)
+        valid = (t > 0) & (t <= 1)
+        radius = self.failure_radius(np.clip(t, 0.0, 1.0), angles)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(r > 0, r / radius, 0.0)
+        return np.where(valid, ratio, np.inf)
+
+    def contains(self, loads):
+        """
+        Return True for the load cases inside the envelope.  Moments are taken by magnitude, so for negative
+        moments the result is conservative and disagrees with FootingLoadCases (see load_ratio); evaluate such
+        load cases with FootingLoadCases when their full capacity is needed.
+
+        Parameters:
+            loads - n x 5 np array with columns as LOAD_COLUMNS
+
+        Returns:
+            inside - n boolean np array
+        """
+        return self.load_ratio(loads) <= 1
+
+    def points(self):
+        """Return the grid nodes of the surface as an m x 5 load array with columns as LOAD_COLUMNS."""
+        t, a1, a2, a3 = np.meshgrid(*self.axes, indexing='ij')
+        h = _directions(a1, a2, a3) * self.radius[..., None] * self.scales
+        return np.column_stack([t.ravel() * self.n_max, h.reshape(-1, 4)])
+
+
+class _RadiusSolver:
+    # failure radius along rays, with a count of the evaluated load cases
+
+    def __init__(self, cases, fos, n_max, scales, tol):
+        self.cases = cases
+        self.fos = fos
+        self.n_max = n_max
+        self.scales = scales
+        self.tol = tol
+        self.evaluations = 0
+
+    def failed(self, t, directions, r):
+        loads = np.column_stack([t * self.n_max, directions * r[:, None] * self.scales])
+        result = self.cases.evaluate(loads, self.fos)
+        self.evaluations += len(loads)
+        # nan and a vanishing or negative capacity count as failure
+        return ~((result.capacity > 0) & (result.utilisation <= 1))
+
+    def solve(self, t, a1, a2, a3):
+        """Return the failure radius of the rays given by broadcastable grids of t and angles."""
+        shape = np.broadcast_shapes(np.shape(t), np.shape(a1), np.shape(a2), np.shape(a3))
+        t = np.broadcast_to(t, shape).ravel()
+        directions = _directions(*(np.broadcast_to(a, shape).ravel() for a in (a1, a2, a3)))
+
+        lo = np.zeros(t.size)
+        hi = np.ones(t.size)
+        # rays failing at zero radius have none
+        zero = self.failed(t, directions, lo)
+        hi[zero] = 0.0
+        # bracket: grow the upper radius until the ray fails, up to RADIUS_MAX
+        open_ = ~zero
+        open_[open_] = ~self.failed(t[open_], directions[open_], hi[open_])
+        while open_.any():
+            lo[open_] = hi[open_]
+            hi[open_] = np.minimum(hi[open_] * 4, RADIUS_MAX)
+            still = ~self.failed(t[open_], directions[open_], hi[open_])
+            unbounded = still & (hi[open_] >= RADIUS_MAX)
+            lo[np.flatnonzero(open_)[unbounded]] = RADIUS_MAX
+            open_[open_] = still & ~unbounded
+
+        active = hi - lo > self.tol * np.maximum(hi, RADIUS_FLOOR)
+        while active.any():
+            mid = 0.5 * (lo[active] + hi[active])
+            fails = self.failed(t[active], directions[active], mid)
+            index = np.flatnonzero(active)
+            hi[index[fails]] = mid[fails]
+            lo[index[~fails]] = mid[~fails]
+            active[index] = hi[index] - lo[index] > self.tol * np.maximum(hi[index], RADIUS_FLOOR)
+        return (0.5 * (lo + hi)).reshape(shape)
+
+
+def failure_envelope(footing, fos=1.0, rounding=False, tol=0.02, grid=ENVELOPE_GRID, max_rounds=8,
+                     max_nodes=20000):
+    """
+    Build the failure envelope of one footing.
+
+    Parameters:
+        footing - dict of scalar inputs keyed by the names in bearing_batch.INPUT_COLUMNS, load columns excluded
+        fos - required factor of safety, the envelope is where the utilisation reaches 1
+        rounding - True to round at the same stages as bs_ultbearing, see the module docstring
+        tol - largest interpolation error relative to the failure radius (absolute below RADIUS_FLOOR); the
+              radius itself is found to tol / 10
+        grid - initial number of grid lines of N / N_max and of the three direction angles
+        max_rounds - largest number of refinement rounds, 0 for the initial grid only
+        max_nodes - refinement stops before the grid exceeds this number of nodes
+
+    Returns:
+        FailureEnvelope
+    """
+    cases = FootingLoadCases(footing, rounding)
+    width, length = float(cases.inputs['width']), float(cases.inputs['length'])
+    central = cases.evaluate([[1.0, 0.0, 0.0, 0.0, 0.0]], fos)
+    if not central.capacity[0] > 0:
+        raise ValueError("The footing has no capacity under a central vertical load")
+    n_max = float(central.capacity[0]) * width * length / fos
+    scales = np.array([n_max, n_max, n_max * width, n_max * length])
+    solver = _RadiusSolver(cases, fos, n_max, scales, tol / 10)
+
+    axes = [np.linspace(0.0, 1.0, grid[0])] + [np.linspace(0.0, np.pi / 2, n) for n in grid[1:]]
+    radius = solver.solve(*np.meshgrid(*axes, indexing='ij', sparse=True))
+
+    # intervals of every axis still to be checked, by their lower grid line
+    unchecked = [set(axis[:-1]) for axis in axes]
+    rounds = 0
+    for _ in range(max_rounds):
+        inserted = False
+        for k in range(4):
+            axis = axes[k]
+            lower = np.array([i for i in range(len(axis) - 1) if axis[i] in unchecked[k]], dtype=int)
+            if lower.size == 0:
+                continue
+            if radius.size // len(axis) * (len(axis) + lower.size) > max_nodes:
+                continue
+            mids = 0.5 * (axis[lower] + axis[lower + 1])
+            coordinates = list(np.meshgrid(*axes, indexing='ij', sparse=True))
+            coordinates[k] = mids.reshape([-1 if j == k else 1 for j in range(4)])
+            computed = solver.solve(*coordinates)
+            interpolated = 0.5 * (np.take(radius, lower, axis=k) + np.take(radius, lower + 1, axis=k))
+            # directions which do not fail within RADIUS_MAX have no surface to resolve
+            bounded = (computed < RADIUS_MAX) & (interpolated < RADIUS_MAX)
+            error = np.abs(computed - interpolated) / np.maximum(computed, RADIUS_FLOOR)
+            error = np.where(bounded, error, 0.0).max(axis=tuple(j for j in range(4) if j != k))
+
+            unchecked[k] = set()
+            refine = error > tol
+            if refine.any():
+                at = lower[refine] + 1
+                radius = np.insert(radius, at, np.compress(refine, computed, axis=k), axis=k)
+                axes[k] = np.insert(axis, at, mids[refine])
+                # both halves of a refined interval are checked again
+                unchecked[k] = set(axis[lower[refine]]) | set(mids[refine])
+                inserted = True
+        if not inserted:
+            break
+        rounds += 1
+
+    stats = EnvelopeStats(radius.size, solver.evaluations, rounds, int((radius >= RADIUS_MAX).sum()))
+    return FailureEnvelope(n_max, scales, axes, radius, stats)
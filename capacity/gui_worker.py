@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Run long jobs (calculations, pdf reports) of the tkinter GUI in a background thread so that the window stays
+responsive.  The job reports its progress through a callback, the GUI polls for progress and the result with
+widget.after() and so all widget updates stay on the Tk main thread.
+
+Cancellation is cooperative: the progress callback raises TaskCancelled once cancel() has been called, so a job
+stops at its next progress report.  The GUI is reset immediately and a late result of a cancelled job is
+discarded.
+
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class TaskCancelled(Exception):
+    """Raised inside a job by its progress callback after the task has been cancelled."""
+
+
+class BackgroundTask:
+    """
+    Run one job at a time in a worker thread and deliver its progress and result on the Tk main thread.
+
+    Parameters:
+        widget - any tkinter widget, used for widget.after()
+        poll_ms - interval between checks for progress and completion in ms
+    """
+
+    def __init__(self, widget, poll_ms=50):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capacity-worker")
+        self._job = None
+
+    @property
+    def running(self):
+        return self._job is not None
+
+    def start(self, func, *args, on_done=None, on_error=None, on_progress=None, on_cancel=None):
+        """
+        Start func(progress, *args) in the worker thread.  progress(fraction, text="") may be called by func to
+        report a fraction between 0 and 1; it raises TaskCancelled once the task is cancelled.
+
+        Parameters:
+            func - job function, must not touch any widget
+            args - further arguments of func
+            on_done - called with the return value of func
+            on_error - called with the exception raised by func
+            on_progress - called with (fraction, text) for every progress report
+            on_cancel - called without arguments when cancel() stops the job
+        """
+        if self.running:
+            raise RuntimeError("A background task is already running")
+
+        cancelled = threading.Event()
+        messages = queue.SimpleQueue()
+
+        def progress(fraction, text=""):
+            if cancelled.is_set():
+                raise TaskCancelled()
+            messages.put((fraction, text))
+
+        self._job = {'future': self._executor.submit(func, progress, *args), 'cancelled': cancelled,
+                     'messages': messages, 'on_done': on_done, 'on_error': on_error, 'on_progress': on_progress,
+                     'on_cancel': on_cancel}
+        self.widget.after(self.poll_ms, self._poll, self._job)
+
+    def cancel(self):
+        """Stop the running job at its next progress report and call its on_cancel callback."""
+        job = self._job
+        if job is None:
+            return
+        job['cancelled'].set()
+        self._job = None
+        if job['on_cancel'] is not None:
+            job['on_cancel']()
+
+    def close(self):
+        """Cancel the running job and shut the worker thread down without waiting for it."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self, job):
+        # a job that has been cancelled (or replaced) is no longer polled, its result is discarded
+        if job is not self._job:
+            return
+
+        while True:
+            try:
+                fraction, text = job['messages'].get_nowait()
+            except queue.Empty:
+                break
+            if job['on_progress'] is not None:
+                job['on_progress'](fraction, text)
+
+        future = job['future']
+        if not future.done():
+            self.widget.after(self.poll_ms, self._poll, job)
+            return
+
+        self._job = None
+        error = future.exception()
+        if error is None:
+            if job['on_done'] is not None:
+                job['on_done'](future.result())
+        elif not isinstance(error, TaskCancelled):
+            logger.error("Background task failed", exc_info=error)
+            if job['on_error'] is not None:
+                job['on_error'](error)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Incremental evaluation of the general bearing capacity equation for one footing.  The calculation of
+bs_ultbearing_core is laid out as a dependency graph: every factor row, the effective unit weight, the
+overburden pressure, the factor matrix and the capacity are nodes that depend on a known set of inputs and
+other nodes.  When inputs change, only the nodes downstream of them are recomputed; a node whose new value
+equals its old one does not propagate further.  The result is identical to bs_ultbearing_core.
+
+Typical use is an optimisation loop, a parametric study or the live mode of the GUI, where one input changes
+at a time:
+
+    footing = IncrementalBearing(width=2, length=3, cohesion=0, friction=30, gamma=20, depth=1,
+                                 water_depth=5, vertical_load=500)
+    footing.update(vertical_load=600)
+    footing.result.capacity, footing.recomputed  # ('inclination', 'factors', 'capacity')
+
+"""
+
+import collections
+import numpy as np
+
+from bearing_formula import (bearing_f, rigidity_f, shape_f, inclination_f, foundation_tilt_f, surface_slope_f,
+                             depth_f, effective_gamma, combine_factors, stack_factors)
+
+# Inputs of the evaluator with their defaults, as the parameters of bs_ultbearing_core (None: required)
+INPUTS = collections.OrderedDict([
+    ('width', None), ('length', None), ('cohesion', None), ('friction', None), ('gamma', None), ('depth', None),
+    ('water_depth', None), ('vertical_load', None), ('horizontal_load_W', 0), ('horizontal_load_L', 0),
+    ('moment_W', 0), ('moment_L', 0), ('shear_modulus', 12000), ('slope', 0), ('tilt', 0), ('surcharge', 0),
+    ('drainage', "Drained analysis"), ('roughness', "Rough"), ('thickness', 0)])
+
+
+def _factor_matrix(bearing, rigidity, shape, inclination, foundation_tilt, surface_slope, depth):
+    # the inclination node holds the factors and the effective dimensions
+    return stack_factors(bearing, rigidity, shape, inclination[0], foundation_tilt, surface_slope, depth)
+
+
+def _capacity(factors, inclination, cohesion, eff_gamma, q, drainage):
+    return combine_factors(factors, inclination[1], cohesion, eff_gamma, q, drainage)
+
+
+def _overburden(surcharge, depth, gamma):
+    return surcharge + depth * gamma
+
+
+# Nodes in topological order: name, function and the inputs / nodes passed to it as positional arguments
+NODES = (
+    ('bearing', bearing_f, ('friction', 'roughness', 'slope')),
+    ('rigidity', rigidity_f, ('cohesion', 'friction', 'width', 'length', 'depth', 'gamma', 'surcharge',
+                              'shear_modulus', 'bearing')),
+    ('shape', shape_f, ('friction', 'width', 'length', 'bearing')),
+    ('inclination', inclination_f, ('vertical_load', 'horizontal_load_W', 'horizontal_load_L', 'moment_W',
+                                    'moment_L', 'cohesion', 'friction', 'width', 'length', 'bearing')),
+    ('foundation_tilt', foundation_tilt_f, ('friction', 'tilt', 'bearing')),
+    ('surface_slope', surface_slope_f, ('friction', 'slope', 'bearing')),
+    ('depth_factors', depth_f, ('friction', 'width', 'depth', 'bearing')),
+    ('eff_gamma', effective_gamma, ('friction', 'width', 'gamma', 'water_depth')),
+    ('q', _overburden, ('surcharge', 'depth', 'gamma')),
+    ('factors', _factor_matrix, ('bearing', 'rigidity', 'shape', 'inclination', 'foundation_tilt',
+                                 'surface_slope', 'depth_factors')),
+    ('capacity', _capacity, ('factors', 'inclination', 'cohesion', 'eff_gamma', 'q', 'drainage')),
+)
+
+# Nodes that take a given input or node as an argument
+DEPENDENTS = collections.defaultdict(list)
+for _name, _func, _args in NODES:
+    for _arg in _args:
+        DEPENDENTS[_arg].append(_name)
+
+
+def _same(a, b):
+    # True when two node values are equal, nan included, so that the dependents need not be recomputed.
+    # Arrays are compared bit for bit, which is much faster than np.array_equal for the small factor rows.
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return (isinstance(a, np.ndarray) and isinstance(b, np.ndarray) and a.shape == b.shape
+                and a.dtype == b.dtype and a.tobytes() == b.tobytes())
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b or (a != a and b != b)
+
+
+class IncrementalBearing:
+    """
+    Hold the inputs and intermediate results of one footing and recompute only what an update affects.
+
+    Parameters:
+        inputs - keyword arguments named as the parameters of bs_ultbearing_core; the required ones are width,
+                 length, cohesion, friction, gamma, depth, water_depth and vertical_load
+
+    Attributes:
+        inputs - dict of the current inputs
+        values - dict of the current node values, keyed by the names in NODES
+        recomputed - tuple of the nodes recomputed by the last update (or by the initial evaluation)
+        pending - set of the nodes still to be recomputed after an update raised an exception
+        counts - collections.Counter of the recomputations of every node since creation
+        updates - number of update calls
+    """
+
+    def __init__(self, **inputs):
+        unknown = set(inputs) - set(INPUTS)
+        if unknown:
+            raise TypeError(f"Unknown inputs: {sorted(unknown)}")
+        missing = [name for name, default in INPUTS.items() if default is None and name not in inputs]
+        if missing:
+            raise TypeError(f"Missing inputs: {missing}")
+        self.inputs = {name: inputs.get(name, default) for name, default in INPUTS.items()}
+        self.values = {}
+        self.counts = collections.Counter()
+        self.updates = 0
+        # nodes left dirty by an update that raised, recomputed by the next update
+        self.pending = set()
+        self.recomputed = self._evaluate({name for name, _, _ in NODES})
+
+    @property
+    def result(self):
+        """BearingResult of the current inputs, as returned by bs_ultbearing_core."""
+        return self.values['capacity']
+
+    def update(self, **changes):
+        """
+        Change some inputs and recompute the nodes that depend on them.
+
+        Parameters:
+            changes - keyword arguments named as the inputs; unchanged values cost nothing
+
+        Returns:
+            result - BearingResult of the new inputs
+        """
+        unknown = set(changes) - set(INPUTS)
+        if unknown:
+            raise TypeError(f"Unknown inputs: {sorted(unknown)}")
+
+        dirty = set(self.pending)
+        for name, value in changes.items():
+            if not _same(value, self.inputs[name]):
+                self.inputs[name] = value
+                dirty.update(DEPENDENTS[name])
+
+        self.updates += 1
+        self.recomputed = self._evaluate(dirty)
+        return self.result
+
+    def _evaluate(self, dirty):
+        # Recompute the dirty nodes in topological order; a node whose value changed makes its dependents dirty
+        recomputed = []
+        for name, func, args in NODES:
+            if name not in dirty:
+                continue
+            try:
+                value = func(*[self.values[arg] if arg in self.values else self.inputs[arg] for arg in args])
+            except Exception:
+                self.pending = {node for node, _, _ in NODES if node in dirty and node not in recomputed}
+                self.counts.update(recomputed)
+                self.recomputed = tuple(recomputed)
+                raise
+            recomputed.append(name)
+            dependents = DEPENDENTS[name]
+            if dependents and (name not in self.values or not _same(value, self.values[name])):
+                dirty.update(dependents)
+            self.values[name] = value
+        self.pending = set()
+        self.counts.update(recomputed)
+        return tuple(recomputed)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Evaluate many load combinations on one footing.  Only the inclination factors and the effective dimensions
+depend on the loads; the bearing, rigidity, shape, foundation tilt, surface slope and depth factors, the
+effective unit weight and the overburden pressure are computed once per footing and reused for every case.
+
+"""
+
+import collections
+import numpy as np
+
+from bearing_batch import (INPUT_DEFAULTS, bearing_f_batch, rigidity_f_batch, shape_f_batch, inclination_f_batch,
+                           foundation_tilt_f_batch, surface_slope_f_batch, depth_f_batch, eff_gamma_batch)
+
+# Column order of the load array
+LOAD_COLUMNS = ('vertical_load', 'horizontal_load_W', 'horizontal_load_L', 'moment_W', 'moment_L')
+
+LoadCaseResult = collections.namedtuple('LoadCaseResult',
+                                        ['capacity', 'pressure', 'utilisation', 'eff_width', 'eff_length',
+                                         'inclination_factors', 'governing'])
+LoadCaseResult.__doc__ = """
+    Results of FootingLoadCases.evaluate.
+
+    Fields:
+        capacity - n np array of the ultimate bearing capacity of every load case in kPa
+        pressure - n np array of the applied pressure N / (B' x L') in kPa
+        utilisation - n np array of fos x pressure / capacity, inf where the effective area vanishes
+        eff_width, eff_length - n np arrays in m
+        inclination_factors - n x 6 np array
+        governing - index of the load case with the highest utilisation
+    """
+
+
+class FootingLoadCases:
+    """
+    Hold the load independent part of the general bearing capacity equation for one footing and
+    evaluate load cases against it.
+
+    Parameters:
+        footing - dict of scalar inputs keyed by the names in bearing_batch.INPUT_COLUMNS, load columns excluded
+        rounding - True to round at the same stages as bs_ultbearing, False to keep full precision
+    """
+
+    def __init__(self, footing, rounding=True):
+        loads = set(LOAD_COLUMNS) & set(footing)
+        if loads:
+            raise ValueError(f"Loads are given per case, not in the footing: {sorted(loads)}")
+        inputs = dict(INPUT_DEFAULTS)
+        inputs.update(footing)
+        self.inputs = inputs
+        self.rounding = rounding
+
+        friction, width, length = inputs['friction'], inputs['width'], inputs['length']
+        cohesion, gamma, depth = inputs['cohesion'], inputs['gamma'], inputs['depth']
+
+        self.bearing_factors = bearing_f_batch(friction, inputs['roughness'], inputs['slope'], rounding)
+        rigidity_factors = rigidity_f_batch(cohesion, friction, width, length, depth, gamma, inputs['surcharge'],
+                                            inputs['shear_modulus'], self.bearing_factors, rounding)
+        shape_factors = shape_f_batch(friction, width, length, self.bearing_factors, rounding)
+        foundation_factors = foundation_tilt_f_batch(friction, inputs['tilt'], self.bearing_factors, rounding)
+        surface_factors = surface_slope_f_batch(friction, inputs['slope'], self.bearing_factors, rounding)
+        depth_factors = depth_f_batch(friction, width, depth, self.bearing_factors, rounding)
+
+        # products taken in the row order of bs_ultbearing, before and after the inclination factors
+        self.factors_before = (self.bearing_factors * rigidity_factors * shape_factors)[0]
+        self.factors_after = [foundation_factors[0], surface_factors[0], depth_factors[0]]
+
+        self.eff_gamma = eff_gamma_batch(friction, width, gamma, inputs['water_depth'])[0]
+        self.q = inputs['surcharge'] + depth * gamma
+        self.drained = inputs['drainage'] == "Drained analysis"
+
+    def evaluate(self, loads, fos=1.0):
+        """
+        Evaluate an array of load cases.
+
+        Parameters:
+            loads - n x 5 np array with columns as LOAD_COLUMNS (N, Hx, Hy, Mx, My in kN and kNm)
+            fos - required factor of safety used for the utilisation
+
+        Returns:
+            LoadCaseResult - named tuple of np arrays
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        if loads.shape[1] != len(LOAD_COLUMNS):
+            raise ValueError(f"Load array must have {len(LOAD_COLUMNS)} columns: {LOAD_COLUMNS}")
+        vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L = loads.T
+        n_cases = loads.shape[0]
+        inputs = self.inputs
+
+        inclination_factors, (eff_width, eff_length) = inclination_f_batch(
+            vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L,
+            np.full(n_cases, float(inputs['cohesion'])), np.full(n_cases, float(inputs['friction'])),
+            np.full(n_cases, float(inputs['width'])), np.full(n_cases, float(inputs['length'])),
+            np.broadcast_to(self.bearing_factors, (n_cases, 6)), self.rounding)
+
+        products = self.factors_before * inclination_factors
+        for factors in self.factors_after:
+            products = products * factors
+
+        # Summation of all terms for the selected drainage condition
+        terms = products[:, :3] if self.drained else products[:, 3:]
+        capacity = inputs['cohesion'] * terms[:, 0] + 0.5 * self.eff_gamma * eff_width * terms[:, 1] + \
+                   self.q * terms[:, 2]
+        if self.rounding:
+            capacity = np.round(capacity, 2)
+
+        eff_area = eff_width * eff_length
+        valid = (eff_width > 0) & (eff_length > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pressure = np.where(valid, vertical_load / eff_area, np.inf)
+            utilisation = np.where(valid, fos * pressure / capacity, np.inf)
+
+        governing = int(np.nanargmax(utilisation)) if n_cases else -1
+        return LoadCaseResult(capacity, pressure, utilisation, eff_width, eff_length, inclination_factors,
+                              governing)
+
+
+def evaluate_load_cases(footing, loads, fos=1.0, rounding=True):
+    """
+    Evaluate an n x 5 array of load cases on one footing, see FootingLoadCases.
+
+    Parameters:
+        footing - dict of scalar inputs keyed by the names in bearing_batch.INPUT_COLUMNS, load columns excluded
+        loads - n x 5 np array with columns as LOAD_COLUMNS
+        fos - required factor of safety used for the utilisation
+        rounding - True to round at the same stages as bs_ultbearing
+
+    Returns:
+        LoadCaseResult - named tuple of np arrays
+    """
+    return FootingLoadCases(footing, rounding).evaluate(loads, fos)
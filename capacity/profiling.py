@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Opt-in timing and call counts of the stages of the calculation and the report.  Functions are registered as
+stages with the stage decorator, which returns them unchanged; enable() replaces every registered function in
+its module by a timed wrapper and disable() puts the original back.  While profiling is disabled the stages
+therefore cost nothing extra.
+
+    import profiling
+    with profiling.profile(log=True):
+        bs_ultbearing(...)
+    profiling.get_stats()  # {'bearing_formula.bearing_f': {'calls': 1, 'total_s': ..., 'self_s': ...}, ...}
+
+The total time of a stage includes the stages it calls, its self time does not: the self time of
+bearing_formula.bearing_report is the string formatting, that of bearing_formula.factor_frame the data frame
+assembly.  Only calls through the module namespace are timed; a function imported by name into another module
+before enable() (e.g. by incremental) keeps the original.  Stages are timed per thread, so a calculation in the
+GUI's background thread is timed correctly.
+
+"""
+
+import contextlib
+import functools
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Registered stages: name -> (module name, attribute, original function)
+STAGES = {}
+
+# Accumulated statistics: name -> [calls, total time, self time, longest call] in s
+_stats = {}
+_local = threading.local()
+_enabled = False
+
+
+def stage(func):
+    """
+    Register a module level function as a profiled stage named module.function.
+
+    Parameters:
+        func - function defined at module level
+
+    Returns:
+        func unchanged, or its timed wrapper when profiling is already enabled
+    """
+    name = f"{func.__module__}.{func.__name__}"
+    STAGES[name] = (func.__module__, func.__name__, func)
+    return _timed(name, func) if _enabled else func
+
+
+def _timed(name, func):
+    # wrapper recording the total and self time of every call of func
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            record = _stats.setdefault(name, [0, 0.0, 0.0, 0.0])
+            record[0] += 1
+            record[1] += elapsed
+            record[2] += elapsed - children
+            record[3] = max(record[3], elapsed)
+
+    return wrapper
+
+
+def enable():
+    """Replace every registered stage by its timed wrapper."""
+    global _enabled
+    _enabled = True
+    for name, (module, attribute, func) in STAGES.items():
+        if module in sys.modules:
+            setattr(sys.modules[module], attribute, _timed(name, func))
+
+
+def disable():
+    """Put the original functions back; the statistics are kept until reset."""
+    global _enabled
+    _enabled = False
+    for module, attribute, func in STAGES.values():
+        if module in sys.modules:
+            setattr(sys.modules[module], attribute, func)
+
+
+def is_enabled():
+    """Return True while profiling is enabled."""
+    return _enabled
+
+
+def reset():
+    """Clear the statistics."""
+    _stats.clear()
+
+
+def get_stats():
+    """
+    Return the statistics of every stage called since the last reset, the longest total time first.
+
+    Returns:
+        stats - dict keyed by stage name of dicts with calls, total_s, self_s, mean_us and max_us
+    """
+    stats = {}
+    for name, (calls, total, own, longest) in sorted(_stats.items(), key=lambda item: -item[1][1]):
+        stats[name] = {'calls': calls, 'total_s': total, 'self_s': own, 'mean_us': total / calls * 1e6,
+                       'max_us': longest * 1e6}
+    return stats
+
+
+def stats_frame():
+    """Return the statistics as a panda dataframe with one row per stage."""
+    import pandas as pd
+
+    return pd.DataFrame.from_dict(get_stats(), orient='index',
+                                  columns=['calls', 'total_s', 'self_s', 'mean_us', 'max_us'])
+
+
+def log_stats(level=logging.INFO):
+    """Write the statistics to the log of this module, one line per stage."""
+    for name, stats in get_stats().items():
+        logger.log(level, "%-45s %8d calls %10.4f s total %10.4f s self %10.1f us mean %10.1f us max", name,
+                   stats['calls'], stats['total_s'], stats['self_s'], stats['mean_us'], stats['max_us'])
+
+
+@contextlib.contextmanager
+def profile(log=False, clear=True):
+    """
+    Enable profiling within a with block.
+
+    Parameters:
+        log - True to log the statistics at the end of the block
+        clear - True to reset the statistics at the start of the block
+    """
+    if clear:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+        if log:
+            log_stats()
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Monte Carlo reliability analysis of the ultimate bearing capacity.  The soil, geometry and load inputs are
+random variables with normal, lognormal or truncated normal distributions, optionally correlated.  Samples are
+drawn in chunks and every chunk is evaluated with bs_ultbearing_batch, so millions of samples take seconds
+rather than millions of scalar bs_ultbearing calls.  The capacities of all samples are kept, 8 MB per million
+samples, so that the percentiles are exact.
+
+A sample fails when the factor of safety, capacity / (N / (B' x L')) as in design.factor_of_safety, is below
+the required value (1 by default).  Samples with degenerate inputs (no capacity or no effective area) count as
+failures.  The results are the failure probability with its standard error, the reliability index
+beta = -Phi^-1(pf) and percentiles of the capacity.
+
+Correlation is introduced through the underlying standard normal variables (Gaussian copula): independent
+standard normals are multiplied by the Cholesky factor of the correlation matrix and every marginal is mapped
+from its own standard normal.  For normal variables this is the usual covariance; correlation_from_covariance
+converts a covariance matrix.
+
+Every chunk draws from its own child of numpy.random.SeedSequence(seed), so a run is reproducible for a given
+seed and chunk size whatever the number of worker processes.
+
+"""
+
+import collections
+import logging
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bearing_batch import INPUT_COLUMNS, bs_ultbearing_batch
+from design import factor_of_safety
+
+logger = logging.getLogger(__name__)
+
+ReliabilityResult = collections.namedtuple('ReliabilityResult',
+                                           ['samples', 'failures', 'invalid', 'pf', 'pf_std_error', 'beta',
+                                            'percentiles', 'mean', 'std', 'seed'])
+ReliabilityResult.__doc__ = """
+    Results of run_reliability.
+
+    Fields:
+        samples - number of samples evaluated
+        failures - number of samples with a factor of safety below the required value
+        invalid - number of samples without a finite capacity or effective area (counted as failures)
+        pf - failure probability
+        pf_std_error - standard error of pf, sqrt(pf (1 - pf) / samples)
+        beta - reliability index -Phi^-1(pf), inf when no sample fails
+        percentiles - dict of capacity percentiles in kPa keyed by percentage
+        mean, std - mean and standard deviation of the finite capacities in kPa
+        seed - entropy of the seed sequence, pass it as seed to repeat the run
+    """
+
+
+# Define the standard normal distribution function without scipy
+def norm_cdf(x):
+    """
+    Standard normal cumulative distribution function, from the complementary error function approximation of
+    Numerical Recipes (relative error below 1.2e-7, also in the tails).
+
+    Parameters:
+        x - float value or np array
+
+    Returns:
+        p - np array of Phi(x)
+    """
+    x = np.asarray(x, dtype=float)
+    z = np.abs(x) / math.sqrt(2)
+    t = 1 / (1 + 0.5 * z)
+    erfc = t * np.exp(-z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418 +
+           t * (-0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587 +
+           t * (-0.82215223 + t * 0.17087277)))))))))
+    return np.where(x >= 0, 1 - 0.5 * erfc, 0.5 * erfc)
+
+
+def norm_ppf(p):
+    """
+    Inverse of the standard normal distribution function, by the rational approximation of P. J. Acklam
+    (relative error below 1.2e-9).
+
+    Parameters:
+        p - float value or np array of probabilities, 0 and 1 give -inf and inf
+
+    Returns:
+        x - np array of Phi^-1(p)
+    """
+    a = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02, 1.383577518672690e+02,
+         -3.066479806614716e+01, 2.506628277459239e+00)
+    b = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02, 6.680131188771972e+01,
+         -1.328068155288572e+01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00, -2.549732539343734e+00,
+         4.374664141464968e+00, 2.938163982698783e+00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00, 3.754408661907416e+00)
+
+    p = np.asarray(p, dtype=float)
+    x = np.empty(p.shape)
+    low, high = p < 0.02425, p > 1 - 0.02425
+    central = ~(low | high)
+
+    q = p[central] - 0.5
+    r = q * q
+    x[central] = (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q / \
+                 (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for tail, sign, prob in ((low, 1, p[low]), (high, -1, 1 - p[high])):
+            q = np.sqrt(-2 * np.log(prob))
+            x[tail] = sign * (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / \
+                      ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1)
+    x[p == 0], x[p == 1] = -np.inf, np.inf
+    return x
+
+
+class Normal:
+    """
+    Normal random variable.
+
+    Parameters:
+        mean, std - float values in the unit of the input
+    """
+
+    def __init__(self, mean, std):
+        self.mean, self.std = float(mean), float(std)
+
+    def from_normal(self, z):
+        """Map standard normal values z to values of this variable."""
+        return self.mean + self.std * z
+
+    def __repr__(self):
+        return f"Normal({self.mean:g}, {self.std:g})"
+
+
+class LogNormal:
+    """
+    Lognormal random variable, for strictly positive inputs such as cohesion or unit weight.
+
+    Parameters:
+        mean, std - float values of the variable itself (not of its logarithm)
+    """
+
+    def __init__(self, mean, std):
+        if mean <= 0:
+            raise ValueError("The mean of a lognormal variable must be positive")
+        self.mean, self.std = float(mean), float(std)
+        self.sigma_log = math.sqrt(math.log(1 + (self.std / self.mean) ** 2))
+        self.mean_log = math.log(self.mean) - self.sigma_log ** 2 / 2
+
+    def from_normal(self, z):
+        """Map standard normal values z to values of this variable."""
+        return np.exp(self.mean_log + self.sigma_log * z)
+
+    def __repr__(self):
+        return f"LogNormal({self.mean:g}, {self.std:g})"
+
+
+class TruncatedNormal:
+    """
+    Normal random variable restricted to lower <= x <= upper, e.g. a friction angle that must stay within
+    0 and 50 degree.
+
+    Parameters:
+        mean, std - float values of the parent normal distribution
+        lower, upper - float bounds, either may be infinite
+    """
+
+    def __init__(self, mean, std, lower=-np.inf, upper=np.inf):
+        if not lower < upper:
+            raise ValueError("The lower bound of a truncated normal variable must be below the upper bound")
+        self.mean, self.std = float(mean), float(std)
+        self.lower, self.upper = float(lower), float(upper)
+        self.p_lower, self.p_upper = norm_cdf([(self.lower - self.mean) / self.std,
+                                               (self.upper - self.mean) / self.std])
+
+    def from_normal(self, z):
+        """Map standard normal values z to values of this variable by its inverse distribution function."""
+        p = self.p_lower + norm_cdf(z) * (self.p_upper - self.p_lower)
+        return np.clip(self.mean + self.std * norm_ppf(p), self.lower, self.upper)
+
+    def __repr__(self):
+        return f"TruncatedNormal({self.mean:g}, {self.std:g}, {self.lower:g}, {self.upper:g})"
+
+
+def correlation_from_covariance(covariance):
+    """
+    Return the correlation matrix of a covariance matrix.
+
+    Parameters:
+        covariance - d x d np array
+    """
+    covariance = np.asarray(covariance, dtype=float)
+    std = np.sqrt(np.diag(covariance))
+    return covariance / np.outer(std, std)
+
+
+def cholesky_factor(variables, correlation):
+    """
+    Check a correlation matrix and return its lower triangular Cholesky factor.
+
+    Parameters:
+        variables - dict of distributions, the matrix follows their order
+        correlation - d x d np array or None for independent variables
+
+    Returns:
+        cholesky - d x d np array, None when correlation is None
+    """
+    if correlation is None:
+        return None
+    correlation = np.asarray(correlation, dtype=float)
+    if correlation.shape != (len(variables), len(variables)):
+        raise ValueError(f"The correlation matrix must be {len(variables)} x {len(variables)}, "
+                         f"in the order of the variables: {list(variables)}")
+    if not np.allclose(correlation, correlation.T) or not np.allclose(np.diag(correlation), 1):
+        raise ValueError("The correlation matrix must be symmetric with a unit diagonal")
+    try:
+        return np.linalg.cholesky(correlation)
+    except np.linalg.LinAlgError:
+        raise ValueError("The correlation matrix is not positive definite") from None
+
+
+def inputs_from_normals(variables, normals, cholesky=None):
+    """
+    Map independent standard normal values to input values.
+
+    Parameters:
+        variables - dict of distributions keyed by input column names
+        normals - n x d np array of independent standard normal values, columns in the order of variables
+        cholesky - optional lower triangular factor of the correlation matrix
+
+    Returns:
+        inputs - dict of n np arrays keyed by input column names
+    """
+    if cholesky is not None:
+        normals = normals @ cholesky.T
+    return {name: distribution.from_normal(normals[:, j]) for j, (name, distribution) in enumerate(variables.items())}
+
+
+def evaluate_samples(inputs, fixed=None, fos=1.0, rounding=True):
+    """
+    Evaluate sampled inputs with bs_ultbearing_batch.
+
+    Parameters:
+        inputs - dict of np arrays keyed by input column names
+        fixed - dict of scalar inputs shared by all samples
+        fos - required factor of safety
+        rounding - passed to bs_ultbearing_batch
+
+    Returns:
+        capacity - n np array in kPa
+        failed - n boolean np array, True where the factor of safety is below fos or not defined
+        valid - n boolean np array, False where the capacity or the effective area is not defined
+    """
+    columns = dict(fixed or {})
+    columns.update(inputs)
+    result = bs_ultbearing_batch(rounding=rounding, **columns)
+    _, factor = factor_of_safety(result, columns['vertical_load'])
+    valid = np.isfinite(result.capacity) & (result.eff_width > 0) & (result.eff_length > 0)
+    return result.capacity, (factor < fos) | ~valid, valid
+
+
+def _run_chunk(variables, cholesky, fixed, fos, rounding, n, seed):
+    # run in a worker process: sample and evaluate one chunk
+    rng = np.random.default_rng(seed)
+    inputs = inputs_from_normals(variables, rng.standard_normal((n, len(variables))), cholesky)
+    capacity, failed, valid = evaluate_samples(inputs, fixed, fos, rounding)
+    return int(failed.sum()), int((~valid).sum()), capacity[valid]
+
+
+def summarise(samples, failures, invalid, capacities, percentiles, seed=None):
+    """
+    Form the ReliabilityResult of evaluated samples.
+
+    Parameters:
+        samples, failures, invalid - counts
+        capacities - np array of the finite capacities in kPa
+        percentiles - sequence of percentages
+        seed - seed entropy to report
+    """
+    pf = failures / samples
+    beta = float(-norm_ppf(pf)) if failures else np.inf
+    values = np.percentile(capacities, percentiles) if capacities.size else np.full(len(percentiles), np.nan)
+    return ReliabilityResult(samples, failures, invalid, pf, math.sqrt(pf * (1 - pf) / samples), beta,
+                             dict(zip(percentiles, values.tolist())),
+                             float(capacities.mean()) if capacities.size else np.nan,
+                             float(capacities.std()) if capacities.size else np.nan, seed)
+
+
+def run_reliability(variables, fixed=None, correlation=None, samples=1000000, chunk_size=100000, seed=None,
+                    workers=1, fos=1.0, percentiles=(1, 5, 50, 95, 99), rounding=True):
+    """
+    Estimate the probability that the factor of safety falls below fos by Monte Carlo sampling.
+
+    Parameters:
+        variables - dict of distributions (Normal, LogNormal, TruncatedNormal) keyed by input column names
+        fixed - dict of scalar inputs shared by all samples (INPUT_DEFAULTS apply to the others)
+        correlation - optional d x d correlation matrix of the variables, in the order of variables
+        samples - number of samples
+        chunk_size - number of samples per chunk, the inputs and factors of one chunk are in memory at a time;
+                     the finite capacities of all samples (8 bytes each) are kept for the exact percentiles
+        seed - int for a reproducible run, None for fresh entropy (reported in the result)
+        workers - number of worker processes, 1 to run in this process and None for os.cpu_count()
+        fos - required factor of safety, a sample fails below it
+        percentiles - capacity percentiles to report, in percent
+        rounding - passed to bs_ultbearing_batch
+
+    Returns:
+        ReliabilityResult
+
+    Raises:
+        ValueError - for samples or chunk_size below 1, unknown inputs or inputs both variable and fixed
+    """
+    if samples < 1 or chunk_size < 1:
+        raise ValueError(f"samples and chunk_size must be at least 1, not {samples} and {chunk_size}")
+    unknown = (set(variables) | set(fixed or {})) - set(INPUT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown inputs: {sorted(unknown)}")
+    both = set(variables) & set(fixed or {})
+    if both:
+        raise ValueError(f"Inputs given both as variables and as fixed values: {sorted(both)}")
+
+    cholesky = cholesky_factor(variables, correlation)
+    sequence = np.random.SeedSequence(seed)
+    sizes = [min(chunk_size, samples - start) for start in range(0, samples, chunk_size)]
+    tasks = [(variables, cholesky, fixed, fos, rounding, n, child)
+             for n, child in zip(sizes, sequence.spawn(len(sizes)))]
+
+    failures = invalid = done = 0
+    capacities = []
+    if workers == 1:
+        results = (_run_chunk(*task) for task in tasks)
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_run_chunk, *zip(*tasks))
+    try:
+        for n, (chunk_failures, chunk_invalid, capacity) in zip(sizes, results):
+            failures += chunk_failures
+            invalid += chunk_invalid
+            capacities.append(capacity)
+            done += n
+            logger.info("Reliability: %d / %d samples, %d failures", done, samples, failures)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return summarise(samples, failures, invalid, np.concatenate(capacities) if capacities else np.empty(0),
+                     percentiles, sequence.entropy)
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Persistent cache of bs_ultbearing_core results in an SQLite file, so that footings calculated before, in this
+or an earlier session, are not calculated again.  A footing is keyed by a hash of all its inputs (the arguments
+of bs_ultbearing_core, with the defaults applied) and bearing_formula.FORMULA_VERSION; results stored by another
+formula version are never used and are the first to be evicted.  Every entry holds the capacities, the effective
+dimensions and the 7 x 6 factor matrix.
+
+The cache keeps at most max_entries results; the least recently used ones are evicted first.  Hits and misses
+are counted in the file, so the hit rate over all runs can be reported:
+
+    python result_cache.py stats project_cache.sqlite
+    python result_cache.py evict project_cache.sqlite --max-entries 50000
+    python result_cache.py purge project_cache.sqlite    # drop results of other formula versions
+    python result_cache.py clear project_cache.sqlite
+
+A cached call costs about 40 us (hashing, the SQL select and the batched usage update) against about 100 us for
+bs_ultbearing_core, so the cache serves scalar callers such as the Calculate button of the GUI.  It is not used
+in front of bs_ultbearing_batch, which needs only about 2 us per footing (see benchmarks/bench_cache.py).
+
+In code, bs_ultbearing_core_cached takes the inputs of bs_ultbearing_core:
+
+    with ResultCache("project_cache.sqlite") as cache:
+        result = bs_ultbearing_core_cached(cache, **inputs)
+
+"""
+
+import argparse
+import hashlib
+import logging
+import os
+import sqlite3
+import struct
+import sys
+import time
+
+import numpy as np
+
+from bearing_batch import INPUT_COLUMNS, INPUT_DEFAULTS
+from bearing_formula import FORMULA_VERSION, BearingResult, bs_ultbearing_core
+
+logger = logging.getLogger(__name__)
+
+# Default largest number of stored results, about 450 bytes each
+CACHE_MAX_ENTRIES = 1000000
+
+# Every result is stored as one record of 48 floats: these fields followed by the 7 x 6 factors
+RECORD_FIELDS = ('capacity', 'capacity_d', 'capacity_ud', 'eff_width', 'eff_length', 'drained')
+RECORD_SIZE = len(RECORD_FIELDS) + 42
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    version TEXT NOT NULL,
+    record BLOB NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+# Hits whose usage time is kept in memory before it is written to the file in one statement
+_USAGE_FLUSH = 1000
+
+_NUMERIC_COLUMNS = tuple(name for name in INPUT_COLUMNS if name not in ('drainage', 'roughness'))
+_NUMERIC_PACK = struct.Struct(f"<{len(_NUMERIC_COLUMNS)}d")
+_RECORD_PACK = struct.Struct(f"<{RECORD_SIZE}d")
+
+
+def footing_key(inputs):
+    """
+    Return the cache key of a footing.
+
+    Parameters:
+        inputs - dict of the arguments of bs_ultbearing_core, those in bearing_batch.INPUT_DEFAULTS may be omitted
+
+    Returns:
+        key - 16 byte digest
+    """
+    values = {**INPUT_DEFAULTS, **inputs}
+    # -0.0 becomes 0.0, so that equal inputs give equal bytes
+    numeric = _NUMERIC_PACK.pack(*(float(values[name]) + 0.0 for name in _NUMERIC_COLUMNS))
+    return hashlib.blake2b(f"{FORMULA_VERSION}|".encode() + numeric +
+                           f"{values['drainage']}|{values['roughness']}".encode(), digest_size=16).digest()
+
+
+class ResultCache:
+    """
+    SQLite file of bs_ultbearing_core results keyed by footing_key.
+
+    The connection may be used from another thread than the one that opened it (e.g. the worker thread of the
+    GUI), but not from several threads at once.
+
+    Parameters:
+        path - file path, created if it does not exist
+        max_entries - largest number of stored results, the least recently used are evicted
+
+    Attributes:
+        hits, misses - footings found and not found since the cache was opened
+    """
+
+    def __init__(self, path, max_entries=CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+        self._used = {}
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+        self._entries = len(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Write the hit and miss counters and close the file."""
+        if self.connection is None:
+            return
+        self._flush_usage()
+        self._count(hits=self.hits, misses=self.misses)
+        self.hits = self.misses = 0
+        self.connection.close()
+        self.connection = None
+
+    def _count(self, **counts):
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value", counts.items())
+
+    def _flush_usage(self):
+        if self._used:
+            with self.connection:
+                self.connection.executemany("UPDATE results SET last_used = ? WHERE key = ?",
+                                            [(used, key) for key, used in self._used.items()])
+            self._used.clear()
+
+    def get(self, key):
+        """
+        Look up a footing and mark it as used when found.
+
+        Parameters:
+            key - key from footing_key
+
+        Returns:
+            result - BearingResult, None when the key is not found
+        """
+        row = self.connection.execute("SELECT record FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        # the usage time is written in batches, a commit per hit would cost more than the lookup
+        self._used[key] = time.time()
+        if len(self._used) >= _USAGE_FLUSH:
+            self._flush_usage()
+        self.hits += 1
+        record = _RECORD_PACK.unpack(row[0])
+        return BearingResult(*record[:5], np.reshape(record[6:], (7, 6)), record[5] == 1)
+
+    def put(self, key, result):
+        """
+        Store a result and evict the least recently used ones beyond max_entries.
+
+        Parameters:
+            key - key from footing_key
+            result - BearingResult of the footing
+        """
+        record = _RECORD_PACK.pack(*(float(getattr(result, name)) for name in RECORD_FIELDS),
+                                   *np.ravel(result.factors).astype(float))
+        with self.connection:
+            stored = self.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone()
+            self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                    (key, FORMULA_VERSION, record, time.time()))
+        # a replaced result does not add an entry
+        self._entries += stored is None
+        if self._entries > self.max_entries:
+            self.evict()
+
+    def evict(self, max_entries=None):
+        """
+        Delete results beyond max_entries, those of other formula versions first, then the least recently used.
+
+        Returns:
+            evicted - number of deleted results
+        """
+        max_entries = self.max_entries if max_entries is None else max_entries
+        self._flush_usage()
+        self._entries = len(self)
+        excess = self._entries - max_entries
+        if excess <= 0:
+            return 0
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM results WHERE key IN (SELECT key FROM results "
+                "ORDER BY version = ?, last_used LIMIT ?)", (FORMULA_VERSION, excess))
+            self._count(evicted=excess)
+        self._entries -= excess
+        logger.info("Evicted %d results from %s", excess, self.path)
+        return excess
+
+    def purge(self):
+        """Delete the results of other formula versions and return their number."""
+        with self.connection:
+            deleted = self.connection.execute("DELETE FROM results WHERE version != ?", (FORMULA_VERSION,)).rowcount
+        self._entries -= deleted
+        return deleted
+
+    def clear(self):
+        """Delete all results and counters."""
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("DELETE FROM counters")
+        self._used.clear()
+        self.hits = self.misses = self._entries = 0
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def stats(self):
+        """
+        Return the content and the hit rate of the cache over all runs, this one included.
+
+        Returns:
+            stats - dict with entries, current_version (entries of FORMULA_VERSION), file_bytes, hits, misses,
+                    hit_rate and evicted
+        """
+        counters = dict(self.connection.execute("SELECT name, value FROM counters"))
+        hits, misses = counters.get('hits', 0) + self.hits, counters.get('misses', 0) + self.misses
+        current = self.connection.execute("SELECT COUNT(*) FROM results WHERE version = ?",
+                                          (FORMULA_VERSION,)).fetchone()[0]
+        return {'entries': len(self), 'current_version': current,
+                'file_bytes': os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+                'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+                'evicted': counters.get('evicted', 0)}
+
+
+def bs_ultbearing_core_cached(cache, **inputs):
+    """
+    Compute the ultimate bearing capacity as bs_ultbearing_core, calculating only footings not in the cache and
+    storing their results.  Footings for which bs_ultbearing_core raises are not stored.
+
+    Parameters:
+        cache - ResultCache
+        inputs - keyword arguments of bs_ultbearing_core
+
+    Returns:
+        BearingResult
+    """
+    key = footing_key(inputs)
+    result = cache.get(key)
+    if result is None:
+        result = bs_ultbearing_core(**inputs)
+        cache.put(key, result)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report on or maintain a bearing capacity result cache.")
+    parser.add_argument("command", choices=["stats", "evict", "purge", "clear"],
+                        help="stats: entries and hit rate, evict: keep at most --max-entries results, "
+                             "purge: delete results of other formula versions, clear: delete everything")
+    parser.add_argument("cache", help="cache file")
+    parser.add_argument("--max-entries", type=int, default=CACHE_MAX_ENTRIES,
+                        help=f"largest number of results kept by evict (default {CACHE_MAX_ENTRIES})")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.cache):
+        print(f"{args.cache} does not exist")
+        return 1
+    with ResultCache(args.cache, args.max_entries) as cache:
+        if args.command == "evict":
+            print(f"{cache.evict()} results evicted")
+        elif args.command == "purge":
+            print(f"{cache.purge()} results of other formula versions deleted")
+        elif args.command == "clear":
+            cache.clear()
+            print("cache cleared")
+        stats = cache.stats()
+    print(f"{stats['entries']} results ({stats['current_version']} of formula version {FORMULA_VERSION}), "
+          f"{stats['file_bytes'] / 1e6:.1f} MB\n"
+          f"{stats['hits']} hits, {stats['misses']} misses, hit rate {stats['hit_rate']:.1%}, "
+          f"{stats['evicted']} evicted")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
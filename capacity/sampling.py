@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Stratified and quasi-random sampling of the bearing capacity for uncertainty studies.  The random inputs are
+the distributions of reliability (Normal, LogNormal, TruncatedNormal, optionally correlated); instead of
+independent random numbers they are driven by the points of a design in the unit hypercube:
+
+    'random' - independent uniform numbers, plain Monte Carlo for comparison
+    'lhs'    - Latin hypercube: every input is stratified into n equal-probability intervals with one point each
+    'sobol'  - Sobol sequence with a random digital shift (direction numbers of Joe and Kuo, up to 21 inputs)
+    'halton' - Halton sequence with a random (Cranley-Patterson) shift, up to 21 inputs
+
+A point u is mapped to standard normals Phi^-1(u), correlated by the Cholesky factor and mapped to the
+marginals exactly as in reliability.run_reliability, then evaluated with bs_ultbearing_batch.
+
+run_sampling monitors convergence: the sample size doubles every round (which keeps the Sobol points a
+balanced power of 2) and sampling stops when the statistic, capacity percentiles by default, has changed by
+less than rtol (relative) for patience rounds in a row, or when max_samples is reached.  Latin hypercube
+designs cannot be extended, so every round adds a new independent design of the size reached so far.
+
+The gain over plain Monte Carlo depends on the statistic: smooth statistics such as the mean converge much
+faster with the Sobol and Halton points, percentiles and failure probabilities (indicator functions) less so.
+benchmarks/bench_sampling.py measures the sample sizes needed for equal accuracy.
+
+"""
+
+import collections
+import logging
+
+import numpy as np
+
+from reliability import cholesky_factor, evaluate_samples, inputs_from_normals, norm_ppf, summarise
+
+logger = logging.getLogger(__name__)
+
+# Primitive polynomial (degree s, coefficient a) and initial direction numbers m of the Sobol sequence for the
+# dimensions 2 to 21, from the new-joe-kuo-6.21201 table; dimension 1 is the van der Corput sequence
+SOBOL_DIRECTIONS = (
+    (1, 0, (1,)), (2, 1, (1, 3)), (3, 1, (1, 3, 1)), (3, 2, (1, 1, 1)), (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)), (5, 2, (1, 1, 5, 5, 17)), (5, 4, (1, 1, 5, 5, 5)), (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)), (5, 13, (1, 1, 1, 3, 11)), (5, 14, (1, 3, 5, 5, 31)), (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)), (6, 16, (1, 3, 1, 13, 27, 49)), (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)), (6, 25, (1, 1, 5, 5, 19, 61)), (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)))
+SOBOL_BITS = 32
+
+HALTON_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71, 73)
+
+# Points are kept this far from 0 and 1, where Phi^-1 is infinite
+EDGE = 2.0 ** -53
+
+SamplingResult = collections.namedtuple('SamplingResult',
+                                        ['method', 'samples', 'converged', 'values', 'history', 'result'])
+SamplingResult.__doc__ = """
+    Results of run_sampling.
+
+    Fields:
+        method - sampling method
+        samples - number of capacity evaluations
+        converged - True when the statistic stabilised before max_samples was reached
+        values - np array of the final statistic (the capacity percentiles by default)
+        history - list of (samples, values) after every round
+        result - ReliabilityResult of all samples; its pf_std_error assumes independent samples and
+                 overstates the error of the stratified and quasi-random designs
+    """
+
+
+class RandomSampler:
+    """
+    Independent uniform points (plain Monte Carlo).
+
+    Parameters:
+        d - number of inputs
+        seed - int, SeedSequence or None
+    """
+
+    def __init__(self, d, seed=None):
+        self.d = d
+        self.rng = np.random.default_rng(seed)
+
+    def draw(self, n):
+        """Return the next n x d points in the unit hypercube."""
+        return self.rng.random((n, self.d))
+
+
+class LatinHypercube(RandomSampler):
+    """
+    Latin hypercube designs; every draw is a new independent design of n points.
+
+    Parameters:
+        d - number of inputs
+        seed - int, SeedSequence or None
+    """
+
+    def draw(self, n):
+        """Return a Latin hypercube of n x d points: one point in each of the n strata of every input."""
+        strata = self.rng.permuted(np.tile(np.arange(n), (self.d, 1)), axis=1).T
+        return (strata + self.rng.random((n, self.d))) / n
+
+
+class Sobol:
+    """
+    Sobol sequence in natural order with a random digital shift, which keeps its net properties.
+
+    Parameters:
+        d - number of inputs, at most 21
+        seed - int, SeedSequence or None
+        scramble - False for the unshifted sequence (its first point is 0, mapped to EDGE)
+    """
+
+    def __init__(self, d, seed=None, scramble=True):
+        if d > len(SOBOL_DIRECTIONS) + 1:
+            raise ValueError(f"The Sobol sequence is available for up to {len(SOBOL_DIRECTIONS) + 1} inputs")
+        self.d = d
+        self.directions = sobol_directions(d)
+        self.shift = (np.random.default_rng(seed).integers(0, 2 ** SOBOL_BITS, d, dtype=np.uint64) if scramble
+                      else np.zeros(d, dtype=np.uint64))
+        self.index = 0
+
+    def draw(self, n):
+        """Return the next n x d points of the sequence."""
+        index = np.arange(self.index, self.index + n, dtype=np.uint64)
+        if self.index + n > 2 ** SOBOL_BITS:
+            raise ValueError(f"The Sobol sequence is limited to 2^{SOBOL_BITS} points")
+        points = np.tile(self.shift, (n, 1))
+        for bit in range((self.index + n - 1).bit_length()):
+            on = ((index >> np.uint64(bit)) & np.uint64(1)).astype(bool)
+            points[on] ^= self.directions[:, bit]
+        self.index += n
+        return (points + 0.5) / 2.0 ** SOBOL_BITS
+
+
+def sobol_directions(d):
+    """
+    Return the direction numbers of the first d dimensions of the Sobol sequence.
+
+    Parameters:
+        d - number of dimensions
+
+    Returns:
+        directions - d x SOBOL_BITS np array of uint64, bit k of the point index selects column k
+    """
+    directions = np.zeros((d, SOBOL_BITS), dtype=np.uint64)
+    directions[0] = [1 << (SOBOL_BITS - 1 - k) for k in range(SOBOL_BITS)]
+    for j, (s, a, m) in enumerate(SOBOL_DIRECTIONS[:d - 1], start=1):
+        v = [m[k] << (SOBOL_BITS - 1 - k) for k in range(s)]
+        for k in range(s, SOBOL_BITS):
+            value = v[k - s] ^ (v[k - s] >> s)
+            for i in range(1, s):
+                if (a >> (s - 1 - i)) & 1:
+                    value ^= v[k - i]
+            v.append(value)
+        directions[j] = v
+    return directions
+
+
+class Halton:
+    """
+    Halton sequence with a random (Cranley-Patterson) shift modulo 1, starting at index 1.
+
+    Parameters:
+        d - number of inputs, at most 21
+        seed - int, SeedSequence or None
+        scramble - False for the unshifted sequence
+    """
+
+    def __init__(self, d, seed=None, scramble=True):
+        if d > len(HALTON_PRIMES):
+            raise ValueError(f"The Halton sequence is available for up to {len(HALTON_PRIMES)} inputs")
+        self.d = d
+        self.shift = np.random.default_rng(seed).random(d) if scramble else np.zeros(d)
+        self.index = 1
+
+    def draw(self, n):
+        """Return the next n x d points of the sequence."""
+        index = np.arange(self.index, self.index + n)
+        points = np.empty((n, self.d))
+        for j, base in enumerate(HALTON_PRIMES[:self.d]):
+            points[:, j] = radical_inverse(index, base)
+        self.index += n
+        points += self.shift
+        return points % 1.0
+
+
+def radical_inverse(index, base):
+    """
+    Return the radical inverse of integers: their digits in the given base mirrored about the point.
+
+    Parameters:
+        index - np array of non-negative integers
+        base - int
+    """
+    index = np.array(index, dtype=np.int64)
+    result = np.zeros(index.shape)
+    scale = 1.0 / base
+    while index.any():
+        index, digit = np.divmod(index, base)
+        result += digit * scale
+        scale /= base
+    return result
+
+
+SAMPLERS = {'random': RandomSampler, 'lhs': LatinHypercube, 'sobol': Sobol, 'halton': Halton}
+
+
+def run_sampling(variables, fixed=None, correlation=None, method='sobol', percentiles=(1, 5, 50, 95, 99),
+                 statistic=None, rtol=5e-3, patience=2, initial=1024, max_samples=2 ** 20, fos=1.0, seed=None,
+                 rounding=True):
+    """
+    Sample the capacity until a statistic stabilises.
+
+    Parameters:
+        variables - dict of distributions keyed by input column names, as for run_reliability
+        fixed - dict of scalar inputs shared by all samples
+        correlation - optional correlation matrix of the variables
+        method - key of SAMPLERS
+        percentiles - capacity percentiles monitored when statistic is None, in percent
+        statistic - optional function of (capacity, failed) of all samples so far returning a float or np array
+                    to monitor instead, e.g. lambda capacity, failed: failed.mean() for the failure probability;
+                    capacity is nan for samples without a finite capacity or effective area
+        rtol - relative change of every monitored value below which a round counts as stable
+        patience - number of stable rounds in a row needed to stop
+        initial - samples of the first round, a power of 2 suits the Sobol sequence
+        max_samples - largest number of samples
+        fos - required factor of safety for the failure count
+        seed - int or None, for the randomisation of the design
+        rounding - passed to bs_ultbearing_batch
+
+    Returns:
+        SamplingResult
+    """
+    if method not in SAMPLERS:
+        raise ValueError(f"Unknown sampling method {method!r}, use one of {sorted(SAMPLERS)}")
+    cholesky = cholesky_factor(variables, correlation)
+    sequence = np.random.SeedSequence(seed)
+    sampler = SAMPLERS[method](len(variables), sequence)
+
+    capacities, failed = [], []
+    history, previous, stable, total = [], None, 0, 0
+    while True:
+        size = total or initial
+        points = np.clip(sampler.draw(size), EDGE, 1 - EDGE)
+        inputs = inputs_from_normals(variables, norm_ppf(points), cholesky)
+        capacity, chunk_failed, valid = evaluate_samples(inputs, fixed, fos, rounding)
+        capacities.append(np.where(valid, capacity, np.nan))
+        failed.append(chunk_failed)
+        total += size
+
+        capacity, all_failed = np.concatenate(capacities), np.concatenate(failed)
+        if statistic is None:
+            finite = capacity[np.isfinite(capacity)]
+            values = np.percentile(finite, percentiles) if finite.size else np.full(len(percentiles), np.nan)
+        else:
+            values = np.atleast_1d(np.asarray(statistic(capacity, all_failed), dtype=float))
+        history.append((total, values))
+        logger.info("Sampling (%s): %d samples, statistic %s", method, total, values)
+
+        if previous is not None and np.all(np.abs(values - previous) <= rtol * np.abs(previous)):
+            stable += 1
+        else:
+            stable = 0
+        previous = values
+        if stable >= patience or 2 * total > max_samples:
+            break
+
+    finite = capacity[np.isfinite(capacity)]
+    result = summarise(total, int(all_failed.sum()), int(total - finite.size), finite, percentiles,
+                       sequence.entropy)
+    return SamplingResult(method, total, stable >= patience, values, history, result)
@@ -9,10 +9,17 @@ from reportlab.lib.units import inch
 # Function to add page numbers
 from reportlab.lib.units import mm
 from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, ContentStream, DecodedStreamObject, DictionaryObject, IndirectObject, NameObject
 from reportlab.pdfgen import canvas
+import functools
 import io
 import os
 
+import profiling
+
+# Report template, located relative to this module so that reports do not depend on the working directory
+TEMPLATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates", "report_template.pdf")
+
 
 
 # Function to get table style
@@ -37,7 +44,10 @@ def add_page_number(canvas, doc):
     canvas.drawRightString(200 * mm, 15 * mm, text)
 
 
-def compile_content_page(series0, series1, series2, series3, dataframe4, titlelist, capacity):
+@profiling.stage
+def compile_content_page(series0, series1, series2, series3, dataframe4, titlelist, capacity,
+                         output="reports/content_page.pdf"):
+    # output is either a file path or a writable binary stream such as io.BytesIO
     df_list =[series0.reset_index(), series1.reset_index(), series2.reset_index(), series3.reset_index(), dataframe4.reset_index()]
     df_list[0].columns = ['Dimensions', 'Values']
     df_list[1].columns = ['Soil Parameters', 'Values']
@@ -90,12 +100,14 @@ def compile_content_page(series0, series1, series2, series3, dataframe4, titleli
     ]))
 
     # Initialize PDF document
-    # Ensure the "reports" folder exists
-    if not os.path.exists("reports"):
-        os.makedirs("reports")
+    # Ensure the folder of an output file (by default "reports") exists
+    if isinstance(output, str):
+        folder = os.path.dirname(output)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
 
     pdf = SimpleDocTemplate(
-        "reports/content_page.pdf",
+        output,
         pagesize=A4,
         rightMargin=RIGHT_MARGIN,
         leftMargin=LEFT_MARGIN,
@@ -144,43 +156,111 @@ def compile_content_page(series0, series1, series2, series3, dataframe4, titleli
 
     pdf.build(elements, onFirstPage=add_page_number, onLaterPages=add_page_number)
 
-def combine_pdf(text, file1, file2):
-    # Ensure the "reports" folder exists
-    if not os.path.exists("reports"):
-        os.makedirs("reports")
-
-    # Build output file path (final combined PDF)
-    output_path = os.path.join("reports", f"{text}.pdf")
-
-    # Load the two PDF files
-    reader1 = PdfReader(file1 + ".pdf")
-    reader2 = PdfReader(file2 + ".pdf")
-
-    # Create a writer object to combine pages
+def _pdf_reader(pdf):
+    # pdf is a file path, the pdf as bytes or a readable binary stream
+    if isinstance(pdf, (bytes, bytearray)):
+        pdf = io.BytesIO(pdf)
+    elif not isinstance(pdf, str):
+        pdf.seek(0)
+    return PdfReader(pdf)
+
+
+@profiling.stage
+def add_first_pages(writer, *pdfs):
+    # Add the first page of every pdf (file path, bytes or binary stream) to writer
+    for pdf in pdfs:
+        writer.add_page(_pdf_reader(pdf).pages[0])
+
+
+@profiling.stage
+def write_pdf(writer, output):
+    # Write to a file path or a writable binary stream, or return the pdf as bytes when output is None
+    if output is None:
+        stream = io.BytesIO()
+        writer.write(stream)
+        return stream.getvalue()
+    if isinstance(output, str):
+        with open(output, "wb") as f:
+            writer.write(f)
+    else:
+        writer.write(output)
+
+
+@profiling.stage
+def combine_pdf(text, file1, file2, output=None):
+    # file1 and file2 are either the path without ".pdf" of a temporary file, removed after combining,
+    # or the pdf itself as bytes or a binary stream, as returned by build_report's steps
+    temp_files = [file + ".pdf" for file in (file1, file2) if isinstance(file, str)]
+    file1, file2 = [file + ".pdf" if isinstance(file, str) else file for file in (file1, file2)]
+
+    # Create a writer object and add the first page of file1 and of file2
     writer = PdfWriter()
+    add_first_pages(writer, file1, file2)
 
-    # Add the first page of file1.pdf
-    writer.add_page(reader1.pages[0])
+    if output is not None:
+        # Write to the given file path or binary stream
+        write_pdf(writer, output)
+    else:
+        # Ensure the "reports" folder exists
+        if not os.path.exists("reports"):
+            os.makedirs("reports")
 
-    # Add the first page of file2.pdf
-    writer.add_page(reader2.pages[0])
+        # Build output file path (final combined PDF)
+        output_path = os.path.join("reports", f"{text}.pdf")
 
-    # Write to the new file in the "reports" folder
-    with open(output_path, "wb") as output_pdf:
-        writer.write(output_pdf)
-    print(f"PDF file saved as {output_path}")
+        # Write to the new file in the "reports" folder
+        write_pdf(writer, output_path)
+        print(f"PDF file saved as {output_path}")
 
     # ---------------------------------------
     # Remove temporary PDFs after combining
     # ---------------------------------------
-    try:
-        os.remove(file1 + ".pdf")
-        os.remove(file2 + ".pdf")
-        print("Temporary files removed.")
-    except OSError as e:
-        print(f"Error removing temp files: {e}")
-
-
+    if temp_files:
+        try:
+            for file in temp_files:
+                os.remove(file)
+            print("Temporary files removed.")
+        except OSError as e:
+            print(f"Error removing temp files: {e}")
+
+
+@profiling.stage
+def build_report(series0, series1, series2, series3, dataframe4, titlelist, capacity, output=None, progress=None):
+    """
+    Build the complete report (front page and content page) in memory, without temporary files.
+
+    Parameters:
+        series0 ... dataframe4, titlelist, capacity - as for compile_content_page
+        output - file path or writable binary stream, None to return the report
+        progress - optional callback progress(fraction, text) called before every step
+
+    Returns:
+        report - pdf as bytes when output is None, otherwise None
+    """
+    if progress is None:
+        progress = lambda fraction, text="": None
+
+    progress(0.0, "Compiling content page")
+    content_page = io.BytesIO()
+    compile_content_page(series0, series1, series2, series3, dataframe4, titlelist, capacity, output=content_page)
+    progress(0.6, "Preparing front page")
+    frontpage = io.BytesIO()
+    prepare_frontpage(titlelist, output_file=frontpage)
+
+    progress(0.8, "Combining pages")
+    writer = PdfWriter()
+    add_first_pages(writer, frontpage, content_page)
+    if isinstance(output, str):
+        # the file is written only when the report is complete
+        report = write_pdf(writer, None)
+        progress(0.95, "Writing report")
+        with open(output, "wb") as f:
+            f.write(report)
+        return None
+    return write_pdf(writer, output)
+
+
+@profiling.stage
 def generate_dynamic_content(list):
     packet = io.BytesIO()
     c = canvas.Canvas(packet, pagesize=A4)
@@ -203,9 +283,75 @@ def generate_dynamic_content(list):
     return packet
 
 
+@functools.lru_cache(maxsize=8)
+def load_template(template_file):
+    # Parse a report template once per process and keep it in memory.
+    # The parsed pages are copied into every report and never modified, so they can be reused.
+    # Call load_template.cache_clear() after changing a template file on disk.
+    with open(template_file, "rb") as f:
+        return PdfReader(io.BytesIO(f.read()))
+
+
+def _stream(data, writer):
+    # streams have to be indirect objects of the written file.  PdfWriter 3.0.1 does not make a direct stream
+    # of a page it owns indirect (page.merge_page writes such a stream inline), and _add_object is its only way
+    # to add an object, so PyPDF2 is pinned in requirements.txt
+    stream = DecodedStreamObject()
+    stream.set_data(data)
+    return writer._add_object(stream)
+
+
+@profiling.stage
+def stamp_page(page, overlay_page, writer):
+    # Draw overlay_page on top of page, a page of writer.  The content streams of the overlay are appended
+    # to those of page, so the (large) content of a template page is never parsed, unlike page.merge_page.
+    overlay_resources = overlay_page["/Resources"].get_object()
+    if "/Resources" not in page:
+        page[NameObject("/Resources")] = DictionaryObject()
+    resources = page["/Resources"].get_object()
+
+    # copy the overlay resources into the page, renaming those whose names are already used
+    rename = {}
+    for category, entries in overlay_resources.items():
+        entries = entries.get_object()
+        if category == "/ProcSet":
+            procset = resources.get(category, ArrayObject()).get_object()
+            resources[NameObject(category)] = ArrayObject(set(procset) | set(entries))
+            continue
+        if category not in resources:
+            resources[NameObject(category)] = DictionaryObject()
+        target = resources[category].get_object()
+        for name, value in entries.items():
+            new_name = name
+            while new_name in target:
+                new_name = NameObject(new_name + "s")
+            rename[name] = new_name
+            target[NameObject(new_name)] = value.clone(writer)
+
+    overlay = ContentStream(overlay_page.get_contents(), overlay_page.pdf)
+    for operands, _ in overlay.operations:
+        if isinstance(operands, list):
+            operands[:] = [rename.get(operand, operand) if isinstance(operand, NameObject) else operand
+                           for operand in operands]
+
+    # q ... Q isolates the graphics state of the page content from the overlay
+    contents = page.get("/Contents", ArrayObject())
+    if isinstance(contents, IndirectObject):
+        contents = contents.get_object()
+    if not isinstance(contents, ArrayObject):
+        contents = ArrayObject([page.raw_get("/Contents")])
+    contents = [c if isinstance(c, IndirectObject) else writer._add_object(c) for c in contents]
+    page[NameObject("/Contents")] = ArrayObject([_stream(b"q\n", writer), *contents,
+                                                 _stream(b"\nQ\nq\n" + overlay.get_data() + b"\nQ\n", writer)])
+
+
+@profiling.stage
 def merge_pdfs(template_file, dynamic_pdf, output_file):
-    # Read the template PDF
-    template_pdf = PdfReader(template_file)
+    # Read the template PDF, a file path is parsed only once (see load_template)
+    if isinstance(template_file, str):
+        template_pdf = load_template(template_file)
+    else:
+        template_pdf = PdfReader(template_file)
     # Read the dynamic content PDF
     dynamic_pdf_reader = PdfReader(dynamic_pdf)
     dynamic_page = dynamic_pdf_reader.pages[0]
@@ -214,22 +360,19 @@ def merge_pdfs(template_file, dynamic_pdf, output_file):
 
     # Assume template has at least one page
     for page_num in range(len(template_pdf.pages)):
-        template_page = template_pdf.pages[page_num]
+        # add_page copies the template page into the writer, the copy receives the dynamic content
+        page = writer.add_page(template_pdf.pages[page_num])
         if page_num == 0:
             # Merge dynamic content onto the first page
-            template_page.merge_page(dynamic_page)
-        writer.add_page(template_page)
-
-    # Write out the merged PDF
-    with open(output_file, "wb") as f:
-        writer.write(f)
+            stamp_page(page, dynamic_page, writer)
 
+    # Write out the merged PDF, output_file is a file path or a writable binary stream
+    write_pdf(writer, output_file)
 
-def prepare_frontpage(list):
-    # prepare output file as temp_frontpage.pdf
 
-    template_file = "templates/report_template.pdf"
-    output_file = "reports/temp_frontpage.pdf"
+@profiling.stage
+def prepare_frontpage(list, output_file="reports/temp_frontpage.pdf", template_file=TEMPLATE_FILE):
+    # prepare output file as temp_frontpage.pdf, or write it to a binary stream
 
 
     # Step 2: Generate dynamic content PDF
@@ -0,0 +1,496 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Local HTTP/JSON service for the ultimate bearing capacity, so that other tools (spreadsheets, model exporters)
+get results without starting a Python process and paying the import cost per request.  The server runs on
+asyncio with the standard library only and listens on localhost by default.
+
+Concurrent requests are micro-batched: footings arriving within max_wait seconds (or until max_batch footings
+are queued) are evaluated together with bs_ultbearing_batch in warm worker processes, while the next batch is
+collected.  Results are the same as bs_ultbearing_batch gives for each footing on its own.
+
+    python service.py [--port 8765] [--workers 1] [--max-batch 4096] [--max-wait 0.002]
+
+Endpoints:
+    POST /capacity  one footing as a JSON object keyed by bearing_batch.INPUT_COLUMNS (those in INPUT_DEFAULTS
+                    may be omitted), or {"footings": [...], "rounding": true, "factors": false}.  Returns one
+                    result object, or {"results": [...]} for a list, with capacity, capacity_d, capacity_ud,
+                    eff_width, eff_length, drained and optionally the 7 x 6 factors; nan and inf become null.
+    GET /metrics    requests, footings, batch sizes, latency percentiles and throughput since the start
+    GET /health     {"status": "ok"}
+
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import math
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bearing_batch import INPUT_COLUMNS, INPUT_DEFAULTS, bs_ultbearing_batch
+
+logger = logging.getLogger(__name__)
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+
+# Largest number of footings per evaluation and longest wait for more footings to join a batch in s
+MAX_BATCH = 4096
+MAX_WAIT = 0.002
+
+# Largest request body in bytes and number of requests kept for the latency percentiles
+MAX_BODY = 16 * 2 ** 20
+LATENCY_WINDOW = 10000
+
+RESULT_FIELDS = ('capacity', 'capacity_d', 'capacity_ud', 'eff_width', 'eff_length', 'drained')
+
+_TEXT_COLUMNS = ('drainage', 'roughness')
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    """Error in a request, answered with the given HTTP status."""
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def footing_columns(footings):
+    """
+    Convert a list of footings given as dicts into input columns, with the defaults of INPUT_DEFAULTS applied.
+
+    Parameters:
+        footings - list of dicts keyed by names in INPUT_COLUMNS
+
+    Returns:
+        columns - dict of np arrays keyed by all INPUT_COLUMNS, float except for drainage and roughness
+    """
+    if not isinstance(footings, list) or not footings:
+        raise RequestError("footings must be a non-empty list of objects")
+    for i, footing in enumerate(footings):
+        if not isinstance(footing, dict):
+            raise RequestError(f"footing {i} is not an object")
+        unknown = set(footing) - set(INPUT_COLUMNS)
+        if unknown:
+            raise RequestError(f"footing {i}: unknown input columns {sorted(unknown)}")
+        missing = [name for name in INPUT_COLUMNS if name not in footing and name not in INPUT_DEFAULTS]
+        if missing:
+            raise RequestError(f"footing {i}: missing input columns {missing}")
+
+    columns = {}
+    for name in INPUT_COLUMNS:
+        values = [footing.get(name, INPUT_DEFAULTS.get(name)) for footing in footings]
+        if name in _TEXT_COLUMNS:
+            columns[name] = np.array([str(value) for value in values], dtype=object)
+            continue
+        try:
+            # bool is an int to Python, but true as a width is a mistake
+            if any(isinstance(value, (bool, str)) or value is None for value in values):
+                raise TypeError
+            columns[name] = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            raise RequestError(f"{name} must be a number in every footing") from None
+    return columns
+
+
+def request_flag(request, name, default):
+    """Return the option name of a request object, which must be a JSON boolean when given."""
+    value = request.get(name, default)
+    if not isinstance(value, bool):
+        raise RequestError(f"{name} must be true or false")
+    return value
+
+
+def evaluate_batch(columns, rounding=True):
+    """
+    Evaluate one batch of footings; runs in a worker process.
+
+    Parameters:
+        columns - dict of np arrays keyed by all INPUT_COLUMNS
+        rounding - passed to bs_ultbearing_batch
+
+    Returns:
+        results - dict of np arrays keyed by RESULT_FIELDS and factors (n x 7 x 6)
+    """
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        result = bs_ultbearing_batch(rounding=rounding, **columns)
+    results = {name: getattr(result, name) for name in RESULT_FIELDS}
+    results['factors'] = result.factors
+    return results
+
+
+def _warm_worker():
+    # import and run the calculation once, so that the first request does not pay for it
+    evaluate_batch(footing_columns([{'width': 2.0, 'length': 3.0, 'cohesion': 5.0, 'friction': 30.0,
+                                     'gamma': 19.0, 'depth': 1.0, 'water_depth': 1.5, 'vertical_load': 1500.0}]))
+
+
+def _json_value(value):
+    # nan and inf are not valid JSON
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def result_records(results, factors=False):
+    """Convert the results of evaluate_batch into a list of JSON ready dicts, one per footing."""
+    numeric = np.column_stack([results[name] for name in RESULT_FIELDS[:-1]]).tolist()
+    records = []
+    for i, row in enumerate(numeric):
+        record = {name: value if math.isfinite(value) else None for name, value in zip(RESULT_FIELDS, row)}
+        record['drained'] = bool(results['drained'][i])
+        if factors:
+            record['factors'] = [[_json_value(value) for value in line] for line in results['factors'][i]]
+        records.append(record)
+    return records
+
+
+class Metrics:
+    """
+    Request and batch statistics of the service.
+
+    Parameters:
+        window - number of most recent requests kept for the latency percentiles and the recent throughput
+    """
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.started = time.time()
+        self.requests = self.footings = self.batches = self.batch_footings = self.max_batch = 0
+        self.batch_seconds = 0.0
+        self.status = collections.Counter()
+        self.recent = collections.deque(maxlen=window)  # (finish time, latency in s, footings)
+
+    def record_request(self, status, seconds, footings=0):
+        """Count one answered request."""
+        self.requests += 1
+        self.footings += footings
+        self.status[status] += 1
+        self.recent.append((time.time(), seconds, footings))
+
+    def record_batch(self, footings, seconds):
+        """Count one evaluated batch."""
+        self.batches += 1
+        self.batch_footings += footings
+        self.max_batch = max(self.max_batch, footings)
+        self.batch_seconds += seconds
+
+    def snapshot(self, queued=0):
+        """
+        Return the statistics as a JSON ready dict.
+
+        Parameters:
+            queued - number of footings waiting for a batch
+        """
+        now = time.time()
+        uptime = now - self.started
+        latencies = np.array([seconds for _, seconds, _ in self.recent]) * 1e3
+        if len(self.recent) > 1:
+            span = max(now - self.recent[0][0], 1e-9)
+            recent_requests, recent_footings = len(self.recent) / span, sum(f for _, _, f in self.recent) / span
+        else:
+            recent_requests = recent_footings = 0.0
+        return {
+            'uptime_s': uptime, 'requests': self.requests, 'footings': self.footings,
+            'status': {str(status): count for status, count in sorted(self.status.items())},
+            'queued_footings': queued,
+            'batches': self.batches,
+            'mean_batch_size': self.batch_footings / self.batches if self.batches else 0.0,
+            'max_batch_size': self.max_batch,
+            'evaluation_us_per_footing': self.batch_seconds / self.batch_footings * 1e6 if self.batch_footings
+                                         else 0.0,
+            'latency_ms': {'p50': _percentile(latencies, 50), 'p95': _percentile(latencies, 95),
+                           'p99': _percentile(latencies, 99),
+                           'mean': float(latencies.mean()) if latencies.size else 0.0,
+                           'max': float(latencies.max()) if latencies.size else 0.0},
+            'throughput': {'requests_per_s': self.requests / uptime if uptime > 0 else 0.0,
+                           'footings_per_s': self.footings / uptime if uptime > 0 else 0.0,
+                           'recent_requests_per_s': recent_requests, 'recent_footings_per_s': recent_footings},
+        }
+
+
+def _percentile(values, q):
+    return float(np.percentile(values, q)) if values.size else 0.0
+
+
+class BatchEvaluator:
+    """
+    Collect footings from concurrent requests into batches and evaluate them in worker processes.
+
+    Parameters:
+        workers - number of warm worker processes, 0 to evaluate in a thread of this process
+        max_batch - largest number of footings per evaluation
+        max_wait - longest time in s a footing waits for others to join its batch
+        metrics - Metrics recording every batch
+    """
+
+    def __init__(self, workers=1, max_batch=MAX_BATCH, max_wait=MAX_WAIT, metrics=None):
+        self.workers = workers
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.metrics = metrics
+        self.queue = asyncio.Queue()
+        self.queued = 0
+        self.executor = None
+        self._in_flight = asyncio.Semaphore(max(workers, 1))
+        self._collector = None
+        self._tasks = set()
+
+    async def start(self):
+        """Start the worker processes, wait until they are warm and start collecting batches."""
+        loop = asyncio.get_running_loop()
+        if self.workers > 0:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+            await asyncio.gather(*(loop.run_in_executor(self.executor, _warm_worker) for _ in range(self.workers)))
+        else:
+            await loop.run_in_executor(None, _warm_worker)
+        self._collector = asyncio.create_task(self._collect())
+
+    async def close(self):
+        """Stop collecting and shut the worker processes down."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, *self._tasks, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def evaluate(self, columns, rounding=True):
+        """
+        Evaluate footings as part of the next batch.
+
+        Parameters:
+            columns - dict of np arrays from footing_columns
+            rounding - True or False, passed to bs_ultbearing_batch
+
+        Returns:
+            results - dict of np arrays as evaluate_batch
+        """
+        if not isinstance(rounding, bool):
+            # batches are grouped by rounding is True and is False, any other value would never be evaluated
+            raise TypeError(f"rounding must be True or False, not {rounding!r}")
+        future = asyncio.get_running_loop().create_future()
+        size = len(columns['width'])
+        self.queued += size
+        await self.queue.put((columns, rounding, size, future))
+        return await future
+
+    async def _collect(self):
+        while True:
+            pending = [await self.queue.get()]
+            size = pending[0][2]
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += item[2]
+            self.queued -= size
+
+            # one evaluation per rounding option; evaluations overlap up to the number of workers
+            for rounding in (True, False):
+                group = [item for item in pending if item[1] == rounding]
+                if group:
+                    await self._in_flight.acquire()
+                    task = asyncio.create_task(self._evaluate(group, rounding))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+
+    async def _evaluate(self, group, rounding):
+        try:
+            columns = {name: np.concatenate([item[0][name] for item in group]) for name in INPUT_COLUMNS}
+            started = time.perf_counter()
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, evaluate_batch, columns,
+                                                                        rounding)
+            if self.metrics is not None:
+                self.metrics.record_batch(len(columns['width']), time.perf_counter() - started)
+            start = 0
+            for _, _, size, future in group:
+                if not future.done():
+                    future.set_result({name: values[start:start + size] for name, values in results.items()})
+                start += size
+        except Exception as e:
+            logger.exception("Batch of %d requests failed", len(group))
+            for item in group:
+                if not item[3].done():
+                    item[3].set_exception(e)
+        finally:
+            self._in_flight.release()
+
+
+class CapacityService:
+    """
+    HTTP/1.1 server with keep-alive connections answering the endpoints listed in the module docstring.
+
+    Parameters:
+        host, port - address to listen on, port 0 to pick a free port
+        workers, max_batch, max_wait - passed to BatchEvaluator
+    """
+
+    def __init__(self, host=SERVICE_HOST, port=SERVICE_PORT, workers=1, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.host = host
+        self.port = port
+        self.metrics = Metrics()
+        self.evaluator = BatchEvaluator(workers, max_batch, max_wait, self.metrics)
+        self.server = None
+
+    async def start(self):
+        """Start the workers and listen; self.port is the bound port afterwards."""
+        await self.evaluator.start()
+        self.server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.info("Bearing capacity service on http://%s:%d with %d workers", self.host, self.port,
+                    self.evaluator.workers)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.evaluator.close()
+
+    async def _connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except RequestError as e:
+                    self.metrics.record_request(e.status, 0.0)
+                    await _write_response(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                started = time.perf_counter()
+                footings = 0
+                try:
+                    status, payload, footings = await self._route(method, path, body)
+                except RequestError as e:
+                    status, payload = e.status, {'error': str(e)}
+                except Exception as e:
+                    logger.exception("Request %s %s failed", method, path)
+                    status, payload = 500, {'error': str(e)}
+                self.metrics.record_request(status, time.perf_counter() - started, footings)
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, body):
+        path = path.split("?", 1)[0]
+        if path == "/capacity":
+            if method != "POST":
+                raise RequestError("use POST for /capacity", 405)
+            return await self._capacity(body)
+        if path in ("/metrics", "/health"):
+            if method != "GET":
+                raise RequestError(f"use GET for {path}", 405)
+            if path == "/health":
+                return 200, {'status': 'ok'}, 0
+            return 200, self.metrics.snapshot(self.evaluator.queued), 0
+        raise RequestError(f"no endpoint {path}", 404)
+
+    async def _capacity(self, body):
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            raise RequestError(f"invalid JSON: {e}") from None
+        single = isinstance(request, dict) and 'footings' not in request
+        if single:
+            footings, rounding, factors = [request], True, False
+        elif isinstance(request, dict):
+            footings = request['footings']
+            rounding, factors = request_flag(request, 'rounding', True), request_flag(request, 'factors', False)
+        else:
+            footings, rounding, factors = request, True, False
+        columns = footing_columns(footings)
+        records = result_records(await self.evaluator.evaluate(columns, rounding), factors)
+        return 200, records[0] if single else {'results': records}, len(records)
+
+
+async def _read_request(reader):
+    # Returns (method, path, body, keep_alive), or None when the client closed the connection
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, version = line.decode('latin-1').split()
+    except ValueError:
+        raise RequestError("malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode('latin-1').partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        raise RequestError("invalid Content-Length") from None
+    if length > MAX_BODY:
+        raise RequestError(f"request body larger than {MAX_BODY} bytes", 413)
+    body = await reader.readexactly(length) if length else b""
+    connection = headers.get('connection', '').lower()
+    keep_alive = connection != 'close' if version == "HTTP/1.1" else connection == 'keep-alive'
+    return method, path, body, keep_alive
+
+
+async def _write_response(writer, status, payload, keep_alive=True):
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                 f"\r\n".encode() + body)
+    await writer.drain()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the ultimate bearing capacity over HTTP/JSON.")
+    parser.add_argument("--host", default=SERVICE_HOST, help=f"address to listen on (default {SERVICE_HOST})")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help=f"port (default {SERVICE_PORT})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="warm worker processes, 0 to evaluate in this process (default 1)")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH,
+                        help=f"largest number of footings per evaluation (default {MAX_BATCH})")
+    parser.add_argument("--max-wait", type=float, default=MAX_WAIT,
+                        help=f"longest wait in s for footings to join a batch (default {MAX_WAIT})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    service = CapacityService(args.host, args.port, args.workers, args.max_batch, args.max_wait)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
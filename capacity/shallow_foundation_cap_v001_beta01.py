@@ -3,12 +3,23 @@ import logging
 from tkinter import *
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk
-from bearing_formula import *
-from savepdf import *
+import time
+import pandas as pd
+from bearing_formula import bearing_report
+from gui_worker import BackgroundTask
+from incremental import IncrementalBearing, NODES
 
+# Delay after the last edit before a live recalculation, and the time a live update should fit in (ms)
+LIVE_DELAY_MS = 250
+FRAME_BUDGET_MS = 16
 
-logging.basicConfig(filename='error.log', level=logging.DEBUG)
+# Results of the Calculate button are kept in this file (see result_cache), so that footings calculated before,
+# in this or an earlier session, are looked up instead of calculated again
+RESULT_CACHE_FILE = 'result_cache.sqlite'
+result_cache = None
+
+# PIL and the pdf modules (reportlab, PyPDF2) are imported where they are used, so that importing this
+# module does not load them and no window is created until main() is called.
 
 class BearingCalculation(Frame):
     """PURPOSE:
@@ -16,12 +27,18 @@ class BearingCalculation(Frame):
     ultimate bearing capacity.  Form 4 pandas series: Dimensions series, soil series, geometry series and load series.
     Pass these 4 series to bearing_formula and obtain the calculation results.
     Display the calculation results in text box.
+    The calculation and the pdf report run in a background thread (see gui_worker), so the window stays
+    responsive and a running job can be cancelled.
     """
 
     def __init__(self, master):
         """Initialize Frame"""
         super(BearingCalculation, self).__init__(master)
         self.grid()
+        self.task = BackgroundTask(self)
+        self.result = None
+        self.live = None
+        self.live_after = None
         self.foundation_parameter()
 
 
@@ -214,8 +231,25 @@ class BearingCalculation(Frame):
         self.pdf = Button(self, text="Print pdf", command=self.create_pdf)
         self.pdf.grid(row=row_n+1, column=2, padx=10, sticky=W)
 
-        Label(self, text=" ").grid(row=row_n+2, column=0, sticky=W)
-        Label(self, text=" ").grid(row=row_n+3, column=0, sticky=W)
+        self.cancelbttn = Button(self, text="Cancel", command=self.cancel_task, state=DISABLED)
+        self.cancelbttn.grid(row=row_n+1, column=4, padx=10, sticky=W)
+
+        # Live mode recalculates after every edit
+        self.live_var = IntVar(self, value=0)
+        self.livebttn = Checkbutton(self, text="Live update", variable=self.live_var,
+                                    command=self.schedule_live_update)
+        self.livebttn.grid(row=row_n+3, column=0, padx=10, sticky=W)
+        for entry in (self.item_w_ent, self.item_l_ent, self.item_th_ent, self.item_c_ent, self.item_f_ent,
+                      self.item_g_ent, self.item_sh_ent, self.item_d_ent, self.item_slope_ent, self.item_tilt_ent,
+                      self.item_water_ent, self.item_N_ent, self.item_H_W_ent, self.item_H_L_ent, self.item_q_ent,
+                      self.item_M_W_ent, self.item_M_L_ent):
+            entry.bind("<KeyRelease>", self.schedule_live_update)
+
+        # Progress of the background job
+        self.progress = ttk.Progressbar(self, orient=HORIZONTAL, mode="determinate", maximum=1.0, length=300)
+        self.progress.grid(row=row_n+2, column=0, columnspan=3, padx=10, sticky=W)
+        self.status = Label(self, text="")
+        self.status.grid(row=row_n+2, column=4, padx=10, sticky=W)
 
         self.results_box1 = Text(self, width=60, height=15, wrap=WORD)
         self.results_box1.grid(row=1, column=6, rowspan=12, columnspan=4, padx=10, sticky=W)
@@ -223,6 +257,8 @@ class BearingCalculation(Frame):
 
 
         # Add images to explain the input parameters
+        from PIL import Image, ImageTk
+
         current_dir = os.path.dirname(os.path.abspath(__file__))
         image_path1 = os.path.join(current_dir, "images", "footing_1.jpg")
         image_path2 = os.path.join(current_dir, "images", "footing_2.jpg")
@@ -256,92 +292,211 @@ class BearingCalculation(Frame):
     def on_select(self, event):
         self.analysis_condition = self.dropdown_var.get()
         self.roughness = self.dropdown_var1.get()
-
-    # Calculate the ultimate bearing capacity
-    # Numpy series dimensions_series, soil_series, geometry_series, load_series, supplementary_series are prepared.
-
+        self.schedule_live_update()
+
+    # Read and validate the inputs on the main thread, before any calculation is started
+    def read_inputs(self):
+        def number(entry, name, minimum=None, maximum=None, strict=False):
+            try:
+                value = float(entry.get())
+            except ValueError:
+                raise ValueError(f"{name}: '{entry.get()}' is not a number")
+            if minimum is not None and (value < minimum or (strict and value == minimum)):
+                raise ValueError(f"{name} must be {'greater than' if strict else 'at least'} {minimum:g}")
+            if maximum is not None and value >= maximum:
+                raise ValueError(f"{name} must be less than {maximum:g}")
+            return value
+
+        self.title_list = [self.project_ent.get(), self.projectID_ent.get(), self.foundationID_ent.get()]
+
+        drainage = self.dropdown_var.get()
+        roughness = self.dropdown_var1.get()
+        if drainage not in self.items:
+            raise ValueError("Choose the drainage condition")
+        if roughness not in self.item1:
+            raise ValueError("Choose the base roughness")
+
+        return dict(width=number(self.item_w_ent, "Width", 0, strict=True),
+                    length=number(self.item_l_ent, "Length", 0, strict=True),
+                    thickness=number(self.item_th_ent, "Thickness", 0),
+                    cohesion=number(self.item_c_ent, "Cohesion", 0),
+                    friction=number(self.item_f_ent, "Friction angle", 0, 90),
+                    gamma=number(self.item_g_ent, "Bulk unit weight", 0, strict=True),
+                    shear_modulus=number(self.item_sh_ent, "Shear modulus", 0, strict=True),
+                    depth=number(self.item_d_ent, "Embedment depth", 0),
+                    slope=number(self.item_slope_ent, "Ground sloping angle"),
+                    tilt=number(self.item_tilt_ent, "Base tilt angle"),
+                    water_depth=number(self.item_water_ent, "Water depth", 0),
+                    vertical_load=number(self.item_N_ent, "Vertical load"),
+                    horizontal_load_W=number(self.item_H_W_ent, "Horizontal load Hx"),
+                    horizontal_load_L=number(self.item_H_L_ent, "Horizontal load Hy"),
+                    moment_W=number(self.item_M_W_ent, "Moment My"),
+                    moment_L=number(self.item_M_L_ent, "Moment Mx"),
+                    surcharge=number(self.item_q_ent, "Surface surcharge"),
+                    drainage=drainage, roughness=roughness)
+
+    # Calculate the ultimate bearing capacity in the background
     def bearing_capacity(self):
         try:
-            self.title_list = [self.project_ent.get(), self.projectID_ent.get(), self.foundationID_ent.get()]
-
-            # Create dimensions series for the footing
-            width = float(self.item_w_ent.get())
-            length = float(self.item_l_ent.get())
-            thickness = float(self.item_th_ent.get())
-
-            values_d = [width, length, thickness]
-            indices_d = ['Width, W (m)', 'Length, L (m)', 'Thickness, df (m)']
-            self.dimensions_series = pd.Series(values_d, index=indices_d)
-
-            # Create soil series for the founding soil
-            cohesion = float(self.item_c_ent.get())
-            friction = float(self.item_f_ent.get())
-            gamma = float(self.item_g_ent.get())
-            shear_modulus = float(self.item_sh_ent.get())
-
-            values_s = [cohesion, friction, gamma, shear_modulus]
-            indices_s = ['Cohesion, c or su (kPa)', 'Friction Angle (deg)', 'Bulk Unit Weight (kN/m3)', 'Shear Modulus (kPa)']
-            self.soil_series = pd.Series(values_s, index=indices_s)
-
-            # Create geometry series
-            depth = float(self.item_d_ent.get())
-            slope = float(self.item_slope_ent.get())
-            tilt = float(self.item_tilt_ent.get())
-            water_depth = float(self.item_water_ent.get())
-
-            values_g = [depth, slope, tilt, water_depth]
-            indices_g = ['Depth, Df (m)', 'Ground Slope (deg)', 'Tilt Angle (deg)', 'Water Depth, Dw (m)']
-            self.geometry_series = pd.Series(values_g, index=indices_g)
-
-            # Create load series
-            vertical_load = float(self.item_N_ent.get())
-            horizontal_load_W, horizontal_load_L = float(self.item_H_W_ent.get()), float(self.item_H_L_ent.get())
-            moment_W, moment_L = float(self.item_M_W_ent.get()), float(self.item_M_L_ent.get())
-            surcharge = float(self.item_q_ent.get())
-            drainage = self.analysis_condition
-            roughness =self.roughness
-
-            values_l = [vertical_load, horizontal_load_W, horizontal_load_L, moment_W, moment_L]
-            indices_l = ['Vertical Load, N (kN)', 'Horizontal load Hx (kN)', 'Horizontal Load Hy (kN)',
-                        'Moment Mx (kNm)', 'Moment My (kNm)']
-            self.load_series = pd.Series(values_l, index=indices_l)
-
-            # Create supplementary series
-            values_supple = [surcharge, drainage, roughness]
-            indices_supple = ['Surface surcharge (kPa)', 'Drainage Condition',
-                         'Base roughness']
-            self.supplementary_series = pd.Series(values_supple, index=indices_supple)
+            inputs = self.read_inputs()
+        except ValueError as e:
+            self.show_message(f"Invalid input: {e}")
+            return
+        self.run_task(calculate, inputs, on_done=lambda outputs: self.show_results(inputs, *outputs))
 
-            # get returns from the bearing functions
+    def show_results(self, inputs, result, report):
+        self.inputs, self.result = inputs, result
+        display1, display2, display3, display4, self.factor_table = report
 
-            display1, display2, display3, display4, self.factor_table = \
-                bs_ultbearing(self.dimensions_series, self.soil_series, self.geometry_series, self.load_series, self.supplementary_series)
-
-            self.message_0 = f"{display1}\n\n{display2}\n{display3}\n{display4}\n\n{self.factor_table}"
-            self.message_1 = f"{display1}<br/><br/>{display2}<br/>{display3}<br/>{display4}"
-
-
-            self.results_box1.delete(0.0, END)
-            self.results_box1.insert(0.0, self.message_0)
-
-        except Exception as e:
-            logging.exception("An error occurred: ")
+        self.message_0 = f"{display1}\n\n{display2}\n{display3}\n{display4}\n\n{self.factor_table}"
+        self.message_1 = f"{display1}<br/><br/>{display2}<br/>{display3}<br/>{display4}"
 
+        self.show_message(self.message_0)
 
+    def show_message(self, message):
+        self.results_box1.delete(0.0, END)
+        self.results_box1.insert(0.0, message)
 
     def create_pdf(self):
-        compile_content_page(self.dimensions_series, self.soil_series, self.geometry_series, self.load_series, self.factor_table, self.title_list, self.message_1)
-        prepare_frontpage(self.title_list)
-        filename = "bearing_report_"+str(self.title_list[2])
-        combine_pdf(filename, "reports/temp_frontpage", "reports/content_page")
-
-
-
-
-
-root = Tk()
-root.title("Ultimate Bearing Capacity of Shallow Foundations according to BS 8004:2015")
-root.geometry("1680x1024")
-app = BearingCalculation(root)
-
-root.mainloop()
+        if self.result is None:
+            self.show_message("Calculate the bearing capacity before printing the pdf report.")
+            return
+
+        # The report is assembled in memory, only the final pdf is written
+        if not os.path.exists("reports"):
+            os.makedirs("reports")
+        output_path = os.path.join("reports", "bearing_report_"+str(self.title_list[2]) + ".pdf")
+        self.dimensions_series, self.soil_series, self.geometry_series, self.load_series, \
+            self.supplementary_series = input_series(self.inputs)
+        self.run_task(write_report, output_path, self.dimensions_series, self.soil_series, self.geometry_series,
+                      self.load_series, self.factor_table, self.title_list, self.message_1,
+                      on_done=lambda _: self.status.config(text=f"PDF file saved as {output_path}"))
+
+    # Start a background job with the buttons and the progress bar set for a running job
+    def run_task(self, func, *args, on_done):
+        def finished(result):
+            self.set_busy(False)
+            self.status.config(text="")
+            on_done(result)
+
+        def failed(error):
+            self.set_busy(False)
+            self.status.config(text="Failed, see error.log")
+
+        def cancelled():
+            self.set_busy(False)
+            self.status.config(text="Cancelled")
+
+        self.set_busy(True)
+        self.task.start(func, *args, on_done=finished, on_error=failed, on_progress=self.show_progress,
+                        on_cancel=cancelled)
+
+    def cancel_task(self):
+        self.task.cancel()
+
+    # Live mode: recalculate after every edit once no key has been pressed for LIVE_DELAY_MS
+    def schedule_live_update(self, event=None):
+        if not self.live_var.get():
+            return
+        if self.live_after is not None:
+            self.after_cancel(self.live_after)
+        self.live_after = self.after(LIVE_DELAY_MS, self.live_update)
+
+    def live_update(self):
+        self.live_after = None
+        if self.task.running:
+            # a Calculate or Print pdf job is running, try again later
+            self.schedule_live_update()
+            return
+        started = time.perf_counter()
+        try:
+            inputs = self.read_inputs()
+        except ValueError as e:
+            self.status.config(text=f"Invalid input: {e}")
+            return
+        try:
+            # the evaluator recomputes only the parts of the equation that depend on the changed inputs
+            if self.live is None:
+                self.live = IncrementalBearing(**inputs)
+                result = self.live.result
+            else:
+                result = self.live.update(**inputs)
+        except (ArithmeticError, ValueError) as e:
+            self.status.config(text=f"Calculation failed: {e}")
+            return
+        self.show_results(inputs, result, bearing_report(result, inputs['cohesion'], inputs['friction'],
+                                                         inputs['width'], inputs['length']))
+        elapsed = (time.perf_counter() - started) * 1000
+        self.status.config(text=f"Live: {len(self.live.recomputed)} of {len(NODES)} steps recomputed")
+        logging.debug("Live update in %.1f ms, recomputed %s", elapsed, ", ".join(self.live.recomputed) or "none")
+        if elapsed > FRAME_BUDGET_MS:
+            logging.info("Live update took %.1f ms, above the %d ms frame budget", elapsed, FRAME_BUDGET_MS)
+
+    def show_progress(self, fraction, text):
+        self.progress['value'] = fraction
+        self.status.config(text=text)
+
+    def set_busy(self, busy):
+        self.calbttn.config(state=DISABLED if busy else NORMAL)
+        self.pdf.config(state=DISABLED if busy else NORMAL)
+        self.cancelbttn.config(state=NORMAL if busy else DISABLED)
+        self.progress['value'] = 0
+
+
+# Form the panda series of the report tables from the inputs returned by read_inputs
+def input_series(inputs):
+    dimensions_series = pd.Series([inputs['width'], inputs['length'], inputs['thickness']],
+                                  index=['Width, W (m)', 'Length, L (m)', 'Thickness, df (m)'])
+    soil_series = pd.Series([inputs['cohesion'], inputs['friction'], inputs['gamma'], inputs['shear_modulus']],
+                            index=['Cohesion, c or su (kPa)', 'Friction Angle (deg)', 'Bulk Unit Weight (kN/m3)',
+                                   'Shear Modulus (kPa)'])
+    geometry_series = pd.Series([inputs['depth'], inputs['slope'], inputs['tilt'], inputs['water_depth']],
+                                index=['Depth, Df (m)', 'Ground Slope (deg)', 'Tilt Angle (deg)',
+                                       'Water Depth, Dw (m)'])
+    load_series = pd.Series([inputs['vertical_load'], inputs['horizontal_load_W'], inputs['horizontal_load_L'],
+                             inputs['moment_W'], inputs['moment_L']],
+                            index=['Vertical Load, N (kN)', 'Horizontal load Hx (kN)', 'Horizontal Load Hy (kN)',
+                                   'Moment Mx (kNm)', 'Moment My (kNm)'])
+    supplementary_series = pd.Series([inputs['surcharge'], inputs['drainage'], inputs['roughness']],
+                                     index=['Surface surcharge (kPa)', 'Drainage Condition', 'Base roughness'])
+    return dimensions_series, soil_series, geometry_series, load_series, supplementary_series
+
+
+# Background jobs, called by BackgroundTask in the worker thread with a progress callback first.
+# They must not touch any widget.
+
+def calculate(progress, inputs):
+    global result_cache
+    from result_cache import ResultCache, bs_ultbearing_core_cached
+
+    progress(0.0, "Calculating")
+    if result_cache is None:
+        result_cache = ResultCache(RESULT_CACHE_FILE)
+    result = bs_ultbearing_core_cached(result_cache, **inputs)
+    progress(0.8, "Formatting results")
+    return result, bearing_report(result, inputs['cohesion'], inputs['friction'], inputs['width'], inputs['length'])
+
+
+def write_report(progress, output_path, *report_inputs):
+    from savepdf import build_report
+
+    build_report(*report_inputs, output=output_path, progress=progress)
+    print(f"PDF file saved as {output_path}")
+
+
+def main():
+    logging.basicConfig(filename='error.log', level=logging.DEBUG)
+
+    root = Tk()
+    root.title("Ultimate Bearing Capacity of Shallow Foundations according to BS 8004:2015")
+    root.geometry("1680x1024")
+    app = BearingCalculation(root)
+
+    root.mainloop()
+    app.task.close()
+    if result_cache is not None:
+        result_cache.close()
+
+
+if __name__ == "__main__":
+    main()
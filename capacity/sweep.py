@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding:
+# PROGRAMMER: WL Ng
+# DATE CREATED: 17 October 2026
+# REVISED DATE:
+# v001 Alpha 02
+
+"""
+PURPOSE:
+Run parameter sweeps of the ultimate bearing capacity over large grids.  The sweep is defined by parameter
+values keyed by the column names of bearing_batch.INPUT_COLUMNS, either as a Cartesian product of the value
+lists or as explicit lists of equal length.  The points are split into chunks which are evaluated with
+bs_ultbearing_batch across a ProcessPoolExecutor and written to disk one file per chunk, so that a sweep which
+is interrupted can be resumed by running it again with the same output folder.
+
+Cartesian products are never expanded in memory: every chunk recovers its own points from the flat index.
+
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from bearing_batch import INPUT_COLUMNS, bs_ultbearing_batch
+
+logger = logging.getLogger(__name__)
+
+MANIFEST = "sweep.json"
+
+
+def _normalise(parameters):
+    # every parameter becomes a plain list so that the sweep definition can be stored as json
+    unknown = set(parameters) - set(INPUT_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+    return {name: np.atleast_1d(np.asarray(values)).tolist() for name, values in parameters.items()}
+
+
+def sweep_size(parameters, product=True):
+    """
+    Return the number of points of a sweep.
+
+    Parameters:
+        parameters - dict of value lists keyed by input column names
+        product - True for the Cartesian product of the lists, False for explicit lists of equal length
+    """
+    lengths = [len(np.atleast_1d(values)) for values in parameters.values()]
+    if product:
+        return int(np.prod(lengths, dtype=np.int64))
+    if len(set(lengths)) > 1:
+        raise ValueError("Explicit sweep lists must all have the same length")
+    return lengths[0] if lengths else 0
+
+
+def sweep_points(parameters, start, stop, product=True):
+    """
+    Return the input columns of the sweep points with flat index start <= i < stop.
+
+    Parameters:
+        parameters - dict of value lists keyed by input column names
+        start, stop - flat point indices
+        product - True for the Cartesian product of the lists, False for explicit lists of equal length
+
+    Returns:
+        columns - dict of np arrays keyed by input column names
+    """
+    names = list(parameters)
+    values = [np.asarray(parameters[name]) for name in names]
+    index = np.arange(start, stop)
+    if product:
+        positions = np.unravel_index(index, [len(value) for value in values])
+    else:
+        positions = [index] * len(values)
+    return {name: value[position] for name, value, position in zip(names, values, positions)}
+
+
+def _chunk_path(output_dir, chunk):
+    return os.path.join(output_dir, f"chunk_{chunk:06d}.npz")
+
+
+def _evaluate_chunk(parameters, fixed, product, start, stop, path, store_factors):
+    # run in a worker process: evaluate one chunk and write it atomically so a partial file is never resumed
+    columns = sweep_points(parameters, start, stop, product)
+    result = bs_ultbearing_batch(**fixed, **columns)
+    arrays = dict(columns, capacity=result.capacity, capacity_d=result.capacity_d,
+                  capacity_ud=result.capacity_ud, eff_width=result.eff_width, eff_length=result.eff_length)
+    if store_factors:
+        arrays['factors'] = result.factors
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(temp_path, path)
+    return stop - start
+
+
+def run_sweep(parameters, output_dir, fixed=None, product=True, chunk_size=100000, workers=None,
+              store_factors=False):
+    """
+    Evaluate a parameter sweep chunk by chunk and stream the results to output_dir.  Chunks that already
+    exist in output_dir are skipped, so calling run_sweep again after an interruption resumes the sweep.
+
+    Parameters:
+        parameters - dict of value lists keyed by input column names, e.g. {'friction': range(20, 41)}
+        output_dir - folder receiving sweep.json and one chunk_XXXXXX.npz file per chunk
+        fixed - dict of scalar inputs shared by all points
+        product - True for the Cartesian product of the lists, False for explicit lists of equal length
+        chunk_size - number of points per chunk
+        workers - number of worker processes, None for os.cpu_count() and 1 to run in this process
+        store_factors - True to store the n x 7 x 6 factor matrices as well
+
+    Returns:
+        summary - dict with the number of points and chunks evaluated / skipped, elapsed seconds and
+                  throughput in points per second
+    """
+    parameters = _normalise(parameters)
+    fixed = _normalise(fixed or {})
+    fixed = {name: value[0] for name, value in fixed.items()}
+    total = sweep_size(parameters, product)
+    chunks = [(start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)]
+
+    # the manifest ties the chunk files to the sweep definition so that a different sweep is not resumed
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {'parameters': parameters, 'fixed': fixed, 'product': product, 'chunk_size': chunk_size,
+                'points': total, 'store_factors': store_factors}
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if json.load(f) != manifest:
+                raise ValueError(f"{output_dir} contains the results of a different sweep")
+    else:
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=1)
+
+    pending = [(chunk, start, stop) for chunk, (start, stop) in enumerate(chunks)
+               if not os.path.exists(_chunk_path(output_dir, chunk))]
+    skipped = len(chunks) - len(pending)
+    if skipped:
+        logger.info("Resuming sweep: %d of %d chunks already done", skipped, len(chunks))
+
+    started = time.perf_counter()
+    evaluated = 0
+    tasks = [(parameters, fixed, product, start, stop, _chunk_path(output_dir, chunk), store_factors)
+             for chunk, start, stop in pending]
+    if workers == 1:
+        for task in tasks:
+            evaluated += _evaluate_chunk(*task)
+            logger.info("Sweep progress: %d / %d points", evaluated, total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_evaluate_chunk, *task) for task in tasks]
+            for future in as_completed(futures):
+                evaluated += future.result()
+                logger.info("Sweep progress: %d / %d points", evaluated, total)
+    elapsed = time.perf_counter() - started
+
+    summary = {'points': total, 'chunks': len(chunks), 'chunks_skipped': skipped, 'points_evaluated': evaluated,
+               'seconds': elapsed, 'points_per_second': evaluated / elapsed if elapsed > 0 else float('inf')}
+    logger.info("Sweep finished: %(points_evaluated)d points in %(seconds).2f s (%(points_per_second).0f points/s)",
+                summary)
+    return summary
+
+
+def load_sweep(output_dir):
+    """
+    Load all chunks of a finished sweep.
+
+    Parameters:
+        output_dir - folder passed to run_sweep
+
+    Returns:
+        results - dict of np arrays (inputs and results) concatenated in point order
+    """
+    with open(os.path.join(output_dir, MANIFEST)) as f:
+        manifest = json.load(f)
+    n_chunks = -(-manifest['points'] // manifest['chunk_size'])
+
+    parts = []
+    for chunk in range(n_chunks):
+        with np.load(_chunk_path(output_dir, chunk)) as data:
+            parts.append({name: data[name] for name in data.files})
+    if not parts:
+        return {}
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}